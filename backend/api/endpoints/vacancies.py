@@ -5,35 +5,575 @@ This module provides database-based endpoints for managing vacancies.
 Note: For job matching use /api/vacancies/search from backend.routers.vacancies
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
-from sqlalchemy.orm import Session
+import json
+from collections import defaultdict
+from functools import partial
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Callable, Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload
 from backend.database.session import get_db
-from backend.database.models import Vacancy
+from backend.database.models import Vacancy, VacancySkill, normalize_skills
 from backend.schemas.database_models import (
+    BulkResult,
+    VacancyBulkUpdate,
     VacancyCreate,
     VacancyUpdate,
-    VacancyInDB
+    VacancyInDB,
+    VacancyPartial,
+    VacancyStats
 )
+from backend.utils.ttl_cache import TTLCache
 
 router = APIRouter()
 
+# Aggregates per top_companies size; cleared on every write in this process and
+# expired after a minute to pick up writes made by other workers
+stats_cache = TTLCache(max_size=16, ttl=60, stale_ttl=0)
 
-@router.get("/vacancies", response_model=List[VacancyInDB])
-def get_all_vacancies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+
+VACANCY_FIELDS = {column.name for column in Vacancy.__table__.columns}
+
+# Largest accepted bulk request, and ids/urls per IN (...) lookup
+MAX_BULK_ITEMS = 10_000
+IN_CHUNK_SIZE = 500
+
+# Rows fetched from the cursor (and written to the response) at a time by exports
+EXPORT_BATCH_SIZE = 1000
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated field projection, always including the id.
+
+    Raises:
+        HTTPException: If an unknown field is requested
+    """
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - VACANCY_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return ["id"] + [field for field in dict.fromkeys(requested) if field != "id"]
+
+
+def filter_vacancies(
+    query,
+    skills: Optional[List[str]] = None,
+    location: Optional[str] = None,
+    company: Optional[str] = None,
+    source: Optional[str] = None
+):
+    """
+    Narrow a vacancy query with indexed filters.
+
+    Every skill must be required by the vacancy; each one is an index lookup
+    in vacancy_skills. Location, company and source are exact matches.
+    """
+    for skill in normalize_skills(skills):
+        query = query.filter(
+            Vacancy.id.in_(select(VacancySkill.vacancy_id).where(VacancySkill.skill == skill))
+        )
+    if location:
+        query = query.filter(Vacancy.location == location)
+    if company:
+        query = query.filter(Vacancy.company == company)
+    if source:
+        query = query.filter(Vacancy.source == source)
+    return query
+
+
+def select_vacancies(
+    columns: Optional[List[str]] = None,
+    skip: int = 0,
+    limit: Optional[int] = 100,
+    after_id: Optional[int] = None,
+    **filters
+):
+    """
+    Build the vacancy list statement shared by the sync and async routers.
+
+    Args:
+        columns: Projected column names, or None for whole Vacancy rows
+        skip: Number of records to skip (ignored when after_id is given)
+        limit: Maximum number of records to return (None for all)
+        after_id: Keyset cursor; only ids greater than it are returned
+        **filters: skills, location, company and source; see filter_vacancies
+
+    Returns:
+        Select statement ordered by id
+    """
+    statement = select(*[getattr(Vacancy, column) for column in columns] if columns else [Vacancy])
+    statement = filter_vacancies(statement.order_by(Vacancy.id), **filters)
+    if after_id is not None:
+        statement = statement.filter(Vacancy.id > after_id)
+    elif skip:
+        statement = statement.offset(skip)
+    return statement.limit(limit) if limit is not None else statement
+
+
+def select_export(fields: Optional[str] = None, **filters):
+    """
+    Build the streamed export statement shared by the sync and async routers.
+
+    Plain column rows are selected instead of ORM objects, and rows are
+    fetched EXPORT_BATCH_SIZE at a time through a server-side cursor where
+    the driver supports one.
+    """
+    columns = parse_fields(fields) or [column.name for column in Vacancy.__table__.columns]
+    return select_vacancies(columns, limit=None, **filters).execution_options(
+        yield_per=EXPORT_BATCH_SIZE,
+        stream_results=True
+    )
+
+
+def ndjson_batch(rows) -> str:
+    """Serialise a batch of rows as NDJSON lines."""
+    return "".join(
+        json.dumps(dict(row._mapping), ensure_ascii=False) + "\n"  # pylint: disable=protected-access
+        for row in rows
+    )
+
+
+def vacancy_page(response: Response, rows, limit: int, columns: Optional[List[str]]):
+    """Set the X-Next-Cursor header for a full page and shape projected rows."""
+    if len(rows) == limit and rows:
+        response.headers["X-Next-Cursor"] = str(rows[-1].id)
+
+    if columns:
+        return [dict(row._mapping) for row in rows]  # pylint: disable=protected-access
+    return rows
+
+
+@router.get(
+    "/vacancies",
+    response_model=List[VacancyPartial],
+    response_model_exclude_unset=True
+)
+def get_all_vacancies(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    fields: Optional[str] = None,
+    skill: Optional[List[str]] = Query(None),
+    location: Optional[str] = None,
+    company: Optional[str] = None,
+    source: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
     """
     Get all vacancies from database.
 
+    Pass the X-Next-Cursor response header back as after_id to fetch the next
+    page; keyset pages cost the same no matter how deep they are.
+
     Args:
-        skip: Number of records to skip
+        response: Response used to set the X-Next-Cursor header
+        skip: Number of records to skip (offset pagination)
         limit: Maximum number of records to return
+        after_id: Return only vacancies with an id greater than this (keyset pagination)
+        fields: Comma-separated list of fields to return, e.g. "title,company"
+        skill: Required skill; repeat to require several
+        location: Exact location
+        company: Exact company name
+        source: Exact source, e.g. "manual"
         db: Database session
 
     Returns:
         List of vacancies
     """
-    vacancies = db.query(Vacancy).offset(skip).limit(limit).all()
-    return vacancies
+    columns = parse_fields(fields)
+    statement = select_vacancies(
+        columns, skip, limit, after_id,
+        skills=skill, location=location, company=company, source=source
+    )
+    rows = db.execute(statement).all() if columns else db.scalars(statement).all()
+    return vacancy_page(response, rows, limit, columns)
+
+
+def compute_vacancy_stats(db: Session, top_companies: int) -> dict:
+    """Compute vacancy aggregates with SQL instead of loading rows."""
+    total, avg_experience, avg_salary = db.query(
+        func.count(Vacancy.id),
+        func.avg(Vacancy.experience_required),
+        func.avg(Vacancy.salary)
+    ).one()
+
+    company_count = func.count(Vacancy.id).label("count")
+    companies = (
+        db.query(Vacancy.company, company_count)
+        .group_by(Vacancy.company)
+        .order_by(company_count.desc(), Vacancy.company)
+        .limit(top_companies)
+        .all()
+    )
+
+    return {
+        "total": total,
+        "avg_experience_required": float(avg_experience or 0),
+        "avg_salary": float(avg_salary) if avg_salary is not None else None,
+        "top_companies": [
+            {"company": company, "count": count} for company, count in companies
+        ],
+    }
+
+
+@router.get("/vacancies/stats", response_model=VacancyStats)
+def get_vacancy_stats(
+    top_companies: int = Query(5, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """
+    Get aggregate statistics over all vacancies.
+
+    Args:
+        top_companies: Number of companies with most vacancies to include
+        db: Database session
+
+    Returns:
+        Total count, average experience and salary, and top companies
+    """
+    return stats_cache.get_or_load(
+        top_companies,
+        lambda: compute_vacancy_stats(db, top_companies)
+    )
+
+
+@router.get("/vacancies/export")
+def export_vacancies(
+    fields: Optional[str] = None,
+    skill: Optional[List[str]] = Query(None),
+    location: Optional[str] = None,
+    company: Optional[str] = None,
+    source: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Stream vacancies as NDJSON, one object per line, ordered by id.
+
+    Rows are read from the cursor and written in batches, so exporting the
+    whole table uses constant memory.
+
+    Args:
+        fields: Comma-separated list of fields to export (default: all)
+        skill: Required skill; repeat to require several
+        location: Exact location
+        company: Exact company name
+        source: Exact source
+        db: Database session
+
+    Returns:
+        StreamingResponse with application/x-ndjson content
+    """
+    result = db.execute(select_export(
+        fields, skills=skill, location=location, company=company, source=source
+    ))
+    return StreamingResponse(
+        (ndjson_batch(partition) for partition in result.partitions()),
+        media_type="application/x-ndjson"
+    )
+
+
+async def read_bulk_items(request: Request) -> list:
+    """
+    Read a bulk request body: a JSON array, or NDJSON (one item per line).
+
+    NDJSON is selected by an application/x-ndjson (or jsonl) content type.
+
+    Raises:
+        HTTPException: If the body is not valid JSON/NDJSON or has too many items
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    try:
+        if "ndjson" in content_type or "jsonl" in content_type:
+            items = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            items = json.loads(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}") from e
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array or NDJSON")
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BULK_ITEMS} items per bulk request"
+        )
+    return items
+
+
+def validate_item(schema, item):
+    """Validate one bulk item; returns (model, None) or (None, error message)."""
+    try:
+        return schema.model_validate(item), None
+    except ValidationError as e:
+        return None, "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+            for error in e.errors()
+        )
+
+
+def apply_in_savepoint(db: Session, index: int, status: str, action: Callable[[], Vacancy]) -> dict:
+    """Run one item's change in a savepoint so a failure rolls back only that item."""
+    try:
+        with db.begin_nested():
+            vacancy = action()
+    except SQLAlchemyError as e:
+        return {"index": index, "status": "error", "detail": str(getattr(e, "orig", e))}
+    return {"index": index, "status": status, "id": vacancy.id}
+
+
+def apply_batch(db: Session, changes: List[Tuple[int, str, Callable[[], Vacancy]]]) -> List[dict]:
+    """
+    Apply all items' changes with a single flush.
+
+    When that flush fails, its savepoint is rolled back and the items are
+    replayed one savepoint each, so only the failing items are reported.
+
+    Args:
+        db: Database session
+        changes: (item index, status on success, action) per item
+
+    Returns:
+        Per-item results
+    """
+    try:
+        with db.begin_nested():
+            vacancies = [action() for _, _, action in changes]
+    except SQLAlchemyError:
+        return [apply_in_savepoint(db, index, status, action) for index, status, action in changes]
+    return [
+        {"index": index, "status": status, "id": vacancy.id}
+        for (index, status, _), vacancy in zip(changes, vacancies)
+    ]
+
+
+def finish_bulk(db: Session, results: List[dict], changes: List[Tuple[int, str, Callable]]) -> dict:
+    """Apply the valid items, commit the bulk transaction and summarise the per-item results."""
+    results = sorted(results + apply_batch(db, changes), key=lambda result: result["index"])
+    db.commit()
+    counts = defaultdict(int)
+    for result in results:
+        counts[result["status"]] += 1
+    if len(results) > counts["error"] + counts["not_found"]:
+        stats_cache.clear()
+    return {
+        "created": counts["created"],
+        "updated": counts["updated"],
+        "deleted": counts["deleted"],
+        "failed": counts["error"] + counts["not_found"],
+        "results": results,
+    }
+
+
+def load_vacancies_by_id(db: Session, ids) -> Dict[int, Vacancy]:
+    """Load vacancies and their skill rows with chunked IN lookups."""
+    ids = sorted(set(ids))
+    found = {}
+    for start in range(0, len(ids), IN_CHUNK_SIZE):
+        statement = (
+            select(Vacancy)
+            .options(selectinload(Vacancy.skill_links))
+            .where(Vacancy.id.in_(ids[start:start + IN_CHUNK_SIZE]))
+        )
+        found.update((vacancy.id, vacancy) for vacancy in db.scalars(statement))
+    return found
+
+
+def load_vacancies_by_posting(db: Session, keys) -> Dict[Tuple[str, str], Vacancy]:
+    """Load vacancies by (source, url) with chunked IN lookups per source."""
+    urls_by_source = defaultdict(set)
+    for source, url in keys:
+        urls_by_source[source].add(url)
+
+    found = {}
+    for source, urls in urls_by_source.items():
+        urls = sorted(urls)
+        for start in range(0, len(urls), IN_CHUNK_SIZE):
+            statement = (
+                select(Vacancy)
+                .options(selectinload(Vacancy.skill_links))
+                .where(Vacancy.source == source, Vacancy.url.in_(urls[start:start + IN_CHUNK_SIZE]))
+                .order_by(Vacancy.id)
+            )
+            for vacancy in db.scalars(statement):
+                found.setdefault((vacancy.source, vacancy.url), vacancy)
+    return found
+
+
+def add_row(db: Session, vacancy: Vacancy) -> Vacancy:
+    """Add a vacancy to the session and return it."""
+    db.add(vacancy)
+    return vacancy
+
+
+def delete_row(db: Session, vacancy: Vacancy) -> Vacancy:
+    """Mark a vacancy for deletion and return it."""
+    db.delete(vacancy)
+    return vacancy
+
+
+def update_fields(vacancy: Vacancy, data: dict) -> Vacancy:
+    """Copy changed fields onto a vacancy and return it."""
+    for key, value in data.items():
+        # Unchanged required_skills would otherwise rebuild the skill rows
+        if getattr(vacancy, key) != value:
+            setattr(vacancy, key, value)
+    return vacancy
+
+
+def update_created_row(db: Session, vacancy: Vacancy, data: dict) -> Vacancy:
+    """Update a vacancy created earlier in the same bulk request."""
+    if vacancy not in db:
+        raise InvalidRequestError("the item creating this posting failed")
+    return update_fields(vacancy, data)
+
+
+def bulk_create_vacancies(db: Session, items: list) -> dict:
+    """Create vacancies in one transaction."""
+    results, changes = [], []
+    for index, item in enumerate(items):
+        vacancy, error = validate_item(VacancyCreate, item)
+        if error:
+            results.append({"index": index, "status": "error", "detail": error})
+            continue
+        db_vacancy = Vacancy(**vacancy.model_dump())
+        changes.append((index, "created", partial(add_row, db, db_vacancy)))
+    return finish_bulk(db, results, changes)
+
+
+def bulk_update_vacancies(db: Session, items: list) -> dict:
+    """Update vacancies by id in one transaction; only provided fields change."""
+    validated = [validate_item(VacancyBulkUpdate, item) for item in items]
+    existing = load_vacancies_by_id(db, [vacancy.id for vacancy, _ in validated if vacancy])
+
+    results, changes = [], []
+    for index, (vacancy, error) in enumerate(validated):
+        if error:
+            results.append({"index": index, "status": "error", "detail": error})
+        elif vacancy.id not in existing:
+            results.append({"index": index, "status": "not_found", "id": vacancy.id})
+        else:
+            data = vacancy.model_dump(exclude_unset=True, exclude={"id"})
+            db_vacancy = existing[vacancy.id]
+            changes.append((index, "updated", partial(update_fields, db_vacancy, data)))
+    return finish_bulk(db, results, changes)
+
+
+def bulk_delete_vacancies(db: Session, items: list) -> dict:
+    """Delete vacancies by id (plain ids or {"id": ...} objects) in one transaction."""
+    ids = [item.get("id") if isinstance(item, dict) else item for item in items]
+    existing = load_vacancies_by_id(db, [i for i in ids if isinstance(i, int)])
+
+    results, changes = [], []
+    for index, vacancy_id in enumerate(ids):
+        if not isinstance(vacancy_id, int) or isinstance(vacancy_id, bool):
+            results.append({"index": index, "status": "error", "detail": "id must be an integer"})
+        elif vacancy_id not in existing:
+            results.append({"index": index, "status": "not_found", "id": vacancy_id})
+        else:
+            db_vacancy = existing.pop(vacancy_id)
+            changes.append((index, "deleted", partial(delete_row, db, db_vacancy)))
+    return finish_bulk(db, results, changes)
+
+
+def bulk_upsert_vacancies(db: Session, items: list) -> dict:
+    """
+    Insert or update vacancies keyed on (source, url) in one transaction.
+
+    Existing postings are found with one IN lookup per source and chunk
+    instead of a query per item. Repeated keys in the batch update the row
+    created by their first occurrence.
+    """
+    validated = [validate_item(VacancyCreate, item) for item in items]
+    existing = load_vacancies_by_posting(
+        db, [(vacancy.source, vacancy.url) for vacancy, _ in validated if vacancy and vacancy.url]
+    )
+    created = {}
+
+    results, changes = [], []
+    for index, (vacancy, error) in enumerate(validated):
+        if not error and not vacancy.url:
+            error = "url: required for upsert"
+        if error:
+            results.append({"index": index, "status": "error", "detail": error})
+            continue
+
+        key = (vacancy.source, vacancy.url)
+        data = vacancy.model_dump(exclude_unset=True)
+        if key in existing:
+            changes.append((index, "updated", partial(update_fields, existing[key], data)))
+        elif key in created:
+            changes.append((index, "updated", partial(update_created_row, db, created[key], data)))
+        else:
+            created[key] = Vacancy(**vacancy.model_dump())
+            changes.append((index, "created", partial(add_row, db, created[key])))
+    return finish_bulk(db, results, changes)
+
+
+@router.post("/vacancies/bulk", response_model=BulkResult)
+def bulk_create(items: list = Depends(read_bulk_items), db: Session = Depends(get_db)):
+    """
+    Create many vacancies in one transaction.
+
+    Args:
+        items: Vacancies as a JSON array or NDJSON body
+        db: Database session
+
+    Returns:
+        Counts and per-item results; invalid items are reported, not fatal
+    """
+    return bulk_create_vacancies(db, items)
+
+
+@router.put("/vacancies/bulk", response_model=BulkResult)
+def bulk_update(items: list = Depends(read_bulk_items), db: Session = Depends(get_db)):
+    """
+    Update many vacancies in one transaction.
+
+    Args:
+        items: Partial vacancies, each with its id, as a JSON array or NDJSON body
+        db: Database session
+
+    Returns:
+        Counts and per-item results
+    """
+    return bulk_update_vacancies(db, items)
+
+
+@router.post("/vacancies/bulk-delete", response_model=BulkResult)
+def bulk_delete(items: list = Depends(read_bulk_items), db: Session = Depends(get_db)):
+    """
+    Delete many vacancies in one transaction.
+
+    Args:
+        items: Vacancy ids as a JSON array or NDJSON body
+        db: Database session
+
+    Returns:
+        Counts and per-item results
+    """
+    return bulk_delete_vacancies(db, items)
+
+
+@router.post("/vacancies/bulk-upsert", response_model=BulkResult)
+def bulk_upsert(items: list = Depends(read_bulk_items), db: Session = Depends(get_db)):
+    """
+    Insert or update many vacancies keyed on (source, url) in one transaction.
+
+    Args:
+        items: Vacancies with a url, as a JSON array or NDJSON body
+        db: Database session
+
+    Returns:
+        Counts and per-item results
+    """
+    return bulk_upsert_vacancies(db, items)
 
 
 @router.get("/vacancies/{vacancy_id}", response_model=VacancyInDB)
@@ -72,6 +612,7 @@ def create_vacancy(vacancy: VacancyCreate, db: Session = Depends(get_db)):
     db_vacancy = Vacancy(**vacancy.model_dump())
     db.add(db_vacancy)
     db.commit()
+    stats_cache.clear()
     db.refresh(db_vacancy)
     return db_vacancy
 
@@ -106,6 +647,7 @@ def update_vacancy(
         setattr(db_vacancy, key, value)
 
     db.commit()
+    stats_cache.clear()
     db.refresh(db_vacancy)
     return db_vacancy
 
@@ -128,4 +670,5 @@ def delete_vacancy(vacancy_id: int, db: Session = Depends(get_db)):
 
     db.delete(db_vacancy)
     db.commit()
+    stats_cache.clear()
     return None
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""
+Async API endpoints for vacancy CRUD operations.
+
+Same routes and schemas as backend.api.endpoints.vacancies, served with
+SQLAlchemy's asyncio extension so slow queries do not hold threadpool slots.
+Mounted instead of the sync router when settings.async_db is enabled.
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from backend.api.endpoints.vacancies import (
+    bulk_create_vacancies,
+    bulk_delete_vacancies,
+    bulk_update_vacancies,
+    bulk_upsert_vacancies,
+    compute_vacancy_stats,
+    ndjson_batch,
+    parse_fields,
+    read_bulk_items,
+    select_export,
+    select_vacancies,
+    stats_cache,
+    vacancy_page,
+)
+from backend.database.async_session import get_async_db
+from backend.database.models import Vacancy
+from backend.schemas.database_models import (
+    BulkResult,
+    VacancyCreate,
+    VacancyUpdate,
+    VacancyInDB,
+    VacancyPartial,
+    VacancyStats
+)
+
+router = APIRouter()
+
+
+async def load_vacancy(db: AsyncSession, vacancy_id: int) -> Vacancy:
+    """
+    Load a vacancy with its skill rows, which updates and deletes rewrite.
+
+    Raises:
+        HTTPException: If vacancy not found
+    """
+    vacancy = await db.scalar(
+        select(Vacancy)
+        .options(selectinload(Vacancy.skill_links))
+        .where(Vacancy.id == vacancy_id)
+    )
+    if vacancy is None:
+        raise HTTPException(status_code=404, detail="Vacancy not found")
+    return vacancy
+
+
+@router.get(
+    "/vacancies",
+    response_model=List[VacancyPartial],
+    response_model_exclude_unset=True
+)
+async def get_all_vacancies(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    fields: Optional[str] = None,
+    skill: Optional[List[str]] = Query(None),
+    location: Optional[str] = None,
+    company: Optional[str] = None,
+    source: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get all vacancies from database.
+
+    See backend.api.endpoints.vacancies.get_all_vacancies for the parameters.
+    """
+    columns = parse_fields(fields)
+    statement = select_vacancies(
+        columns, skip, limit, after_id,
+        skills=skill, location=location, company=company, source=source
+    )
+    result = await db.execute(statement)
+    rows = result.all() if columns else result.scalars().all()
+    return vacancy_page(response, rows, limit, columns)
+
+
+@router.get("/vacancies/stats", response_model=VacancyStats)
+async def get_vacancy_stats(
+    top_companies: int = Query(5, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get aggregate statistics over all vacancies.
+
+    Shares the sync router's cache; only a miss reaches the database.
+    """
+    return await db.run_sync(
+        lambda session: stats_cache.get_or_load(
+            top_companies,
+            lambda: compute_vacancy_stats(session, top_companies)
+        )
+    )
+
+
+@router.get("/vacancies/export")
+async def export_vacancies(
+    fields: Optional[str] = None,
+    skill: Optional[List[str]] = Query(None),
+    location: Optional[str] = None,
+    company: Optional[str] = None,
+    source: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Stream vacancies as NDJSON with constant memory."""
+    result = await db.stream(select_export(
+        fields, skills=skill, location=location, company=company, source=source
+    ))
+
+    async def lines():
+        async for partition in result.partitions():
+            yield ndjson_batch(partition)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/vacancies/bulk", response_model=BulkResult)
+async def bulk_create(
+    items: list = Depends(read_bulk_items),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create many vacancies in one transaction."""
+    return await db.run_sync(bulk_create_vacancies, items)
+
+
+@router.put("/vacancies/bulk", response_model=BulkResult)
+async def bulk_update(
+    items: list = Depends(read_bulk_items),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update many vacancies in one transaction."""
+    return await db.run_sync(bulk_update_vacancies, items)
+
+
+@router.post("/vacancies/bulk-delete", response_model=BulkResult)
+async def bulk_delete(
+    items: list = Depends(read_bulk_items),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Delete many vacancies in one transaction."""
+    return await db.run_sync(bulk_delete_vacancies, items)
+
+
+@router.post("/vacancies/bulk-upsert", response_model=BulkResult)
+async def bulk_upsert(
+    items: list = Depends(read_bulk_items),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Insert or update many vacancies keyed on (source, url) in one transaction."""
+    return await db.run_sync(bulk_upsert_vacancies, items)
+
+
+@router.get("/vacancies/{vacancy_id}", response_model=VacancyInDB)
+async def get_vacancy(vacancy_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get a specific vacancy by ID.
+
+    Raises:
+        HTTPException: If vacancy not found
+    """
+    vacancy = await db.get(Vacancy, vacancy_id)
+    if vacancy is None:
+        raise HTTPException(status_code=404, detail="Vacancy not found")
+    return vacancy
+
+
+@router.post("/vacancies", response_model=VacancyInDB, status_code=201)
+async def create_vacancy(vacancy: VacancyCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Create a new vacancy.
+
+    Returns:
+        Created vacancy
+    """
+    db_vacancy = Vacancy(**vacancy.model_dump())
+    db.add(db_vacancy)
+    await db.commit()
+    stats_cache.clear()
+    await db.refresh(db_vacancy)
+    return db_vacancy
+
+
+@router.put("/vacancies/{vacancy_id}", response_model=VacancyInDB)
+async def update_vacancy(
+    vacancy_id: int,
+    vacancy: VacancyUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Update an existing vacancy.
+
+    Raises:
+        HTTPException: If vacancy not found
+    """
+    db_vacancy = await load_vacancy(db, vacancy_id)
+
+    # Update only provided fields
+    for key, value in vacancy.model_dump(exclude_unset=True).items():
+        setattr(db_vacancy, key, value)
+
+    await db.commit()
+    stats_cache.clear()
+    await db.refresh(db_vacancy)
+    return db_vacancy
+
+
+@router.delete("/vacancies/{vacancy_id}", status_code=204)
+async def delete_vacancy(vacancy_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Delete a vacancy.
+
+    Raises:
+        HTTPException: If vacancy not found
+    """
+    db_vacancy = await load_vacancy(db, vacancy_id)
+    await db.delete(db_vacancy)
+    await db.commit()
+    stats_cache.clear()
+    return None
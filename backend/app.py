@@ -5,6 +5,7 @@ This file initializes and runs the FastAPI application.
 """
 
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -16,12 +17,35 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from backend.routers import vacancies  # pylint: disable=wrong-import-position
-from backend.api.endpoints import vacancies as vacancy_crud  # pylint: disable=wrong-import-position
+from backend.core.config import settings  # pylint: disable=wrong-import-position
+from backend.database.session import init_db  # pylint: disable=wrong-import-position
+from backend.services.vacancies import hybrid_search, vacancy_refresher  # pylint: disable=wrong-import-position
+
+if settings.async_db:
+    from backend.api.endpoints import vacancies_async as vacancy_crud  # pylint: disable=wrong-import-position
+else:
+    from backend.api.endpoints import vacancies as vacancy_crud  # pylint: disable=wrong-import-position
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Initialise the database and run the vacancy refresher and RAG sync while the app is up."""
+    init_db()
+    vacancy_refresher.start()
+    hybrid_search.start()
+    yield
+    hybrid_search.stop(timeout=5)
+    vacancy_refresher.stop(timeout=5)
+    if settings.async_db:
+        from backend.database.async_session import async_engine  # pylint: disable=import-outside-toplevel
+        await async_engine.dispose()
+
 
 app = FastAPI(
     title="SkillMatch AI - RAG Assistant",
     description="Job matching system with ML and RAG capabilities",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -41,7 +65,7 @@ app.include_router(
     tags=["Job Matching"]
 )
 
-# CRUD operations for database (manual vacancy management)
+# CRUD operations for database (manual vacancy management); async when ASYNC_DB is set
 app.include_router(
     vacancy_crud.router,
     prefix="/api/db",
@@ -0,0 +1,68 @@
+"""
+Async database session management module.
+
+This module provides an asyncio engine and sessions for the same database as
+backend.database.session, using an async driver (aiosqlite, asyncpg).
+"""
+
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from backend.core.config import settings
+from backend.database.session import engine_options, sqlite_begin, sqlite_pragmas
+
+# Async driver used for each sync backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def async_database_url(database_url: Optional[str] = None) -> URL:
+    """
+    Swap the driver of a database URL for its async counterpart.
+
+    URLs that already name an async driver, or backends without a known
+    async driver, are returned unchanged.
+    """
+    url = make_url(database_url or settings.database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None or url.get_driver_name() == driver:
+        return url
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}")
+
+
+def create_async_db_engine(database_url: Optional[str] = None) -> AsyncEngine:
+    """
+    Create an async engine with the same tuning as the sync engine.
+
+    Args:
+        database_url: SQLAlchemy URL (defaults to settings.database_url)
+
+    Returns:
+        AsyncEngine: Configured engine
+    """
+    url = async_database_url(database_url)
+    options = engine_options(url)
+    # aiosqlite connections run in their own thread
+    options.get("connect_args", {}).pop("check_same_thread", None)
+    async_engine = create_async_engine(url, **options)
+    if url.get_backend_name() == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", sqlite_pragmas)
+        event.listen(async_engine.sync_engine, "begin", sqlite_begin)
+    return async_engine
+
+
+async_engine = create_async_db_engine()
+
+# Objects stay usable after commit; async code cannot lazily reload expired attributes
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+async def get_async_db():
+    """Get async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -4,21 +4,33 @@ Database models for the RAG Assistant application.
 This module defines SQLAlchemy ORM models for vacancies, resumes, and policies.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Float, JSON
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text, Float, JSON, insert, select
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship, validates
 
 Base = declarative_base()
 
 
+def normalize_skills(skills):
+    """Lowercase, strip and deduplicate skill names, keeping their order."""
+    return list(dict.fromkeys(
+        str(skill).strip().lower() for skill in skills or [] if str(skill).strip()
+    ))
+
+
 class Vacancy(Base):
     """Vacancy model for storing job postings."""
 
     __tablename__ = 'vacancies'
+    __table_args__ = (
+        # Bulk upserts look postings up by (source, url); also serves source filters
+        Index("ix_vacancies_source_url", "source", "url"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
-    company = Column(String)
-    location = Column(String, default="Remote")
+    company = Column(String, index=True)
+    location = Column(String, default="Remote", index=True)
     url = Column(String, nullable=True)
     source = Column(String, default="manual")
     description = Column(Text)
@@ -26,6 +38,69 @@ class Vacancy(Base):
     experience_required = Column(Integer, default=0)
     salary = Column(Float, nullable=True)
 
+    skill_links = relationship(
+        "VacancySkill",
+        cascade="all, delete-orphan"
+    )
+
+    @validates("required_skills")
+    def _sync_skill_links(self, _key, skills):
+        """Keep the vacancy_skills rows in step with required_skills."""
+        self.skill_links = [VacancySkill(skill=skill) for skill in normalize_skills(skills)]
+        return skills
+
+
+class VacancySkill(Base):
+    """Normalised (vacancy, skill) pairs; an inverted index over required_skills."""
+
+    __tablename__ = 'vacancy_skills'
+    __table_args__ = (
+        # Covers "vacancies requiring skill X" without touching the vacancies table
+        Index("ix_vacancy_skills_skill_vacancy_id", "skill", "vacancy_id"),
+    )
+
+    vacancy_id = Column(
+        Integer,
+        ForeignKey("vacancies.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    skill = Column(String, primary_key=True)
+
+
+def index_vacancy_skills(connection, batch_size=10_000):
+    """
+    Fill vacancy_skills for vacancies written without the ORM (bulk loads, old databases).
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+        batch_size: Number of vacancies read per query
+
+    Returns:
+        int: Number of skill rows inserted
+    """
+    indexed = select(VacancySkill.vacancy_id).where(VacancySkill.vacancy_id == Vacancy.id)
+    inserted = 0
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(Vacancy.id, Vacancy.required_skills)
+            .where(Vacancy.id > last_id, ~indexed.exists())
+            .order_by(Vacancy.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return inserted
+        links = [
+            {"vacancy_id": vacancy_id, "skill": skill}
+            for vacancy_id, skills in rows
+            for skill in normalize_skills(skills)
+        ]
+        if links:
+            connection.execute(insert(VacancySkill), links)
+        inserted += len(links)
+        last_id = rows[-1][0]
+
+
 class Resume(Base):
     """Resume model for storing candidate information."""
 
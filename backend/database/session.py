@@ -5,31 +5,113 @@ This module provides database connection and session management.
 """
 
 from pathlib import Path
-from sqlalchemy import create_engine
+from typing import Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.orm import sessionmaker
-from backend.database.models import Base
 
-# Use SQLite database in data directory
-DB_DIR = Path(__file__).parent.parent.parent / "data"
-DB_DIR.mkdir(parents=True, exist_ok=True)
-DATABASE_URL = f"sqlite:///{DB_DIR / 'skillmatch.db'}"
+from backend.core.config import settings
+from backend.database.models import Base, index_vacancy_skills
+
+
+def sqlite_pragmas(dbapi_connection, _connection_record):
+    """Tune every new SQLite connection for concurrent readers and one writer."""
+    # Let SQLAlchemy emit BEGIN itself (see sqlite_begin); the driver's implicit
+    # transactions break SAVEPOINT
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers proceed while a write is in progress
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def sqlite_begin(connection):
+    """Start SQLite transactions explicitly so savepoints nest inside them."""
+    connection.exec_driver_sql("BEGIN")
+
+
+def engine_options(url: URL) -> dict:
+    """
+    Return create_engine keyword arguments for the database behind the URL.
+
+    SQLite connections get a busy timeout (pragmas are applied on connect);
+    server databases get a sized QueuePool with pre-ping so dropped
+    connections are replaced instead of failing a request.
+    """
+    if url.get_backend_name() == "sqlite":
+        if url.database and url.database != ":memory:":
+            Path(url.database).parent.mkdir(parents=True, exist_ok=True)
+        return {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": settings.sqlite_busy_timeout_ms / 1000,
+            }
+        }
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
 
-# Create engine with check_same_thread=False for SQLite
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+def create_db_engine(database_url: Optional[str] = None) -> Engine:
+    """
+    Create an engine tuned for the database behind the URL.
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
+    Args:
+        database_url: SQLAlchemy URL (defaults to settings.database_url)
+
+    Returns:
+        Engine: Configured engine
+    """
+    url = make_url(database_url or settings.database_url)
+    engine = create_engine(url, **engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", sqlite_pragmas)
+        event.listen(engine, "begin", sqlite_begin)
+    return engine
+
+
+engine = create_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def init_db(bind: Optional[Engine] = None) -> None:
+    """
+    Create missing tables and indexes and backfill the skill index.
+
+    Called once at application startup rather than on import.
+
+    Args:
+        bind: Engine to initialise (defaults to the application engine)
+    """
+    bind = bind if bind is not None else engine
+    Base.metadata.create_all(bind=bind)
+
+    # create_all skips indexes added to tables that already exist
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+    # Backfill the skill index for vacancies stored before it existed
+    with bind.begin() as connection:
+        index_vacancy_skills(connection)
+
+
 def get_db():
     """Get database session."""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
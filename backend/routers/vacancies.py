@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 # Add project root to sys.path
 project_root = Path(__file__).parent.parent.parent
@@ -15,7 +16,12 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from backend.schemas.vacancies import VacancyRequest, VacancyResponse  # pylint: disable=wrong-import-position
-from backend.services.vacancies import get_vacancies  # pylint: disable=wrong-import-position
+from backend.services.vacancies import (  # pylint: disable=wrong-import-position
+    get_vacancies,
+    iter_vacancies,
+    search_cache,
+    vacancy_refresher,
+)
 
 router = APIRouter()
 
@@ -37,3 +43,52 @@ def search_vacancies(request: VacancyRequest):
         return get_vacancies(request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/search/stream")
+def search_vacancies_stream(request: VacancyRequest):
+    """
+    Search for vacancies and stream the ranked results as NDJSON.
+
+    Results are written one per line while they are formatted, so large
+    limits do not build the whole response in memory.
+
+    Args:
+        request (VacancyRequest): The request containing the job title to search for.
+
+    Returns:
+        StreamingResponse: application/x-ndjson, one VacancyResponse per line.
+
+    Raises:
+        HTTPException: If an error occurs during the search.
+    """
+    try:
+        results = iter_vacancies(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return StreamingResponse(
+        (VacancyResponse(**result).model_dump_json() + "\n" for result in results),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/cache/stats")
+def get_search_cache_stats():
+    """
+    Get hit/miss statistics of the search result cache.
+
+    Returns:
+        dict: Cache size and counters.
+    """
+    return search_cache.stats()
+
+
+@router.get("/refresh/status")
+def get_refresh_status():
+    """
+    Get the state of the background vacancy refresher.
+
+    Returns:
+        dict: Snapshot age and size, refresh timings and per-source fetch stats.
+    """
+    return vacancy_refresher.status()
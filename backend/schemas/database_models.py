@@ -39,6 +39,12 @@ class VacancyUpdate(BaseModel):
     salary: Optional[float] = None
 
 
+class VacancyBulkUpdate(VacancyUpdate):
+    """Schema for one item of a bulk update."""
+
+    id: int
+
+
 class VacancyInDB(VacancyBase):
     """Schema for vacancy from database."""
 
@@ -50,6 +56,61 @@ class VacancyInDB(VacancyBase):
         from_attributes = True
 
 
+class VacancyPartial(BaseModel):
+    """Schema for a vacancy with only the requested fields populated."""
+
+    id: Optional[int] = None
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    url: Optional[str] = None
+    source: Optional[str] = None
+    description: Optional[str] = None
+    required_skills: Optional[List[str]] = None
+    experience_required: Optional[int] = None
+    salary: Optional[float] = None
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class CompanyCount(BaseModel):
+    """Number of vacancies posted by a company."""
+
+    company: Optional[str] = None
+    count: int
+
+
+class VacancyStats(BaseModel):
+    """Aggregate statistics over all vacancies."""
+
+    total: int
+    avg_experience_required: float
+    avg_salary: Optional[float] = None
+    top_companies: List[CompanyCount] = []
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one item of a bulk request."""
+
+    index: int
+    status: str
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    """Per-status counts and per-item outcomes of a bulk request."""
+
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    failed: int = 0
+    results: List[BulkItemResult] = []
+
+
 class ResumeBase(BaseModel):
     """Base schema for resume."""
 
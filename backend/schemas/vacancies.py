@@ -4,7 +4,9 @@ Schemas for vacancy-related data.
 This module defines the Pydantic models for validating vacancy-related requests and responses.
 """
 
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
 
 class VacancyRequest(BaseModel):
     """
@@ -12,8 +14,18 @@ class VacancyRequest(BaseModel):
 
     Attributes:
         job_title (str): The job title to search for.
+        skills (list[str]): Skills every returned vacancy must require.
+        location (str): Case-insensitive substring of the vacancy location.
+        company (str): Case-insensitive substring of the company name.
+        source (str): Exact source name (e.g. 'arbeitnow').
+        limit (int): Maximum number of ranked results to return.
     """
     job_title: str
+    skills: List[str] = []
+    location: Optional[str] = None
+    company: Optional[str] = None
+    source: Optional[str] = None
+    limit: int = Field(20, ge=1, le=10_000)
 
 class VacancyResponse(BaseModel):
     """
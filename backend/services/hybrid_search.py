@@ -0,0 +1,417 @@
+"""
+Hybrid vacancy retrieval across the database, scraped postings and the RAG index.
+
+Every source contributes a bounded number of candidates (the cheap first
+stage). The merged candidates are deduplicated by posting URL and re-ranked
+with reciprocal rank fusion of TF-IDF text similarity and the skill match
+score, so the cost of the second stage does not grow with the sources.
+
+The RAG index over the database is kept up to date by a background thread,
+never by a search request.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from scipy.stats import rankdata
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sqlalchemy import event, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.database.models import Vacancy, VacancySkill, normalize_skills
+from backend.services.match_scoring import SkillMatrix, calculate_match_scores, top_k_indices
+from backend.services.rag_service import RAGService
+from backend.services.vacancy_refresher import vacancy_matches
+from backend.services.vacancy_store import normalize_query
+
+# Vacancy columns read from the database for search candidates
+DB_COLUMNS = (
+    "id", "title", "company", "location", "url", "source",
+    "description", "required_skills", "experience_required",
+)
+
+# Changed vacancy ids read back per query when syncing the RAG index
+SYNC_CHUNK_SIZE = 500
+
+
+def dedup_key(vacancy: Dict) -> str:
+    """Return the identity used to merge the same posting from different sources."""
+    url = (vacancy.get("url") or "").strip().rstrip("/").lower()
+    if url:
+        return url
+    return f"{vacancy.get('title', '')}|{vacancy.get('company', '')}".lower()
+
+
+def reciprocal_rank_fusion(score_lists: Sequence[np.ndarray], k: float = 60.0) -> np.ndarray:
+    """
+    Fuse several score arrays over the same items by reciprocal rank.
+
+    Each list adds 1 / (k + rank) per item, with rank 1 for its best score;
+    equal scores share a rank.
+
+    Args:
+        score_lists: Score arrays of equal length, higher is better
+        k: Damping constant; larger values flatten the head of each ranking
+
+    Returns:
+        np.ndarray: Fused score per item
+    """
+    fused = np.zeros(len(score_lists[0]), dtype=np.float64)
+    for scores in score_lists:
+        fused += 1.0 / (k + rankdata(-np.asarray(scores), method="min"))
+    return fused
+
+
+def text_similarity(query_text: str, vacancies: Sequence[Dict]) -> np.ndarray:
+    """
+    Cosine similarity of the query to each vacancy's title and description.
+
+    The TF-IDF vocabulary is fitted on the candidates only, which keeps this
+    cheap and weights terms by how well they separate the candidates.
+    """
+    similarities = np.zeros(len(vacancies), dtype=np.float64)
+    if not query_text.strip() or not vacancies:
+        return similarities
+    texts = [f"{v.get('title', '')} {v.get('description') or ''}" for v in vacancies]
+    vectorizer = TfidfVectorizer()
+    try:
+        matrix = vectorizer.fit_transform(texts)
+    except ValueError:
+        # Empty vocabulary: no candidate has any indexable text
+        return similarities
+    return (matrix @ vectorizer.transform([query_text]).T).toarray().ravel()
+
+
+def database_vacancy(row) -> Dict:
+    """Map a database row onto the vacancy dictionaries used by search."""
+    vacancy = dict(row)
+    vacancy["url"] = vacancy.get("url") or ""
+    vacancy["location"] = vacancy.get("location") or "N/A"
+    vacancy["source"] = vacancy.get("source") or "manual"
+    vacancy["required_skills"] = vacancy.get("required_skills") or []
+    vacancy["experience_required"] = vacancy.get("experience_required") or 0
+    return vacancy
+
+
+class HybridSearch:
+    """Searches database, scraped and RAG-indexed vacancies as one ranked list."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        rag_service: Optional[RAGService] = None,
+        candidates_per_source: int = 200,
+        rrf_k: float = 60.0,
+        rag_refresh_interval: float = 300.0,
+        rag_reconcile_interval: float = 3600.0,
+        max_query_chars: int = 5000
+    ):
+        """
+        Initialize the search engine.
+
+        Args:
+            session_factory: Callable returning a database session; None
+                disables the database and RAG sources
+            rag_service: Prebuilt RAG index to query; when omitted, one is
+                built over the database vacancies by sync_rag_index
+            candidates_per_source: First-stage candidates taken from each source;
+                raised to the search limit when that is larger
+            rrf_k: Reciprocal rank fusion constant
+            rag_refresh_interval: Seconds between background syncs of the
+                internal RAG index when no vacancy write wakes it earlier
+            rag_reconcile_interval: Seconds between background syncs that compare
+                the whole vacancies table with the internal RAG index
+            max_query_chars: Resume text characters used in the text query
+        """
+        self.session_factory = session_factory
+        self.rag_service = rag_service
+        self.candidates_per_source = candidates_per_source
+        self.rrf_k = rrf_k
+        self.rag_refresh_interval = rag_refresh_interval
+        self.rag_reconcile_interval = rag_reconcile_interval
+        self.max_query_chars = max_query_chars
+
+        self._owns_rag = rag_service is None
+        # Highest vacancy id in the RAG index; newer rows are picked up by id
+        self._synced_max_id = 0
+        # time.monotonic() of the last sync that read the whole table
+        self._reconciled_at = float("-inf")
+        # Vacancies written through ORM sessions since the last sync
+        self._changed_ids: Set[int] = set()
+        self._changes_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background sync thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _fetch_vacancies(self, statement) -> List[Dict]:
+        with self.session_factory() as db:
+            rows = db.execute(statement).all()
+        return [database_vacancy(row._mapping) for row in rows]  # pylint: disable=protected-access
+
+    def _read_database(self, statement) -> List[Dict]:
+        if self.session_factory is None:
+            return []
+        try:
+            return self._fetch_vacancies(statement)
+        except SQLAlchemyError as e:
+            print(f"Error reading database vacancies: {e}")
+            return []
+
+    def database_candidates(
+        self,
+        job_title: Optional[str],
+        limit: int,
+        skills: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Return up to limit newest database vacancies matching the search.
+
+        Filters run in SQL before the limit, with the semantics of
+        vacancy_matches: every skill is a lookup in vacancy_skills, location
+        and company are case-insensitive substrings, source is exact.
+        """
+        statement = (
+            select(*[getattr(Vacancy, column) for column in DB_COLUMNS])
+            .order_by(Vacancy.id.desc())
+            .limit(limit)
+        )
+        query = normalize_query(job_title)
+        if query:
+            statement = statement.where(Vacancy.title.ilike(f"%{query}%"))
+        for skill in normalize_skills(skills):
+            statement = statement.where(
+                Vacancy.id.in_(select(VacancySkill.vacancy_id).where(VacancySkill.skill == skill))
+            )
+        if location:
+            statement = statement.where(Vacancy.location.icontains(location, autoescape=True))
+        if company:
+            statement = statement.where(Vacancy.company.icontains(company, autoescape=True))
+        if source:
+            statement = statement.where(Vacancy.source == source)
+        return self._read_database(statement)
+
+    @staticmethod
+    def _track_flush(session, _flush_context) -> None:
+        """Remember the vacancies a flush wrote, per transaction, until the session commits."""
+        transaction = session.get_nested_transaction() or session.get_transaction()
+        changed = session.info.setdefault("changed_vacancy_ids", {}).setdefault(transaction, set())
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+            if isinstance(instance, Vacancy) and instance.id is not None:
+                changed.add(instance.id)
+
+    def _track_commit(self, session) -> None:
+        # Also fired when a savepoint is released; its writes wait for the outer commit
+        if session.get_nested_transaction() is not None:
+            return
+        changed = session.info.pop("changed_vacancy_ids", None)
+        if changed:
+            with self._changes_lock:
+                self._changed_ids.update(*changed.values())
+            self._wake.set()
+
+    @staticmethod
+    def _track_rollback(session, previous_transaction) -> None:
+        """Forget the vacancies flushed inside the rolled back transaction or savepoint."""
+        changed = session.info.get("changed_vacancy_ids")
+        if not changed:
+            return
+        for transaction in list(changed):
+            ancestor = transaction
+            while ancestor is not None and ancestor is not previous_transaction:
+                ancestor = ancestor.parent
+            if ancestor is not None:
+                del changed[transaction]
+
+    def sync_rag_index(self, reconcile: bool = False) -> None:
+        """
+        Bring the internal RAG index up to date with the database.
+
+        The first call builds the index; later calls add rows with new ids
+        and re-read the vacancies committed through ORM sessions of this
+        process since the last sync. A reconcile reads every row back and
+        compares it with the index instead, which also catches writes made
+        by other processes or raw SQL. Only the differences are applied,
+        without refitting the index.
+
+        Args:
+            reconcile: Compare the whole table with the index
+        """
+        if not self._owns_rag or self.session_factory is None:
+            return
+        columns = [getattr(Vacancy, column) for column in DB_COLUMNS]
+        with self._sync_lock:
+            with self._changes_lock:
+                changed, self._changed_ids = self._changed_ids, set()
+            full = reconcile or self.rag_service is None
+            try:
+                if full:
+                    fresh = self._fetch_vacancies(select(*columns).order_by(Vacancy.id))
+                else:
+                    fresh = self._fetch_vacancies(
+                        select(*columns).where(Vacancy.id > self._synced_max_id).order_by(Vacancy.id)
+                    )
+                    changed = sorted(i for i in changed if i <= self._synced_max_id)
+                    for start in range(0, len(changed), SYNC_CHUNK_SIZE):
+                        fresh += self._fetch_vacancies(
+                            select(*columns).where(Vacancy.id.in_(changed[start:start + SYNC_CHUNK_SIZE]))
+                        )
+            except SQLAlchemyError as e:
+                print(f"Error syncing RAG index: {e}")
+                with self._changes_lock:
+                    self._changed_ids.update(changed)
+                return
+
+            for vacancy in fresh:
+                vacancy["description"] = vacancy.get("description") or ""
+            found = {vacancy["id"] for vacancy in fresh}
+            if self.rag_service is None:
+                rag_service = RAGService()
+                rag_service.load_vacancies(fresh)
+                self.rag_service = rag_service
+            elif full:
+                # Removed ids still listed by the index are skipped by remove_vacancies
+                self.rag_service.remove_vacancies([
+                    vacancy["id"] for vacancy in self.rag_service.vacancies
+                    if vacancy is not None and vacancy["id"] not in found
+                ])
+                indexed = {v["id"]: v for v in self.rag_service.get_vacancies_details(list(found))}
+                self.rag_service.add_vacancies([v for v in fresh if indexed.get(v["id"]) != v])
+            else:
+                self.rag_service.remove_vacancies([i for i in changed if i not in found])
+                self.rag_service.add_vacancies(fresh)
+
+            if full:
+                # Ids freed by deleting the newest rows may be reused
+                self._synced_max_id = max(found, default=0)
+                self._reconciled_at = time.monotonic()
+            else:
+                self._synced_max_id = max([self._synced_max_id] + list(found))
+
+    def _run(self) -> None:
+        while not self._stopping:
+            reconcile = time.monotonic() - self._reconciled_at >= self.rag_reconcile_interval
+            try:
+                self.sync_rag_index(reconcile=reconcile)
+            except Exception as e:  # pylint: disable=broad-except
+                print(f"Error syncing RAG index: {type(e).__name__}: {e}")
+            self._wake.wait(self.rag_refresh_interval)
+            self._wake.clear()
+
+    def start(self) -> None:
+        """Track vacancy writes and keep the RAG index in sync from a background thread."""
+        if self.running or not self._owns_rag or self.session_factory is None:
+            return
+        event.listen(Session, "after_flush", self._track_flush)
+        event.listen(Session, "after_commit", self._track_commit)
+        event.listen(Session, "after_soft_rollback", self._track_rollback)
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="rag-index-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread and write tracking."""
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+        event.remove(Session, "after_flush", self._track_flush)
+        event.remove(Session, "after_commit", self._track_commit)
+        event.remove(Session, "after_soft_rollback", self._track_rollback)
+
+    def rag_candidates(self, query_text: str, limit: int) -> List[Dict]:
+        """
+        Return up to limit vacancies most similar to the query in the RAG index.
+
+        Hits of the internal index are read back from the database, so
+        vacancies deleted or edited since the last sync are dropped or
+        returned as they are stored now.
+        """
+        rag_service = self.rag_service
+        if rag_service is None or not len(rag_service) or not query_text.strip():
+            return []
+        hits = rag_service.query_vacancies(query_text, limit)
+        if not self._owns_rag or not hits:
+            return hits
+        columns = [getattr(Vacancy, column) for column in DB_COLUMNS]
+        current = {
+            vacancy["id"]: vacancy
+            for vacancy in self._read_database(
+                select(*columns).where(Vacancy.id.in_([hit["id"] for hit in hits]))
+            )
+        }
+        return [current[hit["id"]] for hit in hits if hit["id"] in current]
+
+    def search(
+        self,
+        job_title: Optional[str],
+        resume_data: Dict,
+        resume_text: str = "",
+        scraped: Sequence[Dict] = (),
+        scraped_scores: Optional[np.ndarray] = None,
+        limit: int = 20,
+        skills: Optional[List[str]] = None,
+        **filters: Optional[str]
+    ) -> Tuple[List[Dict], np.ndarray, np.ndarray]:
+        """
+        Rank vacancies from every source for a job title and resume.
+
+        Args:
+            job_title: Job title to search for
+            resume_data: Parsed resume with skills and experience
+            resume_text: Resume text used for text similarity
+            scraped: Scraped vacancies already matching the filters
+            scraped_scores: Match scores of scraped, if already computed
+            limit: Number of results to rank
+            skills: Skills every vacancy must require
+            **filters: location, company and source; see vacancy_matches
+
+        Returns:
+            tuple: (candidates, unrounded match scores, indices of the top
+                limit candidates by fused rank, best first)
+        """
+        # Never take fewer candidates per source than the caller asked to rank
+        per_source = max(self.candidates_per_source, limit)
+
+        # Stage 1: bounded candidates from each source
+        scraped = list(scraped)
+        if len(scraped) > per_source:
+            if scraped_scores is None:
+                scraped_scores = calculate_match_scores(resume_data, SkillMatrix(scraped))
+            scraped = [scraped[i] for i in top_k_indices(np.round(scraped_scores, 1), per_source)]
+
+        query_text = " ".join(
+            part for part in (job_title, resume_text[:self.max_query_chars]) if part
+        )
+        stored = self.database_candidates(job_title, per_source, skills, **filters) + [
+            vacancy for vacancy in self.rag_candidates(query_text, per_source)
+            if vacancy_matches(vacancy, skills, **filters)
+        ]
+
+        candidates: Dict[str, Dict] = {}
+        for vacancy in stored + scraped:
+            candidates.setdefault(dedup_key(vacancy), vacancy)
+        candidates = list(candidates.values())
+        if not candidates:
+            return [], np.empty(0), np.empty(0, dtype=np.intp)
+
+        # Stage 2: fuse the skill match ranking with the text similarity ranking
+        match_scores = calculate_match_scores(resume_data, SkillMatrix(candidates))
+        fused = reciprocal_rank_fusion(
+            [np.round(match_scores, 1), text_similarity(query_text, candidates)],
+            self.rrf_k
+        )
+        return candidates, match_scores, top_k_indices(fused, limit)
@@ -0,0 +1,112 @@
+"""
+Vectorized resume-to-vacancy match scoring.
+
+This module scores a resume against many vacancies at once using a sparse
+binary vacancies x skills matrix. Scores follow the same rule as
+backend.services.vacancies.calculate_match_score: 70% skill overlap and
+30% experience.
+"""
+
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+from scipy import sparse
+
+
+class SkillMatrix:
+    """Binary CSR matrix of required skills (vacancies x skill vocabulary)."""
+
+    def __init__(self, vacancies: Sequence[Dict]):
+        """
+        Encode the required skills and experience of vacancies.
+
+        Args:
+            vacancies: Vacancy dictionaries with required_skills and experience_required
+        """
+        self.vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        for vacancy in vacancies:
+            skills = set(skill.lower() for skill in vacancy.get("required_skills", []))
+            for skill in skills:
+                indices.append(self.vocabulary.setdefault(skill, len(self.vocabulary)))
+            indptr.append(len(indices))
+
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(vacancies), len(self.vocabulary))
+        )
+        self.required_counts = np.diff(self.matrix.indptr)
+        self.experience_required = np.array(
+            [vacancy.get("experience_required", 0) or 0 for vacancy in vacancies],
+            dtype=np.float64
+        )
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def encode_skills(self, skills: Iterable[str]) -> np.ndarray:
+        """Return a 0/1 vector of the given skills over the vocabulary."""
+        vector = np.zeros(len(self.vocabulary), dtype=np.int32)
+        for skill in set(skill.lower() for skill in skills):
+            position = self.vocabulary.get(skill)
+            if position is not None:
+                vector[position] = 1
+        return vector
+
+
+def calculate_match_scores(resume_data: Dict, skill_matrix: SkillMatrix) -> np.ndarray:
+    """
+    Calculate unrounded match scores of a resume against every vacancy.
+
+    Args:
+        resume_data (dict): Parsed resume data with skills and experience
+        skill_matrix (SkillMatrix): Encoded vacancies
+
+    Returns:
+        np.ndarray: Scores from 0 to 100, one per vacancy
+    """
+    scores = np.zeros(len(skill_matrix), dtype=np.float64)
+    if "error" in resume_data or len(skill_matrix) == 0:
+        return scores
+
+    counts = skill_matrix.required_counts
+    has_skills = counts > 0
+    matching = skill_matrix.matrix @ skill_matrix.encode_skills(resume_data.get("skills", []))
+    skill_score = np.divide(matching, counts, out=np.zeros_like(scores), where=has_skills) * 70
+
+    resume_experience = float(resume_data.get("experience_years", 0))
+    required = skill_matrix.experience_required
+    partial = np.divide(resume_experience, required, out=np.zeros_like(scores), where=required > 0) * 30
+    experience_score = np.where(resume_experience >= required, 30.0, partial)
+
+    np.add(skill_score, experience_score, out=scores, where=has_skills)
+    return scores
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return indices of the k highest scores, best first.
+
+    Equal scores keep their original order, like a stable descending sort,
+    but only the k winners are sorted.
+
+    Args:
+        scores: Score per item
+        k: Number of indices to return
+
+    Returns:
+        np.ndarray: Indices into scores
+    """
+    n = scores.shape[0]
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        kth_largest = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth_largest)
+        ties = np.flatnonzero(scores == kth_largest)[:k - len(above)]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(n)
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
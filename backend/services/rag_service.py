@@ -4,40 +4,525 @@ RAG (Retrieval-Augmented Generation) service for job matching.
 This module provides semantic search and ranking functionality for vacancies.
 """
 
-from typing import List, Dict, Any
-from fastapi import HTTPException
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import copy
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
+
+import joblib
 import numpy as np
+from fastapi import HTTPException
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from backend.services.match_scoring import top_k_indices
+from backend.services.vector_index import DenseVectorIndex
+
+
+class _Segment:
+    """Term counts of a batch of vacancies and their TF-IDF rows."""
+
+    __slots__ = ("counts", "weighted", "positions")
+
+    def __init__(self, counts: sparse.csr_matrix, weighted: sparse.csr_matrix, positions: np.ndarray):
+        self.counts = counts
+        self.weighted = weighted
+        self.positions = positions
+
+
+class _IndexView:
+    """
+    Everything a query reads, replaced as a whole by every write.
+
+    Writers only append to vacancies and id_index in place, which older
+    views never look past, so queries need no lock.
+    """
+
+    __slots__ = ("segments", "vacancies", "id_index", "live", "doc_ids", "idf", "n_live")
+
+    def __init__(self, segments, vacancies, id_index, live, doc_ids, idf, n_live):
+        self.segments = segments
+        self.vacancies = vacancies
+        self.id_index = id_index
+        # False for removed positions until the next merge compacts them away
+        self.live = live
+        # Stable id of each position in the dense index
+        self.doc_ids = doc_ids
+        self.idf = idf
+        self.n_live = n_live
 
 
 class RAGService:
-    def __init__(self):
-        self.vacancies = []
-        self.vectorizer = TfidfVectorizer()
+    def __init__(
+        self,
+        dense_index: Optional[DenseVectorIndex] = None,
+        n_features: int = 2 ** 20,
+        merge_ratio: float = 0.1,
+        max_segments: int = 8
+    ):
+        """
+        Initialize the service.
+
+        Descriptions are hashed into term counts, so no vocabulary has to be
+        fitted and vacancies can be added or removed without refitting. A
+        running document-frequency table provides the IDF weights. New
+        vacancies go into delta segments weighted with the IDF at the time
+        they were added; segments are merged (re-weighted, with removed
+        vacancies compacted away) into the main segment once they grow past
+        merge_ratio of it.
+
+        One writer may add or remove vacancies while other threads query.
+
+        Args:
+            dense_index: Optional approximate nearest-neighbour index. When
+                given, queries are answered from dense embeddings instead of
+                exact TF-IDF cosine similarity.
+            n_features: Number of hashed term buckets
+            merge_ratio: Share of delta rows or removed rows, relative to the
+                main segment, that triggers a merge
+            max_segments: Number of segments that triggers a merge
+        """
+        self.dense_index = dense_index
+        self.merge_ratio = merge_ratio
+        self.max_segments = max_segments
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None
+        )
+        # Documents per hashed term among live vacancies
+        self._doc_freq = np.zeros(n_features, dtype=np.int64)
+        self._view = self._empty_view()
+        self._next_doc_id = 0
+        self._removed_rows = 0
+        # Removed vacancies still in a dense index that cannot delete them
+        self._dense_stale = 0
+        self._fingerprint: Optional[str] = None
+        self._write_lock = threading.RLock()
+        # FAISS indexes must not be searched while vectors are added or removed
+        self._dense_lock = threading.Lock()
+
+    def _empty_view(self) -> _IndexView:
+        return _IndexView(
+            (), [], {}, np.zeros(0, dtype=bool), np.zeros(0, dtype=np.int64),
+            self._idf(0), 0
+        )
+
+    def __len__(self) -> int:
+        return self._view.n_live
+
+    @property
+    def vacancies(self) -> List[Optional[Dict[str, Any]]]:
+        """Vacancies by position; removed ones stay in place until the next merge."""
+        return self._view.vacancies
+
+    @staticmethod
+    def _fingerprint_descriptions(descriptions: List[str]) -> str:
+        digest = hashlib.sha256()
+        for description in descriptions:
+            digest.update(description.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    @staticmethod
+    def _dedupe_by_id(vacancies_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the last of several vacancies sharing an id, in input order."""
+        last = {vacancy['id']: position for position, vacancy in enumerate(vacancies_data) if 'id' in vacancy}
+        if len(last) == sum('id' in vacancy for vacancy in vacancies_data):
+            return list(vacancies_data)
+        return [
+            vacancy for position, vacancy in enumerate(vacancies_data)
+            if 'id' not in vacancy or last[vacancy['id']] == position
+        ]
+
+    @staticmethod
+    def _build_id_index(vacancies: List[Optional[Dict[str, Any]]]) -> Dict[Any, int]:
+        return {
+            vacancy['id']: position
+            for position, vacancy in enumerate(vacancies)
+            if vacancy is not None and 'id' in vacancy
+        }
+
+    def _idf(self, n_live: int) -> np.ndarray:
+        """Smoothed IDF over the live vacancies, as computed by TfidfTransformer."""
+        return np.log((1 + n_live) / (1 + self._doc_freq)) + 1
+
+    @staticmethod
+    def _weight(counts: sparse.csr_matrix, idf: np.ndarray) -> sparse.csr_matrix:
+        """Scale term counts by IDF and L2-normalise the rows."""
+        weighted = counts.astype(np.float64)
+        weighted.data *= idf[weighted.indices]
+        if not weighted.shape[0]:
+            return weighted
+        return normalize(weighted, norm="l2", copy=False)
+
+    def _count_terms(self, descriptions: List[str]) -> sparse.csr_matrix:
+        counts = self.vectorizer.transform(descriptions).tocsr()
+        counts.sum_duplicates()
+        return counts
+
+    def _fresh_dense_index(self) -> Optional[DenseVectorIndex]:
+        """Return an empty copy of the dense index to build while the old one serves queries."""
+        if self.dense_index is None:
+            return None
+        fresh = copy.copy(self.dense_index)
+        fresh.reset()
+        return fresh
 
     def load_vacancies(self, vacancies_data: List[Dict[str, Any]]):
-        self.vacancies = vacancies_data
-        self.vectorizer.fit([vacancy['description'] for vacancy in self.vacancies])
+        """
+        Replace all vacancies and rebuild the index.
+
+        The index is only rebuilt when the vacancy descriptions differ from
+        the ones currently indexed. Of several vacancies sharing an id, the
+        last one is kept.
+        """
+        vacancies_data = self._dedupe_by_id(vacancies_data)
+        descriptions = [vacancy['description'] for vacancy in vacancies_data]
+        fingerprint = self._fingerprint_descriptions(descriptions)
+        with self._write_lock:
+            view = self._view
+            if not vacancies_data:
+                dense_index = self._fresh_dense_index()
+                with self._dense_lock:
+                    self.dense_index = dense_index
+                self._doc_freq[:] = 0
+                self._view = self._empty_view()
+                self._next_doc_id = 0
+                self._removed_rows = 0
+                self._dense_stale = 0
+                self._fingerprint = fingerprint
+                return
+            if fingerprint == self._fingerprint and view.segments:
+                vacancies = list(vacancies_data)
+                self._view = _IndexView(
+                    view.segments, vacancies, self._build_id_index(vacancies),
+                    view.live, view.doc_ids, view.idf, view.n_live
+                )
+                return
+
+            counts = self._count_terms(descriptions)
+            self._doc_freq = np.bincount(counts.indices, minlength=self._doc_freq.shape[0])
+            idf = self._idf(len(descriptions))
+            positions = np.arange(len(descriptions))
+            doc_ids = np.arange(len(descriptions), dtype=np.int64)
+
+            dense_index = self._fresh_dense_index()
+            if dense_index is not None:
+                dense_index.add(descriptions, doc_ids)
+                with self._dense_lock:
+                    self.dense_index = dense_index
+
+            vacancies = list(vacancies_data)
+            self._view = _IndexView(
+                (_Segment(counts, self._weight(counts, idf), positions),),
+                vacancies, self._build_id_index(vacancies),
+                np.ones(len(descriptions), dtype=bool), doc_ids, idf, len(descriptions)
+            )
+            self._next_doc_id = len(descriptions)
+            self._removed_rows = 0
+            self._dense_stale = 0
+            self._fingerprint = fingerprint
+
+    def add_vacancies(self, vacancies_data: List[Dict[str, Any]]) -> None:
+        """
+        Index new vacancies without refitting the existing ones.
+
+        A vacancy whose id is already indexed replaces the old one, and of
+        several vacancies sharing an id, the last one is kept.
+
+        Args:
+            vacancies_data: Vacancies to add
+        """
+        if not vacancies_data:
+            return
+        vacancies_data = self._dedupe_by_id(vacancies_data)
+        descriptions = [vacancy['description'] for vacancy in vacancies_data]
+        counts = self._count_terms(descriptions)
+        vectors = None
+        if self.dense_index is not None:
+            # Embed before taking any lock; this is the slow part of a dense add
+            vectors = self.dense_index.embedder.encode(descriptions)
+
+        with self._write_lock:
+            replaced = [v['id'] for v in vacancies_data if 'id' in v and v['id'] in self._view.id_index]
+            if replaced:
+                self.remove_vacancies(replaced)
+
+            view = self._view
+            start = len(view.vacancies)
+            positions = np.arange(start, start + len(vacancies_data))
+            doc_ids = np.arange(self._next_doc_id, self._next_doc_id + len(vacancies_data), dtype=np.int64)
+            self._next_doc_id += len(vacancies_data)
+
+            self._doc_freq += np.bincount(counts.indices, minlength=self._doc_freq.shape[0])
+            n_live = view.n_live + len(vacancies_data)
+            idf = self._idf(n_live)
+
+            if vectors is not None:
+                with self._dense_lock:
+                    self.dense_index.add_vectors(vectors, doc_ids)
+
+            # Older views never read past their own length, so both grow in place
+            view.vacancies.extend(vacancies_data)
+            for position, vacancy in zip(positions, vacancies_data):
+                if 'id' in vacancy:
+                    view.id_index[vacancy['id']] = int(position)
+
+            self._view = _IndexView(
+                view.segments + (_Segment(counts, self._weight(counts, idf), positions),),
+                view.vacancies, view.id_index,
+                np.concatenate([view.live, np.ones(len(vacancies_data), dtype=bool)]),
+                np.concatenate([view.doc_ids, doc_ids]), idf, n_live
+            )
+            self._fingerprint = None
+            self._maybe_merge()
+
+    def remove_vacancies(self, vacancy_ids: List[Any]) -> int:
+        """
+        Remove vacancies by id.
+
+        Removed vacancies stop appearing in results at once; their rows are
+        dropped from the matrices at the next merge.
+
+        Args:
+            vacancy_ids: Ids of the vacancies to remove
+
+        Returns:
+            Number of vacancies removed
+        """
+        with self._write_lock:
+            view = self._view
+            positions = [view.id_index.pop(i) for i in vacancy_ids if i in view.id_index]
+            if not positions:
+                return 0
+
+            live = view.live.copy()
+            for position in positions:
+                segment, row = self._locate(view.segments, position)
+                counts = segment.counts
+                self._doc_freq[counts.indices[counts.indptr[row]:counts.indptr[row + 1]]] -= 1
+                live[position] = False
+            n_live = view.n_live - len(positions)
+
+            if self.dense_index is not None:
+                doc_ids = view.doc_ids[positions]
+                with self._dense_lock:
+                    self._dense_stale += len(doc_ids) - self.dense_index.remove(doc_ids)
+
+            self._view = _IndexView(
+                view.segments, view.vacancies, view.id_index, live, view.doc_ids,
+                self._idf(n_live), n_live
+            )
+            self._removed_rows += len(positions)
+            self._fingerprint = None
+            self._maybe_merge()
+            return len(positions)
+
+    @staticmethod
+    def _locate(segments, position: int):
+        """Return the segment holding a position and its row in that segment."""
+        for segment in segments:
+            # Positions are ascending within every segment
+            row = int(np.searchsorted(segment.positions, position))
+            if row < len(segment.positions) and segment.positions[row] == position:
+                return segment, row
+        raise KeyError(position)
+
+    def _maybe_merge(self) -> None:
+        segments = self._view.segments
+        main_rows = segments[0].counts.shape[0] if segments else 0
+        delta_rows = sum(segment.counts.shape[0] for segment in segments[1:])
+        threshold = self.merge_ratio * max(main_rows, 1)
+        if (
+            len(segments) > self.max_segments
+            or delta_rows > threshold
+            or self._removed_rows > threshold
+        ):
+            self.merge_segments()
+
+    def merge_segments(self) -> None:
+        """
+        Merge all segments into one, compacting removed vacancies away and re-weighting.
+
+        Only stored term counts are re-weighted; no description is tokenised
+        again. A dense index that cannot delete vectors is rebuilt once its
+        removed entries exceed merge_ratio of the live ones.
+        """
+        with self._write_lock:
+            view = self._view
+            if not view.segments:
+                return
+            counts = sparse.vstack([segment.counts for segment in view.segments]).tocsr()
+            positions = np.concatenate([segment.positions for segment in view.segments])
+            keep = view.live[positions]
+            counts, positions = counts[keep], positions[keep]
+
+            vacancies = [view.vacancies[position] for position in positions]
+            doc_ids = view.doc_ids[positions]
+
+            if self._dense_stale > self.merge_ratio * max(view.n_live, 1):
+                dense_index = self._fresh_dense_index()
+                dense_index.add([vacancy['description'] for vacancy in vacancies], doc_ids)
+                with self._dense_lock:
+                    self.dense_index = dense_index
+                    self._dense_stale = 0
+
+            self._view = _IndexView(
+                (_Segment(counts, self._weight(counts, view.idf), np.arange(len(positions))),),
+                vacancies, self._build_id_index(vacancies),
+                np.ones(len(positions), dtype=bool), doc_ids, view.idf, len(positions)
+            )
+            self._removed_rows = 0
 
     def index_vacancies(self):
-        if not self.vacancies:
+        """Return the TF-IDF matrix of the vacancies, merging pending segments."""
+        if not self._view.n_live:
             raise HTTPException(status_code=404, detail="No vacancies available to index.")
-        return self.vectorizer.transform([vacancy['description'] for vacancy in self.vacancies])
+        if len(self._view.segments) > 1 or self._removed_rows:
+            self.merge_segments()
+        return self._view.segments[0].weighted
+
+    def save_index(self, path: Union[str, Path]) -> None:
+        """
+        Save the segments, document frequencies and vacancies to disk.
+
+        Args:
+            path: Destination file for the index snapshot
+        """
+        with self._write_lock:
+            self.index_vacancies()
+            view = self._view
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            joblib.dump({
+                "vacancies": view.vacancies,
+                "vectorizer": self.vectorizer,
+                "counts": view.segments[0].counts,
+                "matrix": view.segments[0].weighted,
+                "doc_ids": view.doc_ids,
+                "doc_freq": self._doc_freq,
+                "fingerprint": self._fingerprint,
+            }, path)
+
+    def load_index(self, path: Union[str, Path]) -> None:
+        """
+        Restore an index snapshot written by save_index without re-tokenising.
+
+        Args:
+            path: Snapshot file created by save_index
+        """
+        snapshot = joblib.load(Path(path))
+        with self._write_lock:
+            vacancies = snapshot["vacancies"]
+            doc_ids = snapshot["doc_ids"]
+            self.vectorizer = snapshot["vectorizer"]
+            self._doc_freq = snapshot["doc_freq"]
+            self._view = _IndexView(
+                (_Segment(
+                    snapshot["counts"].tocsr(),
+                    snapshot["matrix"].tocsr(),
+                    np.arange(len(vacancies))
+                ),),
+                vacancies, self._build_id_index(vacancies),
+                np.ones(len(vacancies), dtype=bool), doc_ids,
+                self._idf(len(vacancies)), len(vacancies)
+            )
+            self._next_doc_id = int(doc_ids.max()) + 1 if len(doc_ids) else 0
+            self._removed_rows = 0
+            self._dense_stale = 0
+            self._fingerprint = snapshot["fingerprint"]
 
     def query_vacancies(self, user_query: str, top_n: int = 5) -> List[Dict[str, Any]]:
-        if not self.vacancies:
+        return self.query_vacancies_batch([user_query], top_n)[0]
+
+    def _query_dense(self, view: _IndexView, queries: List[str], top_n: int) -> List[List[Dict[str, Any]]]:
+        """Answer queries from the dense index, skipping vacancies removed from the view."""
+        wanted = min(top_n, view.n_live)
+        # Removed vacancies may still be in the index; over-fetch a little and
+        # widen the search only for the rare query that comes up short
+        k = top_n if not self._dense_stale else 2 * top_n
+        while True:
+            with self._dense_lock:
+                total = len(self.dense_index)
+                rows = self.dense_index.search_ids(queries, min(k, total))
+            results = []
+            for row in rows:
+                doc_ids = np.asarray(row, dtype=np.int64)
+                # Doc ids ascend with position; ids of compacted or newer vacancies miss
+                positions = np.minimum(np.searchsorted(view.doc_ids, doc_ids), len(view.doc_ids) - 1)
+                found = positions[(view.doc_ids[positions] == doc_ids) & view.live[positions]]
+                results.append([view.vacancies[position] for position in found[:top_n]])
+            if k >= total or all(len(result) >= wanted for result in results):
+                return results
+            k *= 4
+
+    def query_vacancies_batch(
+        self,
+        queries: List[str],
+        top_n: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Find the best matching vacancies for several queries at once.
+
+        With TF-IDF, all queries are scored with one sparse matrix product per
+        segment and only the top_n winners of each row are sorted. With a dense
+        index, the queries are answered by one approximate nearest-neighbour search.
+
+        Args:
+            queries: Free-text queries
+            top_n: Number of vacancies to return per query
+
+        Returns:
+            One list of vacancies per query, best match first
+        """
+        view = self._view
+        if not view.n_live:
             raise HTTPException(status_code=404, detail="No vacancies available to query.")
-        
-        query_vector = self.vectorizer.transform([user_query])
-        vacancy_vectors = self.index_vacancies()
-        similarities = cosine_similarity(query_vector, vacancy_vectors).flatten()
-        
-        top_indices = np.argsort(similarities)[-top_n:][::-1]
-        return [self.vacancies[i] for i in top_indices]
+        if not queries:
+            return []
+
+        if self.dense_index is not None:
+            return self._query_dense(view, queries, top_n)
+
+        query_vectors = self._weight(self.vectorizer.transform(queries).tocsr(), view.idf)
+        # Rows are L2-normalised, so the dot product is the cosine similarity.
+        # Keep the CSR segment on the left: segment.weighted.T would be CSC and
+        # scipy would convert the whole corpus back to CSR on every call.
+        similarities = np.hstack([
+            (segment.weighted @ query_vectors.T).T.toarray() for segment in view.segments
+        ])
+        positions = np.concatenate([segment.positions for segment in view.segments])
+        similarities[:, ~view.live[positions]] = -np.inf
+
+        top_n = min(top_n, view.n_live)
+        return [
+            [view.vacancies[positions[i]] for i in top_k_indices(row, top_n)]
+            for row in similarities
+        ]
 
     def get_vacancy_details(self, vacancy_id: str) -> Dict[str, Any]:
-        for vacancy in self.vacancies:
-            if vacancy['id'] == vacancy_id:
-                return vacancy
-        raise HTTPException(status_code=404, detail="Vacancy not found.")
\ No newline at end of file
+        view = self._view
+        position = view.id_index.get(vacancy_id)
+        if position is None:
+            raise HTTPException(status_code=404, detail="Vacancy not found.")
+        return view.vacancies[position]
+
+    def get_vacancies_details(self, vacancy_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Look up several vacancies by id in one call.
+
+        Args:
+            vacancy_ids: Ids to look up
+
+        Returns:
+            Vacancies in the order of vacancy_ids; unknown ids are skipped
+        """
+        view = self._view
+        return [
+            view.vacancies[view.id_index[vacancy_id]]
+            for vacancy_id in vacancy_ids
+            if vacancy_id in view.id_index
+        ]
@@ -5,13 +5,37 @@ This module contains the business logic for handling vacancy-related operations.
 """
 
 from pathlib import Path
-from backend.utils.resume_parser import analyze_resume
+
+from backend.database.session import SessionLocal
+from backend.services.hybrid_search import HybridSearch
+from backend.services.match_scoring import SkillMatrix, calculate_match_scores
+from backend.services.vacancy_refresher import VacancyRefresher, vacancy_matches
 from backend.services.vacancy_scraper import VacancyScraper
+from backend.services.vacancy_store import normalize_query
+from backend.utils.resume_cache import ResumeCache
+from backend.utils.ttl_cache import TTLCache
 
 
 # Initialize vacancy scraper
 vacancy_scraper = VacancyScraper()
 
+# Parsed resumes keyed by content hash; repeat searches skip PDF/DOCX parsing
+resume_cache = ResumeCache()
+
+# Background refresher publishing the snapshot searches read from; started by the app lifespan
+vacancy_refresher = VacancyRefresher(vacancy_scraper)
+
+# Fetched vacancies per (job title, sources); repeated searches skip the job boards
+search_cache = TTLCache(max_size=256, ttl=300, stale_ttl=900)
+
+# Merges scraped postings with database vacancies and the RAG index into one ranking
+hybrid_search = HybridSearch(SessionLocal)
+
+
+def search_cache_key(job_title):
+    """Build the search cache key from a normalised job title and the active sources."""
+    return normalize_query(job_title), tuple(sorted(vacancy_scraper.sources))
+
 
 def calculate_match_score(resume_data, vacancy):
     """
@@ -76,15 +100,19 @@ def get_latest_resume():
         return None
 
 
-def get_vacancies(request):
+def rank_vacancies(request):
     """
-    Retrieve a list of vacancies based on the search request.
+    Score vacancies for the search request against the latest resume.
+
+    Scraped postings are merged with database and RAG candidates by
+    hybrid_search and ranked by fused text similarity and match score.
 
     Args:
         request (VacancyRequest): The request containing the job title to search for.
 
     Returns:
-        list[dict]: A list of dictionaries representing vacancies with match scores.
+        tuple: (vacancies, unrounded scores, indices of the top request.limit
+            vacancies, best first)
     """
     # Try to get and analyze the uploaded resume
     resume_path = get_latest_resume()
@@ -92,7 +120,7 @@ def get_vacancies(request):
 
     if resume_path:
         try:
-            resume_data = analyze_resume(resume_path)
+            resume_data = resume_cache.analyze(resume_path)
         except (IOError, OSError) as e:
             print(f"Error analyzing resume: {e}")
             resume_data = {"skills": [], "experience_years": 0}
@@ -105,34 +133,99 @@ def get_vacancies(request):
         request.job_title.lower() if hasattr(request, 'job_title') else None
     )
 
-    # Fetch vacancies from APIs or use cached data
-    print("Fetching vacancies from job boards...")
-    all_vacancies = vacancy_scraper.fetch_all_vacancies(job_title_query)
+    filters = {
+        "location": getattr(request, "location", None),
+        "company": getattr(request, "company", None),
+        "source": getattr(request, "source", None),
+    }
+    skills = getattr(request, "skills", None) or []
+
+    scores = None
+    snapshot = vacancy_refresher.snapshot
+    if snapshot:
+        # Serve from the refresher's snapshot; requests never wait on a job board
+        positions = snapshot.search_positions(job_title_query, skills, **filters)
+        all_vacancies = [snapshot.vacancies[i] for i in positions]
+        scores = calculate_match_scores(resume_data, snapshot.skill_matrix)[positions]
+    else:
+        # No snapshot yet: fetch from APIs, reusing recent results for the same search
+        all_vacancies = search_cache.get_or_load(
+            search_cache_key(job_title_query),
+            lambda: vacancy_scraper.fetch_all_vacancies(job_title_query)
+        )
 
     # If API fetch failed, try to use cached data
     if not all_vacancies:
         print("API fetch failed, trying cached data...")
-        all_vacancies = vacancy_scraper.get_cached_vacancies()
-
-    if not all_vacancies:
+        all_vacancies = vacancy_scraper.get_cached_vacancies(job_title_query)
+        scores = None
+
+    if scores is None and (skills or any(filters.values())):
+        all_vacancies = [
+            vacancy for vacancy in all_vacancies
+            if vacancy_matches(vacancy, skills, **filters)
+        ]
+
+    # Score scraped vacancies in one vectorized pass
+    if scores is None and all_vacancies:
+        scores = calculate_match_scores(resume_data, SkillMatrix(all_vacancies))
+
+    resume_text = ""
+    if resume_path and "error" not in resume_data:
+        resume_text = resume_cache.get_text(resume_path) or ""
+
+    vacancies, scores, order = hybrid_search.search(
+        job_title_query,
+        resume_data,
+        resume_text,
+        all_vacancies,
+        scores,
+        getattr(request, "limit", 20),
+        skills,
+        **filters
+    )
+    if not vacancies:
         print("No vacancies available from any source")
-        return []
-
-    # Calculate match scores for each vacancy
-    results = []
-    for vacancy in all_vacancies:
-        match_score = calculate_match_score(resume_data, vacancy)
-        results.append({
-            "title": vacancy["title"],
-            "company": vacancy["company"],
-            "chance": match_score,
-            "location": vacancy.get("location", "N/A"),
-            "url": vacancy.get("url", ""),
-            "source": vacancy.get("source", "unknown")
-        })
-
-    # Sort by match score (highest first)
-    results.sort(key=lambda x: x["chance"], reverse=True)
-
-    # Return top 20 results
-    return results[:20]
+    return vacancies, scores, order
+
+
+def format_match(vacancy, score):
+    """Build the search result dictionary of one scored vacancy."""
+    return {
+        "title": vacancy["title"],
+        "company": vacancy["company"],
+        "chance": round(float(score), 1),
+        "location": vacancy.get("location", "N/A"),
+        "url": vacancy.get("url", ""),
+        "source": vacancy.get("source", "unknown")
+    }
+
+
+def iter_vacancies(request):
+    """
+    Rank vacancies now and return an iterator that formats them lazily, best first.
+
+    Errors while fetching or scoring are raised by this call, before any
+    result is produced.
+
+    Args:
+        request (VacancyRequest): The request containing the job title to search for.
+
+    Returns:
+        Iterator[dict]: Vacancies with match scores.
+    """
+    vacancies, scores, order = rank_vacancies(request)
+    return (format_match(vacancies[i], scores[i]) for i in order)
+
+
+def get_vacancies(request):
+    """
+    Retrieve a list of vacancies based on the search request.
+
+    Args:
+        request (VacancyRequest): The request containing the job title to search for.
+
+    Returns:
+        list[dict]: A list of dictionaries representing vacancies with match scores.
+    """
+    return list(iter_vacancies(request))
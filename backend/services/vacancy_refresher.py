@@ -0,0 +1,280 @@
+"""
+Background refresher that keeps a ready-to-query vacancy snapshot.
+
+This module decouples scraping from request handling: a worker thread
+periodically pulls every job board and publishes an immutable snapshot that
+search requests only read from.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from backend.services.match_scoring import SkillMatrix
+from backend.services.vacancy_scraper import VacancyScraper, posting_text
+from backend.services.vacancy_store import normalize_query, source_posting_key
+from backend.utils.dedup import NearDuplicateIndex
+
+
+def vacancy_matches(
+    vacancy: Dict,
+    skills: Optional[Iterable[str]] = None,
+    location: Optional[str] = None,
+    company: Optional[str] = None,
+    source: Optional[str] = None
+) -> bool:
+    """
+    Check a scraped vacancy against search filters.
+
+    Location and company are case-insensitive substrings, since job boards
+    write them freely ("Berlin, Germany"); source must match exactly.
+    """
+    if source and vacancy.get("source") != source:
+        return False
+    for value, field in ((location, "location"), (company, "company")):
+        if value and value.lower() not in (vacancy.get(field) or "").lower():
+            return False
+    wanted = set(skill.lower() for skill in skills or [])
+    return wanted <= set(skill.lower() for skill in vacancy.get("required_skills", []))
+
+
+class VacancySnapshot:
+    """Immutable set of normalised vacancies published by the refresher."""
+
+    def __init__(self, vacancies: Iterable[Dict], created_at: Optional[float] = None):
+        """
+        Initialize the snapshot.
+
+        Args:
+            vacancies: Normalised vacancy dictionaries, newest first
+            created_at: Unix time the snapshot was built (defaults to now)
+        """
+        self.vacancies = tuple(vacancies)
+        self.created_at = time.time() if created_at is None else created_at
+        self._titles = tuple(vacancy.get("title", "").lower() for vacancy in self.vacancies)
+        # Encoded once per snapshot so every search scores with one sparse product
+        self.skill_matrix = SkillMatrix(self.vacancies)
+
+    def __len__(self) -> int:
+        return len(self.vacancies)
+
+    def age(self) -> float:
+        """Return the snapshot age in seconds."""
+        return time.time() - self.created_at
+
+    def search_positions(
+        self,
+        job_title: Optional[str] = None,
+        skills: Optional[Iterable[str]] = None,
+        **fields: Optional[str]
+    ) -> np.ndarray:
+        """
+        Return positions of vacancies whose title contains job_title (all when empty).
+
+        Args:
+            job_title: Optional job title to filter by
+            skills: Skills every vacancy must require; checked on the skill matrix
+            **fields: location, company or source values to filter by;
+                see vacancy_matches
+
+        Returns:
+            np.ndarray: Positions into self.vacancies
+        """
+        query = normalize_query(job_title)
+        if not query:
+            positions = np.arange(len(self.vacancies))
+        else:
+            positions = np.array(
+                [position for position, title in enumerate(self._titles) if query in title],
+                dtype=np.intp
+            )
+
+        wanted = set(skill.lower() for skill in skills or [])
+        if wanted:
+            columns = [self.skill_matrix.vocabulary.get(skill) for skill in wanted]
+            if None in columns:
+                return np.empty(0, dtype=np.intp)
+            required = np.asarray(self.skill_matrix.matrix[:, columns].sum(axis=1)).ravel()
+            positions = positions[required[positions] == len(columns)]
+
+        if any(fields.values()):
+            positions = np.array(
+                [p for p in positions if vacancy_matches(self.vacancies[p], **fields)],
+                dtype=np.intp
+            )
+        return positions
+
+    def search(self, job_title: Optional[str] = None) -> List[Dict]:
+        """
+        Return vacancies whose title contains job_title (all when empty).
+
+        Args:
+            job_title: Optional job title to filter by
+
+        Returns:
+            List of matching vacancy dictionaries
+        """
+        return [self.vacancies[i] for i in self.search_positions(job_title)]
+
+
+class VacancyRefresher:
+    """
+    Periodically refreshes vacancies from all sources in a background thread.
+
+    Refreshes are incremental: each run fetches only postings newer than the
+    sources' high-water marks and merges them into the previous snapshot.
+    New postings are checked for near-duplicates against a MinHash index that
+    mirrors the snapshot, so it is never rebuilt per refresh. Failed runs are
+    retried with exponential backoff and random jitter.
+    """
+
+    def __init__(
+        self,
+        scraper: VacancyScraper,
+        interval: float = 900.0,
+        max_backoff: float = 3600.0,
+        jitter: float = 0.1,
+        max_postings: int = 100_000
+    ):
+        """
+        Initialize the refresher.
+
+        Args:
+            scraper: Scraper used to pull the job boards
+            interval: Seconds between successful refreshes
+            max_backoff: Upper bound of the delay after repeated failures
+            jitter: Relative random spread applied to every delay
+            max_postings: Maximum number of postings kept in the snapshot
+        """
+        self.scraper = scraper
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_postings = max_postings
+
+        self.snapshot: Optional[VacancySnapshot] = None
+        self.consecutive_failures = 0
+        self.last_refresh_at: Optional[float] = None
+        self.last_refresh_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.next_refresh_at: Optional[float] = None
+        # Postings of the snapshot; new postings near-duplicating one are dropped
+        self.duplicates_index = NearDuplicateIndex(threshold=scraper.duplicate_threshold)
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _publish(self, vacancies: Iterable[Dict]) -> None:
+        """Merge new vacancies into the current snapshot and publish it."""
+        merged: Dict[tuple, Dict] = {}
+        previous = self.snapshot.vacancies if self.snapshot is not None else ()
+        candidates = list(vacancies) + list(previous)
+        for vacancy in candidates:
+            merged.setdefault(source_posting_key(vacancy), vacancy)
+            if len(merged) >= self.max_postings:
+                break
+        # Postings trimmed from the snapshot no longer shadow new ones
+        for vacancy in candidates:
+            key = source_posting_key(vacancy)
+            if key not in merged:
+                self.duplicates_index.remove(key)
+        # Swapping the reference is atomic, so readers always see a complete snapshot
+        self.snapshot = VacancySnapshot(merged.values())
+
+    def next_delay(self) -> float:
+        """Return the delay before the next refresh, including backoff and jitter."""
+        delay = min(self.interval * (2 ** self.consecutive_failures), self.max_backoff)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def refresh_once(self) -> bool:
+        """
+        Pull all sources once and publish the merged snapshot.
+
+        The snapshot is only replaced when new postings arrived, so its age
+        keeps counting from the last refresh that changed the data.
+
+        Returns:
+            True if at least one source answered successfully
+        """
+        started = time.monotonic()
+        try:
+            vacancies = self.scraper.fetch_all_vacancies(
+                incremental=True, duplicates_index=self.duplicates_index
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            self.last_error = str(e)
+            self.consecutive_failures += 1
+            return False
+        finally:
+            self.last_refresh_duration = time.monotonic() - started
+
+        self.last_refresh_at = time.time()
+        stats = self.scraper.last_fetch_stats
+        if stats and all(source["status"] != "ok" for source in stats.values()):
+            self.last_error = "All sources failed"
+            self.consecutive_failures += 1
+        else:
+            self.last_error = None
+            self.consecutive_failures = 0
+
+        if vacancies:
+            self._publish(vacancies)
+        return self.consecutive_failures == 0
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh_once()
+            delay = self.next_delay()
+            self.next_refresh_at = time.time() + delay
+            self._stop.wait(delay)
+
+    def start(self) -> None:
+        """Publish the stored postings and start the background refresh thread."""
+        if self.running:
+            return
+        if self.snapshot is None:
+            self._publish(self.scraper.get_cached_vacancies())
+            for vacancy in self.snapshot.vacancies:
+                self.duplicates_index.add(source_posting_key(vacancy), posting_text(vacancy))
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="vacancy-refresher",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def status(self) -> Dict:
+        """Return snapshot age, refresh timings and per-source fetch stats."""
+        return {
+            "running": self.running,
+            "snapshot_size": len(self.snapshot) if self.snapshot is not None else 0,
+            "snapshot_age_s": round(self.snapshot.age(), 1) if self.snapshot is not None else None,
+            "last_refresh_at": self.last_refresh_at,
+            "last_refresh_duration_s": (
+                round(self.last_refresh_duration, 3)
+                if self.last_refresh_duration is not None else None
+            ),
+            "next_refresh_in_s": (
+                round(max(0.0, self.next_refresh_at - time.time()), 1)
+                if self.next_refresh_at is not None else None
+            ),
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+            "sources": self.scraper.last_fetch_stats,
+        }
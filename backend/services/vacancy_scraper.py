@@ -5,91 +5,349 @@ This module provides functionality to scrape vacancies from job boards and APIs.
 """
 
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 
+from backend.services.vacancy_store import VacancyStore, source_posting_key
+from backend.utils.dedup import NearDuplicateIndex
+from backend.utils.skill_matcher import find_skills
+
 
 class VacancyScraper:
     """Scraper for fetching job vacancies from multiple sources."""
 
-    def __init__(self):
-        """Initialize the vacancy scraper."""
-        self.cache_dir = Path(__file__).parent.parent.parent / "data" / "vacancy_cache"
+    ARBEITNOW_URL = "https://www.arbeitnow.com/api/job-board-api"
+    REMOTIVE_URL = "https://remotive.com/api/remote-jobs"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        request_timeout: float = 10.0,
+        source_deadline: float = 8.0,
+        max_workers: int = 8,
+        duplicate_threshold: float = 0.8
+    ):
+        """
+        Initialize the vacancy scraper.
+
+        Args:
+            cache_dir: Directory for cached vacancies (defaults to data/vacancy_cache)
+            request_timeout: Socket timeout for a single HTTP request, in seconds
+            source_deadline: Default wall-clock budget per source in fetch_all_vacancies
+            max_workers: Number of sources fetched in parallel
+            duplicate_threshold: Estimated Jaccard similarity of title, company
+                and description shingles at which postings are collapsed
+        """
+        self.cache_dir = cache_dir or Path(__file__).parent.parent.parent / "data" / "vacancy_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "vacancies.json"
+        self.store = VacancyStore(self.cache_dir / "vacancies.db")
+        # Cache writes happen on one background thread, off the request path
+        self._cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vacancy-cache")
+        self._import_legacy_cache()
+        self.high_water_file = self.cache_dir / "high_water.json"
+        self.high_water_marks = self._load_high_water_marks()
+        self._high_water_lock = threading.Lock()
+
+        self.request_timeout = request_timeout
+        self.source_deadline = source_deadline
+        # Per-source overrides of source_deadline, keyed by source name
+        self.source_deadlines: Dict[str, float] = {}
+        self.duplicate_threshold = duplicate_threshold
+
+        # One keep-alive connection pool shared by all sources and threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Fetchers record their last error and pending high-water marks here;
+        # each runs in its own worker thread
+        self._local = threading.local()
+        # Per-source status, duration and size of the last fetch_all_vacancies call
+        self.last_fetch_stats: Dict[str, Dict] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="vacancy-fetch"
+        )
+
+        # Source fetchers, called as fetch(job_title, incremental=...)
+        self.sources: Dict[str, Callable[..., List[Dict]]] = {
+            "arbeitnow": self.fetch_from_arbeitnow,
+            "remotive": self.fetch_from_remotive,
+        }
+
+    def _load_high_water_marks(self) -> Dict[str, Dict]:
+        """Load the last seen posting per source from disk."""
+        try:
+            if self.high_water_file.exists():
+                with open(self.high_water_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Error reading high-water marks: {e}")
+        return {}
+
+    def _save_high_water_marks(self, marks: Dict[str, Dict]) -> None:
+        """Remember the newest postings seen per source, replacing the file atomically."""
+        if not marks:
+            return
+        with self._high_water_lock:
+            self.high_water_marks.update(marks)
+            temp_file = self.high_water_file.with_suffix(".json.tmp")
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.high_water_marks, f)
+                os.replace(temp_file, self.high_water_file)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Error writing high-water marks: {e}")
+
+    def _advance_high_water_mark(self, source: str, mark: Dict) -> None:
+        """
+        Record a new high-water mark for a source.
 
-    def fetch_from_arbeitnow(self, job_title: Optional[str] = None) -> List[Dict]:
+        Inside fetch_all_vacancies the mark is only kept as pending and is
+        saved once the source's results were used; direct fetcher calls save
+        it at once.
         """
-        Fetch vacancies from Arbeitnow API (free, no auth required).
+        pending = getattr(self._local, "pending_marks", None)
+        if pending is not None:
+            pending[source] = mark
+        else:
+            self._save_high_water_marks({source: mark})
+
+    def iter_arbeitnow_jobs(
+        self,
+        since: Optional[Dict] = None,
+        max_pages: Optional[int] = None,
+        deadline: Optional[float] = None,
+        start_url: Optional[str] = None,
+        status: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        """
+        Lazily walk the Arbeitnow job board page by page, newest postings first.
 
-        Args:
-            job_title: Optional job title to search for
+        Pages are requested only when the consumer asks for more jobs, so
+        breaking out of the loop stops the download.
 
-        Returns:
-            List of vacancy dictionaries
+        Args:
+            since: High-water mark ({"slug", "created_at"}); the walk stops at it
+            max_pages: Maximum number of pages to request
+            deadline: time.monotonic() value after which no new page is requested
+            start_url: Page to start from instead of the first one
+            status: Optional dictionary filled with "pages" (pages read), "url"
+                (last page read) and "complete" (True once the walk reached
+                since or the last page)
+
+        Yields:
+            Raw job dictionaries from the API
         """
-        try:
-            url = "https://www.arbeitnow.com/api/job-board-api"
-            response = requests.get(url, timeout=10)
+        status = {} if status is None else status
+        status.update(pages=0, url=None, complete=False)
+        url = start_url or self.ARBEITNOW_URL
+        if max_pages is not None and max_pages <= 0:
+            return
+        while url:
+            response = self.session.get(url, timeout=self.request_timeout)
             response.raise_for_status()
-
             data = response.json()
-            vacancies = []
+            status["pages"] += 1
+            status["url"] = url
 
             for job in data.get("data", []):
-                # Extract skills from tags
-                skills = [tag.lower() for tag in job.get("tags", [])]
+                if since and (
+                    job.get("slug") == since.get("slug")
+                    or job.get("created_at", 0) < since.get("created_at", 0)
+                ):
+                    status["complete"] = True
+                    return
+                yield job
+
+            url = (data.get("links") or {}).get("next")
+            if not url:
+                status["complete"] = True
+                return
+            if max_pages is not None and status["pages"] >= max_pages:
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+
+    def _normalize_arbeitnow_job(self, job: Dict) -> Dict:
+        """Convert a raw Arbeitnow job into the common vacancy format."""
+        description = job.get("description", "")
+        return {
+            "title": job.get("title", ""),
+            "company": job.get("company_name", "Unknown Company"),
+            "description": description,
+            "location": job.get("location", "Remote"),
+            "url": job.get("url", ""),
+            # Extract skills from tags
+            "required_skills": [tag.lower() for tag in job.get("tags", [])],
+            "experience_required": self._extract_experience(description),
+            "source": "arbeitnow"
+        }
+
+    def fetch_from_arbeitnow(
+        self,
+        job_title: Optional[str] = None,
+        max_results: int = 50,
+        max_pages: int = 10,
+        incremental: bool = False
+    ) -> List[Dict]:
+        """
+        Fetch vacancies from Arbeitnow API (free, no auth required).
 
-                vacancy = {
-                    "title": job.get("title", ""),
-                    "company": job.get("company_name", "Unknown Company"),
-                    "description": job.get("description", ""),
-                    "location": job.get("location", "Remote"),
-                    "url": job.get("url", ""),
-                    "required_skills": skills,
-                    "experience_required": self._extract_experience(
-                        job.get("description", "")
-                    ),
-                    "source": "arbeitnow"
-                }
+        Pages are walked lazily until max_results matching vacancies are
+        found, max_pages pages were read or half of the source deadline has
+        passed.
+
+        An incremental walk that stops before reaching the high-water mark
+        leaves a resume cursor instead of advancing the mark: the next walk
+        first collects postings newer than the previous walk, then continues
+        from the last page read down to the mark.
+
+        Args:
+            job_title: Optional job title to search for
+            max_results: Stop once this many matching vacancies are found
+            max_pages: Maximum number of pages to request
+            incremental: Only return postings newer than the stored high-water
+                mark and advance it. Incremental walks ignore max_results so
+                that no new posting is skipped.
+
+        Returns:
+            List of vacancy dictionaries
+        """
+        mark = (self.high_water_marks.get("arbeitnow") or {}) if incremental else {}
+        floor = {key: mark[key] for key in ("slug", "created_at") if key in mark} or None
+        resume = mark.get("resume")
+        deadline = time.monotonic() + self.source_deadlines.get("arbeitnow", self.source_deadline) / 2
+        vacancies = []
+        newest = oldest = after = None
+        new_walk: Dict = {}
+        gap_walk: Dict = {}
+
+        def walk(jobs: Iterator[Dict], skip_after: Optional[Dict] = None) -> None:
+            """Collect matching jobs, tracking the newest and oldest position walked."""
+            nonlocal newest, oldest
+            for job in jobs:
+                position = {"slug": job.get("slug"), "created_at": job.get("created_at", 0)}
+                if newest is None:
+                    newest = position
+                if skip_after and (
+                    position["created_at"] > skip_after["created_at"]
+                    or position["slug"] == skip_after["slug"]
+                ):
+                    # Already returned by the interrupted walk
+                    continue
+                oldest = position
 
                 # Filter by job title if provided
-                if job_title:
-                    if job_title.lower() in vacancy["title"].lower():
-                        vacancies.append(vacancy)
-                else:
-                    vacancies.append(vacancy)
+                if job_title and job_title.lower() not in job.get("title", "").lower():
+                    continue
 
-            return vacancies
+                vacancies.append(self._normalize_arbeitnow_job(job))
+                if not incremental and len(vacancies) >= max_results:
+                    break
+
+        try:
+            if resume:
+                walk(self.iter_arbeitnow_jobs(
+                    since=resume["after"], max_pages=max_pages, deadline=deadline, status=new_walk
+                ))
+                if new_walk["complete"]:
+                    # Resume the gap below the postings of the interrupted walk
+                    after, newest, oldest = newest or resume["after"], resume["after"], None
+                    walk(self.iter_arbeitnow_jobs(
+                        since=floor,
+                        max_pages=max_pages - new_walk["pages"],
+                        deadline=deadline,
+                        start_url=resume["url"],
+                        status=gap_walk
+                    ), skip_after=resume["before"])
+            else:
+                walk(self.iter_arbeitnow_jobs(
+                    since=floor, max_pages=max_pages, deadline=deadline, status=gap_walk
+                ))
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching from Arbeitnow: {e}")
-            return []
-
-    def fetch_from_remotive(self, job_title: Optional[str] = None) -> List[Dict]:
+            self._local.error = str(e)
+
+        if incremental:
+            candidate = None
+            if resume:
+                # An unfinished walk over the new postings leaves two gaps;
+                # keep the old cursor and return those postings again next time
+                if new_walk.get("complete"):
+                    if gap_walk.get("complete"):
+                        candidate = after
+                    else:
+                        candidate = dict(floor or {}, resume={
+                            "url": gap_walk.get("url") or resume["url"],
+                            "after": after,
+                            "before": oldest or resume["before"],
+                        })
+            elif newest is not None:
+                if gap_walk.get("complete"):
+                    candidate = newest
+                elif gap_walk.get("url"):
+                    candidate = dict(floor or {}, resume={
+                        "url": gap_walk["url"], "after": newest, "before": oldest
+                    })
+            if candidate is not None:
+                self._advance_high_water_mark("arbeitnow", candidate)
+
+        return vacancies
+
+    def fetch_from_remotive(
+        self,
+        job_title: Optional[str] = None,
+        max_results: int = 50,
+        incremental: bool = False
+    ) -> List[Dict]:
         """
         Fetch vacancies from Remotive API (free remote jobs).
 
         Args:
             job_title: Optional job title to search for
+            max_results: Maximum number of vacancies requested from the API
+            incremental: Only return postings published after the stored
+                high-water mark and advance it
 
         Returns:
             List of vacancy dictionaries
         """
+        since = self.high_water_marks.get("remotive") if incremental else None
+
         try:
-            url = "https://remotive.com/api/remote-jobs"
             params = {}
             if job_title:
                 params["search"] = job_title
-
-            response = requests.get(url, params=params, timeout=10)
+            if not incremental:
+                params["limit"] = max_results
+
+            response = self.session.get(
+                self.REMOTIVE_URL,
+                params=params,
+                timeout=self.request_timeout
+            )
             response.raise_for_status()
 
             data = response.json()
             vacancies = []
+            newest_date = since.get("publication_date", "") if since else ""
+
+            for job in data.get("jobs", []):
+                publication_date = job.get("publication_date", "")
+                if since and publication_date <= since.get("publication_date", ""):
+                    continue
+                newest_date = max(newest_date, publication_date)
 
-            for job in data.get("jobs", [])[:50]:  # Limit to 50 jobs
                 # Extract skills from description
                 description = job.get("description", "")
                 skills = self._extract_skills_from_text(description)
@@ -106,58 +364,149 @@ class VacancyScraper:
                 }
 
                 vacancies.append(vacancy)
+                if not incremental and len(vacancies) >= max_results:
+                    break
+
+            if incremental and newest_date:
+                self._advance_high_water_mark("remotive", {"publication_date": newest_date})
 
             return vacancies
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching from Remotive: {e}")
+            self._local.error = str(e)
             return []
 
-    def fetch_all_vacancies(self, job_title: Optional[str] = None) -> List[Dict]:
+    def _timed_fetch(
+        self,
+        fetch: Callable[..., List[Dict]],
+        job_title: Optional[str],
+        incremental: bool
+    ) -> Tuple[List[Dict], float, Optional[str], Dict[str, Dict]]:
+        """Run one source fetcher, returning its vacancies, duration, error and pending marks."""
+        self._local.error = None
+        self._local.pending_marks = {}
+        started = time.monotonic()
+        try:
+            vacancies = fetch(job_title, incremental=incremental)
+            return vacancies, time.monotonic() - started, self._local.error, self._local.pending_marks
+        finally:
+            self._local.pending_marks = None
+
+    def fetch_all_vacancies(
+        self,
+        job_title: Optional[str] = None,
+        incremental: bool = False,
+        duplicates_index: Optional[NearDuplicateIndex] = None
+    ) -> List[Dict]:
         """
-        Fetch vacancies from all available sources.
+        Fetch vacancies from all available sources concurrently.
+
+        Every source runs in its own worker thread. A source that misses its
+        deadline is skipped, so the call returns the partial results of the
+        sources that did answer in time; its high-water mark is not advanced,
+        so the postings are fetched again next time. Near-duplicate postings (the same job
+        on several boards, or re-posted with small edits) are collapsed as
+        each source's results arrive, keeping the first one seen.
 
         Args:
             job_title: Optional job title to search for
+            incremental: Only fetch postings newer than each source's high-water mark
+            duplicates_index: Index of postings seen so far, updated in place; postings
+                that near-duplicate one of them are dropped. A fresh index is used when omitted
 
         Returns:
-            Combined list of vacancies from all sources
+            Combined list of distinct vacancies from all sources
         """
+        started = time.monotonic()
+        if duplicates_index is None:
+            duplicates_index = NearDuplicateIndex(threshold=self.duplicate_threshold)
+        futures = {
+            name: self._executor.submit(self._timed_fetch, fetch, job_title, incremental)
+            for name, fetch in self.sources.items()
+        }
+
         all_vacancies = []
+        kept = set()
+        fetch_stats = {}
+        for name, future in futures.items():
+            deadline = self.source_deadlines.get(name, self.source_deadline)
+            remaining = max(0.0, started + deadline - time.monotonic())
+            try:
+                vacancies, duration, error, marks = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                print(f"Source {name} exceeded its {deadline}s deadline, skipping")
+                fetch_stats[name] = {
+                    "status": "timeout",
+                    "duration_s": round(time.monotonic() - started, 3),
+                    "vacancies": 0,
+                }
+                continue
+
+            self._save_high_water_marks(marks)
+            duplicates = 0
+            for vacancy in vacancies:
+                key = source_posting_key(vacancy)
+                duplicate = duplicates_index.add(key, posting_text(vacancy))
+                # A posting fetched again matches itself and is kept, so edits get through
+                if (duplicate is None or duplicate == key) and key not in kept:
+                    kept.add(key)
+                    all_vacancies.append(vacancy)
+                else:
+                    duplicates += 1
+            fetch_stats[name] = {
+                "status": "error" if error else "ok",
+                "duration_s": round(duration, 3),
+                "vacancies": len(vacancies) - duplicates,
+                "duplicates": duplicates,
+            }
 
-        # Fetch from all sources
-        all_vacancies.extend(self.fetch_from_arbeitnow(job_title))
-        all_vacancies.extend(self.fetch_from_remotive(job_title))
+        self.last_fetch_stats = fetch_stats
 
         # Cache the results
-        self._cache_vacancies(all_vacancies)
+        self._cache_vacancies(all_vacancies, job_title)
 
         return all_vacancies
 
-    def get_cached_vacancies(self) -> List[Dict]:
+    def get_cached_vacancies(self, job_title: Optional[str] = None) -> List[Dict]:
         """
         Get vacancies from cache.
 
+        Args:
+            job_title: Optional job title; returns the postings cached for it
+
         Returns:
-            List of cached vacancies, empty list if cache doesn't exist
+            List of cached vacancies, empty list if nothing is cached
         """
         try:
-            if self.cache_file.exists():
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
+            return self.store.get(job_title)
+        except sqlite3.Error as e:
             print(f"Error reading cache: {e}")
+            return []
 
-        return []
-
-    def _cache_vacancies(self, vacancies: List[Dict]) -> None:
-        """Save vacancies to cache file."""
+    def _write_cache(self, vacancies: List[Dict], job_title: Optional[str]) -> None:
+        """Write vacancies to the store; runs on the cache writer thread."""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(vacancies, f, ensure_ascii=False, indent=2)
-        except IOError as e:
+            self.store.upsert(vacancies, query=job_title)
+        except sqlite3.Error as e:
             print(f"Error writing cache: {e}")
 
+    def _cache_vacancies(self, vacancies: List[Dict], job_title: Optional[str] = None) -> Future:
+        """Queue vacancies for the store without blocking the caller."""
+        return self._cache_writer.submit(self._write_cache, vacancies, job_title)
+
+    def _import_legacy_cache(self) -> None:
+        """Move vacancies from the old single-file JSON cache into the store."""
+        legacy_file = self.cache_dir / "vacancies.json"
+        if not legacy_file.exists():
+            return
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                self.store.upsert(json.load(f))
+            legacy_file.rename(legacy_file.with_suffix(".json.imported"))
+        except (IOError, json.JSONDecodeError, sqlite3.Error) as e:
+            print(f"Error importing legacy cache: {e}")
+
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """
         Extract common tech skills from job description text.
@@ -168,101 +517,7 @@ class VacancyScraper:
         Returns:
             List of extracted skills
         """
-        common_skills = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c',
-            'ruby', 'php', 'go', 'golang', 'rust', 'swift', 'kotlin', 'scala',
-            'r', 'matlab', 'perl', 'shell', 'bash', 'powershell', 'vba',
-            'objective-c', 'dart', 'elixir', 'haskell', 'lua', 'groovy',
-            
-            # Web Frontend
-            'react', 'angular', 'vue', 'vue.js', 'svelte', 'next.js', 'nuxt.js',
-            'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'tailwind',
-            'bootstrap', 'material-ui', 'chakra ui', 'jquery', 'webpack',
-            'vite', 'babel', 'responsive design', 'ui/ux', 'figma', 'sketch',
-            
-            # Backend & Frameworks
-            'node.js', 'express', 'django', 'flask', 'fastapi', 'spring',
-            'spring boot', '.net', 'asp.net', 'laravel', 'symfony', 'rails',
-            'ruby on rails', 'gin', 'echo', 'nest.js', 'koa', 'strapi',
-            
-            # Databases
-            'sql', 'nosql', 'postgresql', 'mysql', 'mongodb', 'redis',
-            'cassandra', 'elasticsearch', 'oracle', 'sql server', 'mariadb',
-            'dynamodb', 'firebase', 'couchdb', 'neo4j', 'influxdb', 'sqlite',
-            
-            # DevOps & Cloud
-            'docker', 'kubernetes', 'k8s', 'aws', 'azure', 'gcp',
-            'google cloud', 'heroku', 'digital ocean', 'terraform', 'ansible',
-            'jenkins', 'gitlab ci', 'github actions', 'circleci', 'travis ci',
-            'ci/cd', 'devops', 'linux', 'unix', 'nginx', 'apache',
-            
-            # Data Science & ML
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-            'keras', 'scikit-learn', 'pandas', 'numpy', 'scipy', 'matplotlib',
-            'seaborn', 'plotly', 'data analysis', 'data science', 'statistics',
-            'nlp', 'computer vision', 'opencv', 'spacy', 'nltk', 'transformers',
-            'bert', 'gpt', 'neural networks', 'cnn', 'rnn', 'lstm',
-            
-            # Mobile Development
-            'android', 'ios', 'react native', 'flutter', 'xamarin',
-            'ionic', 'cordova', 'swift ui', 'jetpack compose',
-            
-            # Version Control & Tools
-            'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial',
-            
-            # Testing
-            'unit testing', 'integration testing', 'pytest', 'jest', 'mocha',
-            'selenium', 'cypress', 'junit', 'testng', 'jasmine', 'karma',
-            
-            # APIs & Architecture
-            'rest api', 'restful', 'graphql', 'soap', 'grpc', 'websocket',
-            'microservices', 'monolith', 'event-driven', 'serverless',
-            'lambda', 'api gateway', 'message queue', 'rabbitmq', 'kafka',
-            
-            # Methodologies & Practices
-            'agile', 'scrum', 'kanban', 'waterfall', 'tdd', 'bdd', 'ci/cd',
-            'pair programming', 'code review', 'design patterns', 'solid',
-            
-            # Project Management & Collaboration
-            'jira', 'confluence', 'trello', 'asana', 'slack', 'teams',
-            'notion', 'monday.com',
-            
-            # Security
-            'oauth', 'jwt', 'ssl', 'tls', 'encryption', 'security',
-            'penetration testing', 'owasp',
-            
-            # Other Technologies
-            'blockchain', 'ethereum', 'solidity', 'web3', 'smart contracts',
-            'iot', 'edge computing', 'big data', 'hadoop', 'spark',
-            'etl', 'data warehouse', 'power bi', 'tableau', 'looker',
-            
-            # Soft Skills
-            'communication', 'leadership', 'teamwork', 'problem solving',
-            'critical thinking', 'time management', 'adaptability',
-            
-            # HR & Recruitment Skills
-            'recruitment', 'talent acquisition', 'sourcing', 'interviewing',
-            'onboarding', 'hr management', 'applicant tracking', 'ats',
-            'linkedin recruiter', 'boolean search', 'candidate screening',
-            'employer branding', 'crm', 'zoho', 'hubspot', 'greenhouse',
-            'workday', 'bamboohr', 'performance management',
-            
-            # Business & Management
-            'project management', 'product management', 'business analysis',
-            'stakeholder management', 'budget management', 'strategic planning',
-            'kpi', 'roi', 'excel', 'powerpoint', 'word', 'google sheets',
-            'salesforce', 'erp', 'sap', 'crm systems'
-        ]
-
-        text_lower = text.lower()
-        found_skills = []
-
-        for skill in common_skills:
-            if skill in text_lower:
-                found_skills.append(skill)
-
-        return list(set(found_skills))
+        return find_skills(text)
 
     def _extract_experience(self, text: str) -> int:
         """
@@ -274,19 +529,37 @@ class VacancyScraper:
         Returns:
             Number of years of experience required
         """
-        import re
+        return extract_required_experience(text)
+
+
+def posting_text(vacancy: Dict) -> str:
+    """Return the text compared when looking for near-duplicate postings."""
+    return " ".join(
+        vacancy.get(field) or "" for field in ("title", "company", "description")
+    )
+
+
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?experience'),
+    re.compile(r'experience[:\s]+(\d+)\+?\s*(?:years?|yrs?)'),
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s+in'),
+]
+
+
+def extract_required_experience(text: str) -> int:
+    """
+    Extract required years of experience from a job description.
 
-        patterns = [
-            r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?experience',
-            r'experience[:\s]+(\d+)\+?\s*(?:years?|yrs?)',
-            r'(\d+)\+?\s*(?:years?|yrs?)\s+in',
-        ]
+    Args:
+        text: Job description text
 
-        text_lower = text.lower()
-        years = []
+    Returns:
+        Number of years of experience required
+    """
+    text_lower = text.lower()
+    years = []
 
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            years.extend([int(match) for match in matches])
+    for pattern in EXPERIENCE_PATTERNS:
+        years.extend(int(match) for match in pattern.findall(text_lower))
 
-        return max(years) if years else 0
+    return max(years) if years else 0
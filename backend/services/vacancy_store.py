@@ -0,0 +1,163 @@
+"""
+Persistent store for scraped vacancies.
+
+This module keeps scraped postings in a SQLite database (WAL mode) keyed by
+source and posting URL, and remembers which postings each search returned.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (source, url)
+);
+CREATE INDEX IF NOT EXISTS ix_postings_fetched_at ON postings (fetched_at);
+CREATE TABLE IF NOT EXISTS query_results (
+    query TEXT NOT NULL,
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (query, source, url)
+);
+"""
+
+
+def normalize_query(job_title: Optional[str]) -> str:
+    """Normalise a job title into the key used for per-query results."""
+    return " ".join(job_title.lower().split()) if job_title else ""
+
+
+def posting_key(vacancy: Dict) -> str:
+    """Return the identity of a posting within its source."""
+    return vacancy.get("url") or f"{vacancy.get('title', '')}|{vacancy.get('company', '')}"
+
+
+def source_posting_key(vacancy: Dict) -> Tuple[str, str]:
+    """Return the identity of a posting across all sources."""
+    return vacancy.get("source", "unknown"), posting_key(vacancy)
+
+
+class VacancyStore:
+    """SQLite-backed store of scraped postings with per-query result lists."""
+
+    def __init__(self, db_path: Path, busy_timeout_ms: int = 5000):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            db_path: Path of the SQLite database file
+            busy_timeout_ms: How long a writer waits for a lock before failing
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.connection = connection
+        return connection
+
+    def upsert(self, vacancies: Iterable[Dict], query: Optional[str] = None) -> int:
+        """
+        Insert or update postings in one transaction.
+
+        Args:
+            vacancies: Vacancy dictionaries to store
+            query: Job title the vacancies were fetched for; replaces the
+                previously stored result list of that query
+
+        Returns:
+            Number of postings written
+        """
+        now = time.time()
+        rows = [
+            (
+                vacancy.get("source", "unknown"),
+                posting_key(vacancy),
+                vacancy.get("title", ""),
+                json.dumps(vacancy, ensure_ascii=False),
+                now,
+            )
+            for vacancy in vacancies
+        ]
+
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                """
+                INSERT INTO postings (source, url, title, payload, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source, url) DO UPDATE SET
+                    title = excluded.title,
+                    payload = excluded.payload,
+                    fetched_at = excluded.fetched_at
+                """,
+                rows
+            )
+            if query is not None:
+                key = normalize_query(query)
+                connection.execute("DELETE FROM query_results WHERE query = ?", (key,))
+                connection.executemany(
+                    "INSERT OR IGNORE INTO query_results (query, source, url, rank) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(key, row[0], row[1], rank) for rank, row in enumerate(rows)]
+                )
+        return len(rows)
+
+    def get(self, query: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Read stored postings.
+
+        Args:
+            query: Job title; returns that query's stored result list, or
+                postings whose title contains it when the query was never stored
+            limit: Maximum number of postings to return
+
+        Returns:
+            List of vacancy dictionaries
+        """
+        connection = self._connect()
+        limit_sql = "" if limit is None else f" LIMIT {int(limit)}"
+
+        if query:
+            key = normalize_query(query)
+            rows = connection.execute(
+                "SELECT p.payload FROM query_results q "
+                "JOIN postings p ON p.source = q.source AND p.url = q.url "
+                "WHERE q.query = ? ORDER BY q.rank" + limit_sql,
+                (key,)
+            ).fetchall()
+            if not rows:
+                rows = connection.execute(
+                    "SELECT payload FROM postings WHERE lower(title) LIKE ? "
+                    "ORDER BY fetched_at DESC" + limit_sql,
+                    (f"%{key}%",)
+                ).fetchall()
+        else:
+            rows = connection.execute(
+                "SELECT payload FROM postings ORDER BY fetched_at DESC" + limit_sql
+            ).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self) -> int:
+        """Return the number of stored postings."""
+        return self._connect().execute("SELECT COUNT(*) FROM postings").fetchone()[0]
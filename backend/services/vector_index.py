@@ -0,0 +1,306 @@
+"""
+Dense vector index service for approximate nearest-neighbour vacancy search.
+
+This module provides CPU-only text embedders and a FAISS-backed IVF/HNSW index
+that RAGService can use instead of exact TF-IDF scoring.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+try:
+    import faiss
+except ImportError:
+    faiss = None  # type: ignore
+
+
+class HashingEmbedder:
+    """Deterministic, dependency-free embedder built on hashed word n-grams."""
+
+    def __init__(self, dim: int = 256):
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Dimension of the produced vectors
+        """
+        self.dim = dim
+        self._vectorizer = HashingVectorizer(
+            n_features=dim,
+            ngram_range=(1, 2),
+            alternate_sign=True,
+            norm='l2'
+        )
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into L2-normalised float32 vectors."""
+        return self._vectorizer.transform(texts).toarray().astype(np.float32)
+
+
+class TransformerEmbedder:
+    """Mean-pooled sentence embeddings from a local Hugging Face model on CPU."""
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        batch_size: int = 32,
+        max_length: int = 256
+    ):
+        """
+        Initialize the embedder. Model weights are loaded on first use.
+
+        Args:
+            model_name: Hugging Face model name or local path
+            batch_size: Number of texts encoded per forward pass
+            max_length: Maximum number of tokens per text
+        """
+        from transformers import AutoConfig  # pylint: disable=import-outside-toplevel
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self._tokenizer = None
+        self._model = None
+        self.dim = AutoConfig.from_pretrained(model_name).hidden_size
+
+    def _load(self):
+        if self._model is None:
+            from transformers import AutoModel, AutoTokenizer  # pylint: disable=import-outside-toplevel
+
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self._model = AutoModel.from_pretrained(self.model_name).eval()
+        return self._tokenizer, self._model
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_tokenizer"] = None
+        state["_model"] = None
+        return state
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into L2-normalised float32 vectors."""
+        import torch  # pylint: disable=import-outside-toplevel
+
+        tokenizer, model = self._load()
+        batches = []
+        with torch.no_grad():
+            for start in range(0, len(texts), self.batch_size):
+                encoded = tokenizer(
+                    list(texts[start:start + self.batch_size]),
+                    padding=True,
+                    truncation=True,
+                    max_length=self.max_length,
+                    return_tensors="pt"
+                )
+                hidden = model(**encoded).last_hidden_state
+                mask = encoded["attention_mask"].unsqueeze(-1).float()
+                pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+                pooled = torch.nn.functional.normalize(pooled, dim=1)
+                batches.append(pooled.numpy().astype(np.float32))
+
+        if not batches:
+            return np.empty((0, self.dim), dtype=np.float32)
+        return np.vstack(batches)
+
+
+class DenseVectorIndex:
+    """
+    Approximate nearest-neighbour index over dense text embeddings.
+
+    Vectors are L2-normalised, so inner-product scores are cosine similarities.
+    Supported index types are "hnsw" (graph based, tuned with ef_search),
+    "ivf" (inverted lists, tuned with nprobe) and "flat" (exact search).
+    """
+
+    INDEX_TYPES = ("hnsw", "ivf", "flat")
+
+    def __init__(
+        self,
+        embedder=None,
+        index_type: str = "hnsw",
+        nlist: int = 256,
+        nprobe: int = 8,
+        hnsw_m: int = 32,
+        ef_construction: int = 80,
+        ef_search: int = 64
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            embedder: Object with a ``dim`` attribute and ``encode(texts)`` method
+            index_type: One of "hnsw", "ivf" or "flat"
+            nlist: Number of IVF clusters (capped by the size of the first batch)
+            nprobe: Number of IVF clusters visited per query
+            hnsw_m: Number of HNSW graph neighbours per node
+            ef_construction: HNSW candidate list size while building
+            ef_search: HNSW candidate list size while searching
+        """
+        if faiss is None:
+            raise ImportError("faiss not installed. Install it with: pip install faiss-cpu")
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {index_type}")
+
+        self.embedder = embedder or HashingEmbedder()
+        self.dim = self.embedder.dim
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._index = None
+
+    def __len__(self) -> int:
+        return 0 if self._index is None else self._index.ntotal
+
+    def _build(self, training_vectors: np.ndarray):
+        if self.index_type == "hnsw":
+            hnsw = faiss.IndexHNSWFlat(self.dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            hnsw.hnsw.efConstruction = self.ef_construction
+            return faiss.IndexIDMap2(hnsw)
+
+        if self.index_type == "ivf":
+            nlist = max(1, min(self.nlist, len(training_vectors)))
+            quantizer = faiss.IndexFlatIP(self.dim)
+            ivf = faiss.IndexIVFFlat(quantizer, self.dim, nlist, faiss.METRIC_INNER_PRODUCT)
+            ivf.train(training_vectors)
+            return ivf
+
+        return faiss.IndexIDMap2(faiss.IndexFlatIP(self.dim))
+
+    def _apply_search_params(self) -> None:
+        if self.index_type == "hnsw":
+            faiss.downcast_index(self._index.index).hnsw.efSearch = self.ef_search
+        elif self.index_type == "ivf":
+            self._index.nprobe = self.nprobe
+
+    def set_search_params(
+        self,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None
+    ) -> None:
+        """
+        Adjust the recall/latency trade-off of subsequent searches.
+
+        Args:
+            nprobe: IVF clusters visited per query
+            ef_search: HNSW candidate list size
+        """
+        if nprobe is not None:
+            self.nprobe = nprobe
+        if ef_search is not None:
+            self.ef_search = ef_search
+
+    def reset(self) -> None:
+        """Drop all indexed vectors."""
+        self._index = None
+
+    def add(self, texts: Sequence[str], ids: Sequence[int]) -> None:
+        """
+        Embed texts and add them to the index.
+
+        Args:
+            texts: Documents to index
+            ids: Integer identifiers returned by search, one per text
+        """
+        if len(texts) == 0:
+            return
+        self.add_vectors(self.embedder.encode(texts), ids)
+
+    def add_vectors(self, vectors: np.ndarray, ids: Sequence[int]) -> None:
+        """
+        Add vectors already produced by the embedder.
+
+        Args:
+            vectors: Float32 array shaped (len(ids), dim)
+            ids: Integer identifiers returned by search, one per vector
+        """
+        if len(vectors) == 0:
+            return
+        if self._index is None:
+            self._index = self._build(vectors)
+        self._index.add_with_ids(vectors, np.asarray(ids, dtype=np.int64))
+
+    @property
+    def supports_remove(self) -> bool:
+        """Whether vectors can be deleted; FAISS HNSW graphs cannot drop nodes."""
+        return self.index_type != "hnsw"
+
+    def remove(self, ids: Sequence[int]) -> int:
+        """
+        Delete vectors by id.
+
+        Args:
+            ids: Identifiers passed to add
+
+        Returns:
+            Number of vectors removed; 0 when the index type cannot delete
+        """
+        if self._index is None or not self.supports_remove or len(ids) == 0:
+            return 0
+        return int(self._index.remove_ids(np.asarray(ids, dtype=np.int64)))
+
+    def search(self, queries: Sequence[str], k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest documents for each query.
+
+        Args:
+            queries: Query texts
+            k: Number of neighbours per query
+
+        Returns:
+            Tuple of (scores, ids) arrays shaped (len(queries), k);
+            missing neighbours have id -1
+        """
+        if self._index is None or self._index.ntotal == 0 or k <= 0:
+            empty = np.empty((len(queries), 0))
+            return empty.astype(np.float32), empty.astype(np.int64)
+
+        self._apply_search_params()
+        return self._index.search(self.embedder.encode(queries), k)
+
+    def search_ids(self, queries: Sequence[str], k: int) -> List[List[int]]:
+        """Return neighbour ids per query, best first, with missing slots removed."""
+        _, ids = self.search(queries, k)
+        return [[int(i) for i in row if i >= 0] for row in ids]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Persist the index to a directory.
+
+        Args:
+            path: Target directory
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        if self._index is not None:
+            faiss.write_index(self._index, str(path / "index.faiss"))
+        state = self.__dict__.copy()
+        state["_index"] = None
+        joblib.dump(state, path / "config.joblib")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "DenseVectorIndex":
+        """
+        Load an index written by save.
+
+        Args:
+            path: Directory created by save
+
+        Returns:
+            Restored DenseVectorIndex
+        """
+        if faiss is None:
+            raise ImportError("faiss not installed. Install it with: pip install faiss-cpu")
+        path = Path(path)
+        index = cls.__new__(cls)
+        index.__dict__.update(joblib.load(path / "config.joblib"))
+        if (path / "index.faiss").exists():
+            index._index = faiss.read_index(str(path / "index.faiss"))  # pylint: disable=protected-access
+        return index
+
@@ -0,0 +1,39 @@
+from sqlalchemy import create_engine, select
+
+from backend.database.models import Base, Vacancy, VacancySkill
+from scripts.data_ingestion import load_vacancies, parse_skills
+
+CSV = """title,company,location,description,required_skills,experience_required,salary
+Backend Developer,Acme,Berlin,Python APIs with 3+ years of experience,"[""Python"", ""Django""]",,5000
+Data Engineer,Beta,,Spark and Kafka pipelines,,2,
+Frontend Developer,Gamma,Kyiv,React UI,"react; TypeScript",1,4000.5
+"""
+
+
+def test_load_vacancies_streams_chunks_into_engine(tmp_path):
+    csv_file = tmp_path / "vacancies.csv"
+    csv_file.write_text(CSV, encoding="utf-8")
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+
+    assert load_vacancies(csv_file, chunk_size=2, bind=engine) == 3
+
+    with engine.connect() as connection:
+        rows = connection.execute(select(Vacancy.__table__).order_by(Vacancy.id)).mappings().all()
+    assert [row["required_skills"] for row in rows] == [
+        ["python", "django"], ["kafka", "spark"], ["react", "typescript"]
+    ]
+    assert [row["experience_required"] for row in rows] == [3, 2, 1]
+    assert [row["location"] for row in rows] == ["Berlin", "Remote", "Kyiv"]
+    assert rows[1]["salary"] is None
+
+    with engine.connect() as connection:
+        kafka = connection.execute(
+            select(VacancySkill.vacancy_id).where(VacancySkill.skill == "kafka")
+        ).scalars().all()
+    assert kafka == [rows[1]["id"]]
+
+
+def test_parse_skills_formats():
+    assert parse_skills("Go, Rust ,") == ["go", "rust"]
+    assert parse_skills(None, "Docker and AWS") == ["aws", "docker"]
@@ -0,0 +1,49 @@
+from backend.utils.dedup import NearDuplicateIndex, shingles
+
+DESCRIPTION = (
+    "We are looking for a backend engineer to build Python services with FastAPI, "
+    "PostgreSQL and Kafka. You will own our data ingestion pipeline, work closely with "
+    "product and mentor junior developers. Remote within Europe, flexible hours."
+)
+
+
+def test_shingles_strip_html_and_case():
+    assert shingles("<p>Python  Developer</p>", size=3) == ["python developer"]
+    assert shingles("a b c d", size=3) == ["a b c", "b c d"]
+    assert shingles("", size=3) == []
+
+
+def test_near_duplicates_are_flagged_incrementally():
+    index = NearDuplicateIndex(threshold=0.7)
+    assert index.add("arbeitnow", "Backend Engineer Acme " + DESCRIPTION) is None
+    reposted = "Backend Engineer Acme GmbH " + DESCRIPTION.replace("flexible hours", "flexible hours!")
+    assert index.add("remotive", reposted) == "arbeitnow"
+    assert index.add("other", "Sales Manager Beta Sell enterprise software to retailers") is None
+    assert len(index) == 2
+
+
+def test_removed_texts_stop_matching():
+    index = NearDuplicateIndex(threshold=0.7)
+    index.add("arbeitnow", "Backend Engineer Acme " + DESCRIPTION)
+
+    assert index.remove("arbeitnow")
+    assert not index.remove("arbeitnow")
+    assert index.add("remotive", "Backend Engineer Acme GmbH " + DESCRIPTION) is None
+    assert len(index) == 1
+
+
+def test_readded_key_is_removed_from_its_old_bands():
+    index = NearDuplicateIndex(threshold=0.7)
+    index.add("k", "Backend Engineer Acme " + DESCRIPTION)
+    index.add("k", "Sales Manager Beta Sell enterprise software to retailers across Europe")
+
+    assert index.remove("k")
+    assert index.add("other", "Backend Engineer Acme " + DESCRIPTION) is None
+    assert len(index) == 1
+
+
+def test_empty_texts_are_never_duplicates():
+    index = NearDuplicateIndex()
+    assert index.add(1, "") is None
+    assert index.add(2, "   ") is None
+    assert len(index) == 0
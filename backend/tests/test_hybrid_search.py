@@ -0,0 +1,212 @@
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from backend.api.endpoints.vacancies import bulk_upsert_vacancies
+from backend.database.models import Vacancy
+from backend.database.session import create_db_engine, init_db
+from backend.services.hybrid_search import HybridSearch, dedup_key, reciprocal_rank_fusion
+
+RESUME = {"skills": ["python", "kafka"], "experience_years": 5}
+
+
+def make_engine(tmp_path, vacancies):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    init_db(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        db.add_all(Vacancy(**vacancy) for vacancy in vacancies)
+        db.commit()
+    return session_factory
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([np.array([3.0, 2.0, 1.0]), np.array([1.0, 3.0, 2.0])], k=1)
+    assert list(np.argsort(-fused, kind="stable")) == [1, 0, 2]
+
+
+def test_dedup_key_normalises_urls():
+    assert dedup_key({"url": "HTTPS://jobs/1/"}) == dedup_key({"url": "https://jobs/1"})
+    assert dedup_key({"title": "Dev", "company": "Acme"}) == "dev|acme"
+
+
+def test_search_merges_sources_and_dedupes_by_url(tmp_path):
+    session_factory = make_engine(tmp_path, [
+        {
+            "title": "Python Developer", "company": "Acme", "url": "https://jobs/1",
+            "description": "Python services", "required_skills": ["python"],
+        },
+        {
+            "title": "Data Engineer", "company": "Beta", "url": "https://jobs/2",
+            "description": "Kafka streaming pipelines in Python", "required_skills": ["kafka", "python"],
+        },
+    ])
+    scraped = [
+        {"title": "Python Developer", "company": "Acme", "url": "https://jobs/1/",
+         "source": "board", "required_skills": ["python"]},
+        {"title": "Python Engineer", "company": "Gamma", "url": "https://jobs/3",
+         "source": "board", "required_skills": ["go"]},
+    ]
+    search = HybridSearch(session_factory)
+    search.sync_rag_index()
+
+    candidates, scores, order = search.search(
+        "python", RESUME, "Kafka streaming pipelines", scraped, limit=10
+    )
+
+    urls = [candidates[i]["url"] for i in order]
+    # The data engineer posting only matches through the RAG index (resume text)
+    assert sorted(urls) == ["https://jobs/1", "https://jobs/2", "https://jobs/3"]
+    assert urls[0] == "https://jobs/2"
+    assert candidates[order[0]]["source"] == "manual"
+    assert len(scores) == len(candidates)
+
+
+def test_search_applies_filters_to_stored_candidates(tmp_path):
+    session_factory = make_engine(tmp_path, [
+        {"title": "Python Developer", "company": "Acme", "location": "Berlin",
+         "description": "d", "required_skills": ["python"]},
+        {"title": "Python Developer", "company": "Beta", "location": "Kyiv",
+         "description": "d", "required_skills": ["python"]},
+    ])
+    search = HybridSearch(session_factory)
+    search.sync_rag_index()
+
+    candidates, _, order = search.search("python", RESUME, location="berlin")
+    assert [candidates[i]["company"] for i in order] == ["Acme"]
+
+
+def test_rag_index_syncs_committed_writes_incrementally(tmp_path):
+    session_factory = make_engine(tmp_path, [
+        {"title": "Python Developer", "company": "Acme", "description": "Django web services"},
+    ])
+    search = HybridSearch(session_factory, rag_refresh_interval=60)
+    search.start()
+    try:
+        # Syncs are serialised, so this runs before or after the background one
+        search.sync_rag_index()
+        rag_service = search.rag_service
+
+        with session_factory() as db:
+            db.add(Vacancy(title="Data Engineer", company="Beta", description="Kafka streaming pipelines"))
+            db.get(Vacancy, 1).description = "Rust embedded firmware"
+            db.commit()
+        with session_factory() as db:
+            db.add(Vacancy(title="Discarded", company="Gamma", description="Kafka streaming pipelines"))
+            db.rollback()
+        search.sync_rag_index()
+
+        assert search.rag_service is rag_service
+        assert [v["company"] for v in search.rag_candidates("kafka pipelines", 5)] == ["Beta", "Acme"]
+        assert [v["company"] for v in search.rag_candidates("rust firmware", 1)] == ["Acme"]
+
+        with session_factory() as db:
+            db.delete(db.get(Vacancy, 2))
+            db.commit()
+        search.sync_rag_index()
+        assert [v["company"] for v in search.rag_candidates("kafka pipelines", 5)] == ["Acme"]
+    finally:
+        search.stop(timeout=5)
+    assert not search.running
+
+
+def test_rag_index_starts_on_an_empty_database(tmp_path):
+    session_factory = make_engine(tmp_path, [])
+    search = HybridSearch(session_factory, rag_refresh_interval=60)
+    search.start()
+    try:
+        search.sync_rag_index()
+        assert len(search.rag_service) == 0
+        assert search.rag_candidates("kafka pipelines", 5) == []
+
+        with session_factory() as db:
+            db.add(Vacancy(title="Data Engineer", company="Beta", description="Kafka streaming pipelines"))
+            db.commit()
+        search.sync_rag_index()
+        assert [v["company"] for v in search.rag_candidates("kafka pipelines", 5)] == ["Beta"]
+    finally:
+        search.stop(timeout=5)
+
+
+def test_rag_sync_keeps_writes_committed_next_to_a_failed_bulk_item(tmp_path):
+    session_factory = make_engine(tmp_path, [
+        {"title": "Python Developer", "company": "Acme", "url": "https://jobs/1",
+         "description": "Django web services"},
+    ])
+    with session_factory() as db:
+        db.execute(text(
+            "CREATE TRIGGER reject BEFORE INSERT ON vacancies WHEN NEW.title = 'Rejected' "
+            "BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        ))
+        db.commit()
+    search = HybridSearch(session_factory, rag_refresh_interval=60)
+    search.start()
+    try:
+        search.sync_rag_index()
+        with session_factory() as db:
+            body = bulk_upsert_vacancies(db, [
+                {"title": "Python Developer", "company": "Acme", "url": "https://jobs/1",
+                 "description": "Rust embedded firmware"},
+                {"title": "Rejected", "company": "Beta", "url": "https://jobs/2", "description": "d"},
+            ])
+        assert [result["status"] for result in body["results"]] == ["updated", "error"]
+
+        search.sync_rag_index()
+        assert search.rag_service.get_vacancy_details(1)["description"] == "Rust embedded firmware"
+    finally:
+        search.stop(timeout=5)
+
+
+def test_rag_index_reconciles_writes_from_outside_the_orm(tmp_path):
+    session_factory = make_engine(tmp_path, [
+        {"title": "Python Developer", "company": "Acme", "description": "Django web services"},
+        {"title": "Data Engineer", "company": "Beta", "description": "Kafka streaming pipelines"},
+    ])
+    search = HybridSearch(session_factory)
+    search.sync_rag_index()
+
+    with session_factory() as db:
+        db.execute(text("UPDATE vacancies SET company = 'Acme Corp' WHERE id = 1"))
+        db.execute(text("DELETE FROM vacancies WHERE id = 2"))
+        db.execute(text(
+            "INSERT INTO vacancies (id, title, company, description) "
+            "VALUES (2, 'Firmware Engineer', 'Gamma', 'Rust embedded firmware')"
+        ))
+        db.commit()
+
+    # Hits are read back from the database before the index catches up
+    assert [v["company"] for v in search.rag_candidates("django services", 1)] == ["Acme Corp"]
+    assert [v["company"] for v in search.rag_candidates("kafka pipelines", 1)] == ["Gamma"]
+
+    search.sync_rag_index(reconcile=True)
+    assert search.rag_service.get_vacancy_details(2)["description"] == "Rust embedded firmware"
+    assert [v["company"] for v in search.rag_candidates("rust firmware", 1)] == ["Gamma"]
+    assert len(search.rag_service) == 2
+
+
+def test_database_filters_run_before_the_limit(tmp_path):
+    session_factory = make_engine(tmp_path, [
+        {"title": "Python Developer", "company": "Old Co", "location": "Berlin, Germany",
+         "description": "d", "required_skills": ["Kafka", "python"]},
+    ] + [
+        {"title": "Python Developer", "company": "New Co", "location": "Kyiv",
+         "description": "d", "required_skills": ["python"]}
+        for _ in range(5)
+    ])
+    search = HybridSearch(session_factory)
+
+    assert [v["company"] for v in search.database_candidates("python", 2, ["kafka"])] == ["Old Co"]
+    assert [v["company"] for v in search.database_candidates(None, 2, location="BERLIN")] == ["Old Co"]
+    assert search.database_candidates(None, 2, company="%") == []
+
+
+def test_search_limit_raises_candidates_per_source():
+    scraped = [
+        {"title": f"Python Developer {i}", "company": "Acme", "url": f"https://jobs/{i}",
+         "source": "board", "required_skills": ["python"]}
+        for i in range(300)
+    ]
+    search = HybridSearch(candidates_per_source=200)
+
+    candidates, _, order = search.search("python", RESUME, scraped=scraped, limit=250)
+    assert len(candidates) == len(order) == 250
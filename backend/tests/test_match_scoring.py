@@ -0,0 +1,47 @@
+import random
+
+import numpy as np
+
+from backend.services.match_scoring import SkillMatrix, calculate_match_scores, top_k_indices
+from backend.services.vacancies import calculate_match_score
+
+SKILLS = ["python", "django", "docker", "react", "sql", "aws", "go", "kafka"]
+
+
+def random_vacancies(count, rng):
+    return [
+        {
+            "required_skills": [s.upper() if rng.random() < 0.2 else s
+                                for s in rng.sample(SKILLS, rng.randint(0, 5))],
+            "experience_required": rng.randint(0, 8),
+        }
+        for _ in range(count)
+    ]
+
+
+def test_vectorized_scores_match_scalar_scores():
+    rng = random.Random(7)
+    vacancies = random_vacancies(500, rng)
+    matrix = SkillMatrix(vacancies)
+
+    for _ in range(20):
+        resume = {
+            "skills": rng.sample(SKILLS + ["rust"], rng.randint(0, 6)),
+            "experience_years": rng.randint(0, 10),
+        }
+        scores = calculate_match_scores(resume, matrix)
+        expected = [calculate_match_score(resume, vacancy) for vacancy in vacancies]
+        assert [round(float(score), 1) for score in scores] == expected
+
+
+def test_resume_errors_score_zero():
+    matrix = SkillMatrix([{"required_skills": ["python"], "experience_required": 0}])
+    scores = calculate_match_scores({"error": "unreadable", "skills": ["python"]}, matrix)
+    assert scores.tolist() == [0.0]
+
+
+def test_top_k_indices_keeps_original_order_for_ties():
+    scores = np.array([10.0, 50.0, 10.0, 50.0, 30.0, 10.0])
+    assert top_k_indices(scores, 4).tolist() == [1, 3, 4, 0]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 4, 0, 2, 5]
+    assert top_k_indices(scores, 0).tolist() == []
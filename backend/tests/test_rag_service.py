@@ -0,0 +1,143 @@
+import pytest
+from fastapi import HTTPException
+
+from backend.services.rag_service import RAGService
+
+VACANCIES = [
+    {"id": "1", "title": "Python Developer", "description": "python django rest api backend"},
+    {"id": "2", "title": "Frontend Engineer", "description": "react typescript css frontend"},
+    {"id": "3", "title": "Data Scientist", "description": "python pandas machine learning models"},
+]
+
+
+def test_query_vacancies_ranks_by_similarity():
+    service = RAGService()
+    service.load_vacancies(VACANCIES)
+
+    results = service.query_vacancies("django backend", top_n=2)
+    assert results[0]["id"] == "1"
+    assert len(results) == 2
+
+
+def test_index_is_reused_until_data_changes():
+    service = RAGService()
+    service.load_vacancies(VACANCIES)
+    matrix = service.index_vacancies()
+
+    service.load_vacancies(list(VACANCIES))
+    assert service.index_vacancies() is matrix
+
+    service.load_vacancies(VACANCIES[:2])
+    assert service.index_vacancies() is not matrix
+    assert service.index_vacancies().shape[0] == 2
+
+
+def test_index_snapshot_roundtrip(tmp_path):
+    service = RAGService()
+    service.load_vacancies(VACANCIES)
+    snapshot = tmp_path / "rag_index.joblib"
+    service.save_index(snapshot)
+
+    restored = RAGService()
+    restored.load_index(snapshot)
+    assert restored.query_vacancies("react frontend", top_n=1)[0]["id"] == "2"
+
+
+def test_query_vacancies_batch_matches_single_queries():
+    service = RAGService()
+    service.load_vacancies(VACANCIES)
+    queries = ["django backend", "react frontend", "machine learning"]
+
+    batch = service.query_vacancies_batch(queries, top_n=2)
+    assert [results[0]["id"] for results in batch] == ["1", "2", "3"]
+    assert batch == [service.query_vacancies(query, top_n=2) for query in queries]
+
+
+def test_vacancy_details_lookup_by_id():
+    service = RAGService()
+    service.load_vacancies(VACANCIES)
+
+    assert service.get_vacancy_details("2")["title"] == "Frontend Engineer"
+    assert [v["id"] for v in service.get_vacancies_details(["3", "missing", "1"])] == ["3", "1"]
+
+    service.load_vacancies(VACANCIES[:1])
+    with pytest.raises(HTTPException):
+        service.get_vacancy_details("2")
+
+
+def test_add_and_remove_vacancies_without_refit():
+    service = RAGService(merge_ratio=10)
+    service.load_vacancies(VACANCIES)
+    main = service.index_vacancies()
+
+    service.add_vacancies([
+        {"id": "4", "title": "Go Developer", "description": "golang grpc microservices"},
+    ])
+    assert service.query_vacancies("golang grpc", top_n=1)[0]["id"] == "4"
+    assert service.query_vacancies("django backend", top_n=1)[0]["id"] == "1"
+
+    assert service.remove_vacancies(["1", "missing"]) == 1
+    assert "1" not in [v["id"] for v in service.query_vacancies("django backend", top_n=5)]
+    assert len(service.query_vacancies("python", top_n=10)) == 3
+    with pytest.raises(HTTPException):
+        service.get_vacancy_details("1")
+
+    # Main segment was never refitted; merging compacts the removed row away
+    assert service._view.segments[0].weighted is main
+    assert service.index_vacancies().shape[0] == 3
+    assert [v["id"] for v in service.vacancies] == ["2", "3", "4"]
+    assert service.get_vacancy_details("4")["title"] == "Go Developer"
+
+
+def test_removing_every_vacancy_leaves_an_empty_index():
+    service = RAGService()
+    service.load_vacancies(VACANCIES)
+
+    assert service.remove_vacancies([v["id"] for v in VACANCIES]) == 3
+    service.merge_segments()
+    assert len(service) == 0
+    with pytest.raises(HTTPException):
+        service.query_vacancies("python", top_n=5)
+
+    service.add_vacancies(VACANCIES[:1])
+    assert service.query_vacancies("python", top_n=5)[0]["id"] == "1"
+
+
+def test_loading_no_vacancies_empties_the_index():
+    service = RAGService()
+    service.load_vacancies(VACANCIES)
+    service.load_vacancies([])
+
+    assert len(service) == 0
+    service.add_vacancies([])
+    service.add_vacancies(VACANCIES[2:])
+    assert [v["id"] for v in service.query_vacancies("python", top_n=5)] == ["3"]
+
+
+def test_duplicate_ids_in_one_batch_keep_the_last():
+    service = RAGService()
+    service.load_vacancies(VACANCIES[:1])
+    service.add_vacancies([
+        {"id": "4", "title": "Go Developer", "description": "golang grpc microservices"},
+        {"id": "4", "title": "Rust Developer", "description": "rust embedded firmware"},
+    ])
+
+    assert len(service) == 2
+    assert service.query_vacancies("rust firmware", top_n=1)[0]["title"] == "Rust Developer"
+    service.remove_vacancies(["4"])
+    assert [v["id"] for v in service.query_vacancies("golang rust", top_n=5)] == ["1"]
+
+
+def test_merged_index_matches_full_rebuild():
+    incremental = RAGService(merge_ratio=0.5)
+    incremental.load_vacancies(VACANCIES[:2])
+    incremental.add_vacancies(VACANCIES[2:])
+    incremental.add_vacancies([dict(VACANCIES[0], description="python flask backend")])
+    incremental.merge_segments()
+
+    rebuilt = RAGService()
+    rebuilt.load_vacancies(VACANCIES[1:] + [dict(VACANCIES[0], description="python flask backend")])
+
+    assert len(incremental._view.segments) == 1
+    assert abs(incremental.index_vacancies() - rebuilt.index_vacancies()).max() < 1e-12
+    assert incremental.get_vacancy_details("1")["description"] == "python flask backend"
@@ -0,0 +1,40 @@
+from docx import Document
+
+from backend.utils import resume_cache as resume_cache_module
+from backend.utils.resume_cache import ResumeCache
+
+
+def write_resume(path, text):
+    document = Document()
+    document.add_paragraph(text)
+    document.save(path)
+
+
+def test_unchanged_resume_is_parsed_once(tmp_path, monkeypatch):
+    resume = tmp_path / "cv.docx"
+    write_resume(resume, "Python developer with 5 years of experience in Django")
+    cache = ResumeCache(tmp_path / "cache")
+
+    first = cache.analyze(resume)
+    assert first["skills"] == ["django", "python"]
+    assert first["experience_years"] == 5
+
+    def fail(_path):
+        raise AssertionError("resume parsed again")
+
+    monkeypatch.setattr(resume_cache_module, "analyze_resume_stream", fail)
+    assert cache.analyze(resume) == first
+    # A fresh cache reuses the persisted entry after re-hashing the file
+    assert ResumeCache(tmp_path / "cache").analyze(resume) == first
+    assert "Django" in cache.get_text(resume)
+
+
+def test_changed_resume_is_reparsed(tmp_path):
+    resume = tmp_path / "cv.docx"
+    cache = ResumeCache(tmp_path / "cache")
+    write_resume(resume, "Go developer")
+    assert cache.analyze(resume)["skills"] == ["go"]
+
+    write_resume(resume, "Rust developer, 3 years")
+    assert cache.analyze(resume)["skills"] == ["rust"]
+    assert (cache.hits, cache.misses) == (0, 2)
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from backend.utils.resume_parser import (
+    analyze_resume,
+    analyze_text_chunks,
+    extract_text_from_pdf,
+    iter_analyze_resumes,
+    iter_pdf_pages,
+)
+
+SAMPLE_PDF = next((Path(__file__).parent.parent.parent / "frontend" / "uploaded_files").glob("*.pdf"), None)
+
+
+def test_analyze_text_chunks_accumulates_skills_and_experience():
+    pages = ["Python developer, 2 years", "Docker and Kubernetes", "5+ years of experience"]
+    analysis, text = analyze_text_chunks(iter(pages))
+
+    assert analysis["skills"] == ["docker", "kubernetes", "python"]
+    assert analysis["experience_years"] == 5
+    assert text == "\n".join(pages)
+
+
+@pytest.mark.skipif(SAMPLE_PDF is None, reason="no sample PDF")
+def test_pdf_pages_are_streamed_with_caps():
+    pages = list(iter_pdf_pages(SAMPLE_PDF, max_pages=None, max_chars=None))
+
+    assert list(iter_pdf_pages(SAMPLE_PDF, max_pages=1)) == pages[:1]
+    assert len(extract_text_from_pdf(SAMPLE_PDF, max_chars=50)) == 50
+    assert analyze_resume(SAMPLE_PDF)["skills"]
+
+
+def test_iter_analyze_resumes_uses_worker_processes(tmp_path):
+    from docx import Document
+
+    paths = []
+    for index, skill in enumerate(["python", "golang", "kotlin"]):
+        document = Document()
+        document.add_paragraph(f"{skill} engineer, {index + 1} years")
+        paths.append(tmp_path / f"cv{index}.docx")
+        document.save(paths[-1])
+
+    results = {
+        Path(path).name: analysis
+        for path, analysis, _text in iter_analyze_resumes(paths, max_workers=2, prefetch=1)
+    }
+    assert results["cv1.docx"]["skills"] == ["golang"]
+    assert sorted(a["experience_years"] for a in results.values()) == [1, 2, 3]
+
+
+def test_iter_analyze_resumes_reports_corrupt_files(tmp_path):
+    from docx import Document
+
+    document = Document()
+    document.add_paragraph("python engineer")
+    document.save(tmp_path / "good.docx")
+    (tmp_path / "bad.pdf").write_bytes(b"%PDF-1.4 truncated")
+
+    results = {
+        Path(path).name: analysis
+        for path, analysis, _text in iter_analyze_resumes(
+            [tmp_path / "bad.pdf", tmp_path / "good.docx"], max_workers=1
+        )
+    }
+    assert "error" in results["bad.pdf"]
+    assert results["good.docx"]["skills"] == ["python"]
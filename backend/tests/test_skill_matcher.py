@@ -0,0 +1,26 @@
+from backend.utils.resume_parser import extract_skills
+from backend.utils.skill_matcher import SkillMatcher, find_skills
+
+
+def test_single_letter_skills_need_word_boundaries():
+    assert find_skills("Scripting for a Docker cluster") == ["docker"]
+    assert find_skills("Experience with C and R") == ["c", "r"]
+    assert find_skills("Objective-C and C++ on iOS") == ["c++", "ios", "objective-c"]
+
+
+def test_overlapping_and_punctuated_skills():
+    skills = find_skills("Python/Django, Spring Boot, Ruby on Rails, Vue.js and .NET.")
+    assert skills == [
+        ".net", "django", "python", "rails", "ruby", "ruby on rails",
+        "spring", "spring boot", "vue", "vue.js",
+    ]
+
+
+def test_custom_vocabulary_is_case_insensitive():
+    matcher = SkillMatcher(["Kafka", "Apache Kafka"])
+    assert matcher.find("We run APACHE KAFKA streams") == ["apache kafka", "kafka"]
+
+
+def test_resume_parser_uses_shared_matcher():
+    text = "Senior engineer: python, fastapi, postgresql"
+    assert extract_skills(text) == find_skills(text) == ["fastapi", "postgresql", "python"]
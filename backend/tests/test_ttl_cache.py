@@ -0,0 +1,51 @@
+import time
+
+from backend.utils.ttl_cache import TTLCache
+
+
+def test_hits_misses_and_lru_eviction():
+    cache = TTLCache(max_size=2, ttl=60)
+    calls = []
+
+    def loader(value):
+        return lambda: calls.append(value) or [value]
+
+    assert cache.get_or_load("a", loader("a")) == ["a"]
+    assert cache.get_or_load("a", loader("a2")) == ["a"]
+    cache.get_or_load("b", loader("b"))
+    cache.get_or_load("a", loader("a3"))
+    cache.get_or_load("c", loader("c"))
+
+    assert calls == ["a", "b", "c"]
+    assert cache.get_or_load("b", loader("b2")) == ["b2"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 4, 2)
+
+
+def test_stale_entries_are_served_while_refreshing():
+    cache = TTLCache(ttl=0.2, stale_ttl=60)
+    cache.get_or_load("key", lambda: ["old"])
+    time.sleep(0.3)
+
+    assert cache.get_or_load("key", lambda: ["new"]) == ["old"]
+    cache._executor.shutdown(wait=True)  # pylint: disable=protected-access
+    assert cache.get_or_load("key", lambda: ["newer"]) == ["new"]
+    assert cache.stats()["stale_hits"] == 1
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_empty_results_are_not_cached():
+    cache = TTLCache()
+    assert cache.get_or_load("key", lambda: []) == []
+    assert cache.get_or_load("key", lambda: ["value"]) == ["value"]
+
+
+def test_values_loaded_across_a_clear_are_not_stored():
+    cache = TTLCache()
+
+    def load_while_a_write_clears():
+        cache.clear()
+        return ["before write"]
+
+    assert cache.get_or_load("key", load_while_a_write_clears) == ["before write"]
+    assert cache.get_or_load("key", lambda: ["after write"]) == ["after write"]
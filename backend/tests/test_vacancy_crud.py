@@ -0,0 +1,213 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.api.endpoints.vacancies import bulk_upsert_vacancies, stats_cache
+from backend.app import app
+from backend.database.session import create_db_engine, get_db, init_db
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    init_db(engine)
+    testing_session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = testing_session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    stats_cache.clear()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def make_vacancy(index, **overrides):
+    vacancy = {
+        "title": f"Developer {index}",
+        "company": "Acme",
+        "description": "A long description " * 20,
+        "required_skills": ["python"],
+        "experience_required": index,
+    }
+    vacancy.update(overrides)
+    return vacancy
+
+
+def test_keyset_pagination_walks_all_pages(client):
+    for index in range(5):
+        assert client.post("/api/db/vacancies", json=make_vacancy(index)).status_code == 201
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["after_id"] = cursor
+        response = client.get("/api/db/vacancies", params=params)
+        seen.extend(vacancy["id"] for vacancy in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == sorted(seen) and len(seen) == 5
+
+
+def test_field_projection_skips_unrequested_columns(client):
+    client.post("/api/db/vacancies", json=make_vacancy(1))
+
+    response = client.get("/api/db/vacancies", params={"fields": "title,company"})
+    assert response.json() == [{"id": 1, "title": "Developer 1", "company": "Acme"}]
+
+    full = client.get("/api/db/vacancies").json()[0]
+    assert full["description"].startswith("A long description")
+
+    assert client.get("/api/db/vacancies", params={"fields": "title,secret"}).status_code == 400
+
+
+def test_stats_are_aggregated_and_invalidated_on_write(client):
+    client.post("/api/db/vacancies", json=make_vacancy(1, salary=1000.0))
+    client.post("/api/db/vacancies", json=make_vacancy(3, salary=3000.0))
+    client.post("/api/db/vacancies", json=make_vacancy(5, company="Globex"))
+
+    stats = client.get("/api/db/vacancies/stats").json()
+    assert stats["total"] == 3
+    assert stats["avg_experience_required"] == 3.0
+    assert stats["avg_salary"] == 2000.0
+    assert stats["top_companies"] == [
+        {"company": "Acme", "count": 2},
+        {"company": "Globex", "count": 1},
+    ]
+
+    client.post("/api/db/vacancies", json=make_vacancy(7, company="Globex"))
+    stats = client.get("/api/db/vacancies/stats", params={"top_companies": 1}).json()
+    assert stats["total"] == 4
+    assert stats["top_companies"] == [{"company": "Acme", "count": 2}]
+
+    for top_companies in (0, -1, 101):
+        response = client.get("/api/db/vacancies/stats", params={"top_companies": top_companies})
+        assert response.status_code == 422
+
+
+def test_filters_use_skill_index_and_follow_updates(client):
+    kafka_berlin = client.post(
+        "/api/db/vacancies",
+        json=make_vacancy(1, required_skills=["Kafka", "Python"], location="Berlin")
+    ).json()
+    client.post("/api/db/vacancies", json=make_vacancy(2, required_skills=["kafka"], location="Kyiv"))
+    client.post("/api/db/vacancies", json=make_vacancy(3, location="Berlin"))
+
+    def ids(**params):
+        return [v["id"] for v in client.get("/api/db/vacancies", params=params).json()]
+
+    assert ids(skill="kafka", location="Berlin") == [kafka_berlin["id"]]
+    assert ids(skill=["kafka", "python"]) == [kafka_berlin["id"]]
+    assert len(ids(skill="kafka")) == 2
+
+    client.put(f"/api/db/vacancies/{kafka_berlin['id']}", json={"required_skills": ["go"]})
+    assert ids(skill="kafka", location="Berlin") == []
+    assert ids(skill="go") == [kafka_berlin["id"]]
+
+    client.delete(f"/api/db/vacancies/{kafka_berlin['id']}")
+    assert ids(skill="go") == []
+
+
+def test_bulk_create_reports_invalid_items_without_aborting(client):
+    response = client.post(
+        "/api/db/vacancies/bulk",
+        json=[make_vacancy(1), {"title": "No company"}, make_vacancy(2)]
+    )
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+    assert [result["status"] for result in body["results"]] == ["created", "error", "created"]
+    assert "company" in body["results"][1]["detail"]
+    assert len(client.get("/api/db/vacancies").json()) == 2
+
+
+def test_bulk_upsert_from_ndjson_updates_by_source_and_url(client):
+    first = make_vacancy(1, url="https://jobs/1", source="partner")
+    client.post("/api/db/vacancies/bulk-upsert", json=[first])
+
+    lines = [
+        make_vacancy(1, url="https://jobs/1", source="partner", title="Renamed"),
+        make_vacancy(2, url="https://jobs/2", source="partner"),
+        make_vacancy(3, url="https://jobs/1", source="other"),
+        make_vacancy(4),
+    ]
+    response = client.post(
+        "/api/db/vacancies/bulk-upsert",
+        content="\n".join(json.dumps(line) for line in lines),
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    body = response.json()
+    assert [result["status"] for result in body["results"]] == ["updated", "created", "created", "error"]
+
+    titles = {v["title"] for v in client.get("/api/db/vacancies", params={"source": "partner"}).json()}
+    assert titles == {"Renamed", "Developer 2"}
+
+
+def test_bulk_upsert_falls_back_to_per_item_savepoints(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    init_db(engine)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TRIGGER reject BEFORE INSERT ON vacancies WHEN NEW.title = 'Rejected' "
+            "BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        ))
+    items = [
+        make_vacancy(1, url="https://jobs/1"),
+        make_vacancy(2, url="https://jobs/2", title="Rejected"),
+        make_vacancy(3, url="https://jobs/2", title="Rejected"),
+        make_vacancy(4, url="https://jobs/3"),
+    ]
+
+    with sessionmaker(bind=engine)() as db:
+        body = bulk_upsert_vacancies(db, items)
+    assert [result["status"] for result in body["results"]] == ["created", "error", "error", "created"]
+    assert "rejected" in body["results"][1]["detail"]
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with sessionmaker(bind=engine)() as db:
+        body = bulk_upsert_vacancies(db, [items[0], items[3]])
+    assert body["updated"] == 2
+    assert not [statement for statement in statements if "vacancy_skills (" in statement]
+
+
+def test_bulk_update_and_delete(client):
+    ids = [r["id"] for r in client.post(
+        "/api/db/vacancies/bulk", json=[make_vacancy(i) for i in range(3)]
+    ).json()["results"]]
+
+    updated = client.put(
+        "/api/db/vacancies/bulk",
+        json=[{"id": ids[0], "required_skills": ["kafka"]}, {"id": 999, "title": "x"}]
+    ).json()
+    assert [r["status"] for r in updated["results"]] == ["updated", "not_found"]
+    assert [v["id"] for v in client.get("/api/db/vacancies", params={"skill": "kafka"}).json()] == [ids[0]]
+
+    deleted = client.post("/api/db/vacancies/bulk-delete", json=[ids[0], {"id": ids[1]}, "x"]).json()
+    assert (deleted["deleted"], deleted["failed"]) == (2, 1)
+    assert [v["id"] for v in client.get("/api/db/vacancies").json()] == [ids[2]]
+    assert client.get("/api/db/vacancies", params={"skill": "kafka"}).json() == []
+
+
+def test_export_streams_ndjson_in_batches(client, monkeypatch):
+    monkeypatch.setattr("backend.api.endpoints.vacancies.EXPORT_BATCH_SIZE", 2)
+    client.post("/api/db/vacancies/bulk", json=[make_vacancy(i, location="Київ") for i in range(5)])
+
+    response = client.get("/api/db/vacancies/export", params={"fields": "title,location"})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["title"] for row in rows] == [f"Developer {i}" for i in range(5)]
+    assert set(rows[0]) == {"id", "title", "location"} and rows[0]["location"] == "Київ"
+
+    full = client.get("/api/db/vacancies/export", params={"skill": "python"}).text.splitlines()
+    assert len(full) == 5 and json.loads(full[0])["required_skills"] == ["python"]
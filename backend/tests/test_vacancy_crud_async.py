@@ -0,0 +1,83 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from backend.api.endpoints.vacancies import stats_cache  # noqa: E402
+from backend.api.endpoints.vacancies_async import router  # noqa: E402
+from backend.database.async_session import (  # noqa: E402
+    async_database_url,
+    async_sessionmaker,
+    create_async_db_engine,
+    get_async_db,
+)
+from backend.database.session import create_db_engine, init_db  # noqa: E402
+
+
+@pytest.fixture
+def client(tmp_path):
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    init_db(create_db_engine(url))
+    testing_session = async_sessionmaker(create_async_db_engine(url), expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with testing_session() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/db")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    stats_cache.clear()
+    yield TestClient(app)
+
+
+def test_async_url_swaps_driver():
+    assert async_database_url("sqlite:///a.db").drivername == "sqlite+aiosqlite"
+    assert async_database_url("postgresql+psycopg2://u@h/db").drivername == "postgresql+asyncpg"
+
+
+def test_async_crud_roundtrip(client):
+    created = client.post(
+        "/api/db/vacancies",
+        json={
+            "title": "Data Engineer",
+            "company": "Acme",
+            "description": "Streaming pipelines",
+            "required_skills": ["Kafka"],
+        }
+    )
+    assert created.status_code == 201
+    vacancy_id = created.json()["id"]
+
+    assert client.get(f"/api/db/vacancies/{vacancy_id}").json()["title"] == "Data Engineer"
+    assert [v["id"] for v in client.get("/api/db/vacancies", params={"skill": "kafka"}).json()] == [vacancy_id]
+
+    client.put(f"/api/db/vacancies/{vacancy_id}", json={"required_skills": ["go"]})
+    assert client.get("/api/db/vacancies", params={"skill": "kafka"}).json() == []
+    assert client.get("/api/db/vacancies/stats").json()["total"] == 1
+
+    assert client.delete(f"/api/db/vacancies/{vacancy_id}").status_code == 204
+    assert client.get(f"/api/db/vacancies/{vacancy_id}").status_code == 404
+    assert client.get("/api/db/vacancies", params={"fields": "title"}).json() == []
+
+
+def test_async_bulk_upsert(client):
+    items = [
+        {"title": "A", "company": "Acme", "description": "d", "url": "https://jobs/a"},
+        {"title": "B", "company": "Acme", "description": "d", "url": "https://jobs/a"},
+    ]
+    body = client.post("/api/db/vacancies/bulk-upsert", json=items).json()
+    assert [result["status"] for result in body["results"]] == ["created", "updated"]
+    assert [v["title"] for v in client.get("/api/db/vacancies").json()] == ["B"]
+
+
+def test_async_export_streams_ndjson(client):
+    items = [
+        {"title": f"T{i}", "company": "Acme", "description": "d", "url": f"https://jobs/{i}"}
+        for i in range(3)
+    ]
+    client.post("/api/db/vacancies/bulk", json=items)
+    lines = client.get("/api/db/vacancies/export", params={"fields": "title"}).text.splitlines()
+    assert lines == [f'{{"id": {i + 1}, "title": "T{i}"}}' for i in range(3)]
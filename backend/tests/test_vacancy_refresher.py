@@ -0,0 +1,103 @@
+import pytest
+
+from backend.services.vacancy_refresher import VacancyRefresher, VacancySnapshot
+from backend.services.vacancy_scraper import VacancyScraper
+
+
+class FakeScraper:
+    duplicate_threshold = 0.8
+
+    def __init__(self, batches, statuses=None):
+        self.batches = list(batches)
+        self.statuses = statuses or ["ok"] * len(self.batches)
+        self.last_fetch_stats = {}
+
+    def fetch_all_vacancies(self, job_title=None, incremental=False, duplicates_index=None):
+        self.last_fetch_stats = {"board": {"status": self.statuses.pop(0)}}
+        return self.batches.pop(0)
+
+    def get_cached_vacancies(self, job_title=None):
+        return []
+
+
+def posting(url, title="Python Developer"):
+    return {"title": title, "url": url, "source": "board"}
+
+
+def test_snapshot_search_filters_titles():
+    snapshot = VacancySnapshot([posting("a"), posting("b", "Go Developer")])
+    assert [v["url"] for v in snapshot.search("  GO developer")] == ["b"]
+    assert len(snapshot.search(None)) == 2
+
+
+def test_snapshot_positions_filter_skills_and_location():
+    snapshot = VacancySnapshot([
+        dict(posting("a"), required_skills=["Kafka", "python"], location="Berlin, Germany"),
+        dict(posting("b"), required_skills=["kafka"], location="Kyiv"),
+        dict(posting("c"), required_skills=["python"], location="Berlin"),
+    ])
+    assert list(snapshot.search_positions(None, ["kafka"], location="berlin")) == [0]
+    assert list(snapshot.search_positions("python", ["kafka", "PYTHON"])) == [0]
+    assert len(snapshot.search_positions(None, ["rust"])) == 0
+
+
+def test_refresh_merges_new_postings_into_snapshot():
+    refresher = VacancyRefresher(FakeScraper([[posting("a"), posting("b")], [posting("c"), posting("a")]]))
+
+    assert refresher.refresh_once()
+    assert refresher.refresh_once()
+    assert [v["url"] for v in refresher.snapshot.vacancies] == ["c", "a", "b"]
+    assert refresher.status()["snapshot_size"] == 3
+
+
+def test_failures_back_off_with_jitter():
+    refresher = VacancyRefresher(
+        FakeScraper([[], []], statuses=["timeout", "error"]),
+        interval=10, max_backoff=25, jitter=0.1
+    )
+
+    assert not refresher.refresh_once()
+    assert 18 <= refresher.next_delay() <= 22
+    assert not refresher.refresh_once()
+    assert refresher.next_delay() == pytest.approx(25, rel=0.1)
+    assert refresher.status()["last_error"] == "All sources failed"
+
+
+def test_failed_refresh_keeps_snapshot_age():
+    refresher = VacancyRefresher(FakeScraper([[]], statuses=["error"]))
+    refresher.snapshot = VacancySnapshot([posting("a")], created_at=0)
+
+    assert not refresher.refresh_once()
+    assert refresher.snapshot.created_at == 0
+    assert [v["url"] for v in refresher.snapshot.vacancies] == ["a"]
+
+
+def test_near_duplicates_are_checked_across_refreshes(tmp_path):
+    description = "Build Python services with FastAPI and Kafka for our data platform team in Berlin"
+    first = {"title": "Python Engineer", "company": "Acme", "description": description,
+             "source": "a", "url": "https://a/1"}
+    edited = dict(first, description=description + " Remote.")
+    repost = dict(first, description=description + ".", source="b", url="https://b/1")
+    others = [
+        {"title": "Sales Manager", "company": "Beta", "description": "Sell enterprise software to retailers",
+         "source": "a", "url": "https://a/2"},
+        {"title": "Go Developer", "company": "Gamma", "description": "Write gRPC microservices in Go",
+         "source": "a", "url": "https://a/3"},
+    ]
+    batches = {"a": [[first], [edited], others], "b": [[], [repost], []]}
+    scraper = VacancyScraper(cache_dir=tmp_path)
+    scraper.sources = {
+        name: (lambda job_title, incremental=False, name=name: batches[name].pop(0))
+        for name in batches
+    }
+    refresher = VacancyRefresher(scraper, max_postings=2)
+
+    assert refresher.refresh_once()
+    assert refresher.refresh_once()
+    # The cross-post from the previous run is dropped; the re-fetched edit replaces the original
+    assert refresher.snapshot.vacancies == (edited,)
+    assert scraper.last_fetch_stats["b"]["duplicates"] == 1
+
+    assert refresher.refresh_once()
+    assert [v["url"] for v in refresher.snapshot.vacancies] == ["https://a/2", "https://a/3"]
+    assert len(refresher.duplicates_index) == 2
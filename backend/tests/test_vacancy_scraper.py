@@ -0,0 +1,194 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from backend.services.vacancy_scraper import VacancyScraper
+
+ARBEITNOW_PAYLOAD = {
+    "data": [
+        {
+            "slug": "python-developer",
+            "created_at": 200,
+            "title": "Python Developer",
+            "company_name": "Acme",
+            "description": "3+ years of experience with Python and Django",
+            "location": "Berlin",
+            "url": "https://example.com/python",
+            "tags": ["Python", "Django"],
+        },
+        {
+            "slug": "sales-manager",
+            "created_at": 150,
+            "title": "Sales Manager",
+            "company_name": "Acme",
+            "description": "Sell things",
+            "location": "Berlin",
+            "url": "https://example.com/sales",
+            "tags": [],
+        },
+    ]
+}
+
+ARBEITNOW_PAGE_2 = {
+    "data": [
+        {
+            "slug": "python-data-engineer",
+            "created_at": 100,
+            "title": "Python Data Engineer",
+            "company_name": "Old Co",
+            "description": "Spark and Python",
+            "location": "Munich",
+            "url": "https://example.com/data",
+            "tags": ["Python", "Spark"],
+        }
+    ],
+    "links": {"next": None},
+}
+
+REMOTIVE_PAYLOAD = {
+    "jobs": [
+        {
+            "title": "Remote Python Engineer",
+            "company_name": "Remote Co",
+            "description": "Python, FastAPI and Docker",
+            "candidate_required_location": "Worldwide",
+            "url": "https://example.com/remote-python",
+            "publication_date": "2024-05-01T10:00:00",
+        }
+    ]
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    delays = {}
+    requests = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        path = self.path.split("?")[0]
+        self.requests.append(path)
+        time.sleep(self.delays.get(path, 0))
+        if path == "/arbeitnow":
+            base = f"http://127.0.0.1:{self.server.server_address[1]}"
+            payload = dict(ARBEITNOW_PAYLOAD, links={"next": f"{base}/arbeitnow/2"})
+        elif path == "/arbeitnow/2":
+            payload = ARBEITNOW_PAGE_2
+        else:
+            payload = REMOTIVE_PAYLOAD
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    StubHandler.delays = {}
+    StubHandler.requests = []
+    server.shutdown()
+
+
+@pytest.fixture
+def scraper(stub_server, tmp_path):
+    instance = VacancyScraper(cache_dir=tmp_path)
+    instance.ARBEITNOW_URL = f"{stub_server}/arbeitnow"
+    instance.REMOTIVE_URL = f"{stub_server}/remotive"
+    return instance
+
+
+def test_fetch_all_vacancies_combines_sources(scraper):
+    vacancies = scraper.fetch_all_vacancies("python")
+
+    assert [v["source"] for v in vacancies] == ["arbeitnow", "arbeitnow", "remotive"]
+    assert vacancies[0]["required_skills"] == ["python", "django"]
+    assert vacancies[0]["experience_required"] == 3
+    assert "fastapi" in vacancies[2]["required_skills"]
+
+
+def test_cross_posted_vacancies_are_collapsed(scraper):
+    description = "Build Python services with FastAPI and Kafka for our data platform team in Berlin"
+    first = {"title": "Python Engineer", "company": "Acme", "description": description, "source": "a"}
+    repost = dict(first, description=description + ".", source="b", url="https://b/1")
+    other = {"title": "Sales Manager", "company": "Acme", "description": "Sell things", "source": "b"}
+    scraper.sources = {
+        "a": lambda job_title, incremental=False: [first],
+        "b": lambda job_title, incremental=False: [repost, other],
+    }
+
+    assert scraper.fetch_all_vacancies("python") == [first, other]
+    assert scraper.last_fetch_stats["b"]["duplicates"] == 1
+    assert scraper.last_fetch_stats["b"]["vacancies"] == 1
+
+
+def test_slow_source_returns_partial_results(scraper):
+    StubHandler.delays = {"/remotive": 1.5}
+    scraper.source_deadlines["remotive"] = 0.3
+
+    started = time.monotonic()
+    vacancies = scraper.fetch_all_vacancies("python")
+
+    assert time.monotonic() - started < 1.0
+    assert {v["source"] for v in vacancies} == {"arbeitnow"}
+
+
+def test_arbeitnow_pagination_stops_early(scraper):
+    first = scraper.fetch_from_arbeitnow("python", max_results=1)
+    assert [v["url"] for v in first] == ["https://example.com/python"]
+    assert StubHandler.requests == ["/arbeitnow"]
+
+    everything = scraper.fetch_from_arbeitnow("python")
+    assert [v["url"] for v in everything] == [
+        "https://example.com/python",
+        "https://example.com/data",
+    ]
+
+
+def test_incremental_fetch_only_returns_new_postings(scraper, tmp_path):
+    assert len(scraper.fetch_from_arbeitnow(incremental=True)) == 3
+    assert scraper.high_water_marks["arbeitnow"] == {"slug": "python-developer", "created_at": 200}
+    assert scraper.fetch_from_arbeitnow(incremental=True) == []
+    assert StubHandler.requests[-1] == "/arbeitnow"
+
+    restored = VacancyScraper(cache_dir=tmp_path)
+    assert restored.high_water_marks == scraper.high_water_marks
+
+
+def test_interrupted_incremental_fetch_resumes_instead_of_skipping(scraper):
+    first = scraper.fetch_from_arbeitnow(max_pages=1, incremental=True)
+    assert [v["url"] for v in first] == ["https://example.com/python", "https://example.com/sales"]
+    assert "slug" not in scraper.high_water_marks["arbeitnow"]
+
+    rest = scraper.fetch_from_arbeitnow(incremental=True)
+    assert [v["url"] for v in rest] == ["https://example.com/data"]
+    assert scraper.high_water_marks["arbeitnow"] == {"slug": "python-developer", "created_at": 200}
+    assert scraper.fetch_from_arbeitnow(incremental=True) == []
+
+
+def test_timed_out_source_keeps_its_high_water_mark(scraper):
+    StubHandler.delays = {"/remotive": 1.0}
+    scraper.source_deadlines["remotive"] = 0.2
+
+    vacancies = scraper.fetch_all_vacancies(incremental=True)
+    scraper._executor.shutdown(wait=True)  # pylint: disable=protected-access
+
+    assert {v["source"] for v in vacancies} == {"arbeitnow"}
+    assert "arbeitnow" in scraper.high_water_marks
+    assert "remotive" not in scraper.high_water_marks
+
+
+def test_fetched_vacancies_are_cached_per_query(scraper):
+    vacancies = scraper.fetch_all_vacancies("python")
+    scraper._cache_writer.shutdown(wait=True)  # pylint: disable=protected-access
+
+    assert scraper.get_cached_vacancies("python") == vacancies
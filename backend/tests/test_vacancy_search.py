@@ -0,0 +1,43 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app import app
+from backend.services import vacancies as vacancy_service
+from backend.services.vacancy_refresher import VacancySnapshot
+
+
+@pytest.fixture
+def client(monkeypatch):
+    postings = [
+        {
+            "title": f"Python Developer {i}",
+            "company": "Acme",
+            "url": f"https://jobs/{i}",
+            "source": "board",
+            "required_skills": ["python"],
+            "experience_required": i % 5,
+        }
+        for i in range(30)
+    ]
+    monkeypatch.setattr(vacancy_service, "get_latest_resume", lambda: None)
+    monkeypatch.setattr(vacancy_service.hybrid_search, "session_factory", None)
+    monkeypatch.setattr(vacancy_service.vacancy_refresher, "snapshot", VacancySnapshot(postings))
+    return TestClient(app)
+
+
+def test_search_limit_beyond_default(client):
+    assert len(client.post("/api/vacancies/search", json={"job_title": "python"}).json()) == 20
+    response = client.post("/api/vacancies/search", json={"job_title": "python", "limit": 25})
+    assert len(response.json()) == 25
+
+
+def test_search_stream_yields_ranked_ndjson(client):
+    request = {"job_title": "python", "limit": 30}
+    response = client.post("/api/vacancies/search/stream", json=request)
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+    assert streamed == client.post("/api/vacancies/search", json=request).json()
+    assert len(streamed) == 30
@@ -0,0 +1,39 @@
+import json
+
+from backend.services.vacancy_store import VacancyStore
+
+
+def vacancy(url, title="Python Developer", source="arbeitnow"):
+    return {"title": title, "company": "Acme", "url": url, "source": source}
+
+
+def test_upsert_replaces_postings_by_source_and_url(tmp_path):
+    store = VacancyStore(tmp_path / "store.db")
+    store.upsert([vacancy("https://a"), vacancy("https://b")])
+    store.upsert([vacancy("https://a", title="Senior Python Developer")])
+
+    assert store.count() == 2
+    titles = sorted(v["title"] for v in store.get())
+    assert titles == ["Python Developer", "Senior Python Developer"]
+
+
+def test_results_are_kept_per_query(tmp_path):
+    store = VacancyStore(tmp_path / "store.db")
+    store.upsert([vacancy("https://py"), vacancy("https://go", "Go Developer")], query="Python")
+    store.upsert([vacancy("https://qa", "QA Engineer")], query="qa  engineer")
+
+    assert [v["url"] for v in store.get("python")] == ["https://py", "https://go"]
+    assert [v["url"] for v in store.get("QA Engineer")] == ["https://qa"]
+    # Unknown queries fall back to a title search over all postings
+    assert [v["url"] for v in store.get("go developer")] == ["https://go"]
+
+
+def test_scraper_imports_legacy_json_cache(tmp_path):
+    from backend.services.vacancy_scraper import VacancyScraper
+
+    legacy = tmp_path / "vacancies.json"
+    legacy.write_text(json.dumps([vacancy("https://legacy")]), encoding="utf-8")
+
+    scraper = VacancyScraper(cache_dir=tmp_path)
+    assert [v["url"] for v in scraper.get_cached_vacancies()] == ["https://legacy"]
+    assert not legacy.exists()
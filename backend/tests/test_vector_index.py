@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("faiss")
+
+from backend.services.rag_service import RAGService
+from backend.services.vector_index import DenseVectorIndex, HashingEmbedder
+
+TEXTS = [
+    "python django rest api backend developer",
+    "react typescript css frontend engineer",
+    "python pandas machine learning data scientist",
+    "kubernetes docker terraform devops engineer",
+]
+
+
+@pytest.mark.parametrize("index_type", ["hnsw", "ivf", "flat"])
+def test_dense_index_finds_nearest_text(index_type):
+    index = DenseVectorIndex(HashingEmbedder(dim=128), index_type=index_type, nlist=2, nprobe=2)
+    index.add(TEXTS, range(len(TEXTS)))
+
+    assert len(index) == len(TEXTS)
+    assert index.search_ids(["react frontend engineer"], 1) == [[1]]
+
+
+def test_dense_index_incremental_add_and_persistence(tmp_path):
+    index = DenseVectorIndex(HashingEmbedder(dim=128), index_type="hnsw", ef_search=16)
+    index.add(TEXTS[:2], [0, 1])
+    index.add(TEXTS[2:], [2, 3])
+    index.set_search_params(ef_search=32)
+    index.save(tmp_path / "dense")
+
+    restored = DenseVectorIndex.load(tmp_path / "dense")
+    assert len(restored) == len(TEXTS)
+    assert restored.ef_search == 32
+    assert restored.search_ids(["terraform devops"], 1) == [[3]]
+
+
+def test_rag_service_uses_dense_backend():
+    vacancies = [{"id": str(i), "description": text} for i, text in enumerate(TEXTS)]
+    service = RAGService(dense_index=DenseVectorIndex(HashingEmbedder(dim=128), index_type="flat"))
+    service.load_vacancies(vacancies)
+
+    assert service.query_vacancies("machine learning pandas", top_n=1)[0]["id"] == "2"
+
+
+@pytest.mark.parametrize("index_type", ["hnsw", "flat"])
+def test_rag_service_dense_backend_handles_churn(index_type):
+    service = RAGService(
+        dense_index=DenseVectorIndex(HashingEmbedder(dim=128), index_type=index_type),
+        merge_ratio=0.5
+    )
+    service.load_vacancies([{"id": str(i), "description": text} for i, text in enumerate(TEXTS)])
+
+    for round_number in range(20):
+        service.add_vacancies([{"id": "0", "description": f"{TEXTS[0]} round {round_number}"}])
+
+    assert [v["id"] for v in service.query_vacancies("python django backend", top_n=4)][0] == "0"
+    assert len(service.query_vacancies("engineer", top_n=10)) == len(TEXTS)
+    # Replaced vectors are deleted, or the index is rebuilt before they pile up
+    assert len(service.dense_index) <= 2 * len(TEXTS)
@@ -0,0 +1,157 @@
+"""
+Near-duplicate text detection with MinHash signatures and LSH banding.
+
+This module lets the scraper collapse the same posting published on several
+job boards, or re-posted with small edits, before it is scored and cached.
+"""
+
+import re
+import zlib
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+
+# Mersenne prime used by the universal hash family; fits 32-bit shingle hashes
+# multiplied by coefficients below it into uint64 without overflow
+_PRIME = (1 << 31) - 1
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = 3) -> List[str]:
+    """
+    Split text into overlapping word n-grams.
+
+    HTML tags are dropped and words are lowercased. Texts shorter than
+    size words form a single shingle.
+    """
+    tokens = _TOKEN_PATTERN.findall(_TAG_PATTERN.sub(" ", text or "").lower())
+    if len(tokens) <= size:
+        return [" ".join(tokens)] if tokens else []
+    return [" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+
+
+class NearDuplicateIndex:
+    """
+    Incremental MinHash + LSH index that flags near-duplicate texts.
+
+    Each text gets a MinHash signature of num_perm hash minima. The signature
+    is cut into bands; texts sharing any band become candidates, and a
+    candidate is a duplicate when the share of equal signature positions (an
+    estimate of the shingle Jaccard similarity) reaches threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Estimated Jaccard similarity at which texts are duplicates
+            num_perm: Number of hash functions in a signature
+            bands: Number of LSH bands; must divide num_perm
+            shingle_size: Words per shingle
+            seed: Seed of the hash function coefficients
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Return the MinHash signature of text, or None when it has no words."""
+        text_shingles = shingles(text, self.shingle_size)
+        if not text_shingles:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in set(text_shingles)),
+            dtype=np.uint64
+        )
+        # One row per hash function, one column per shingle; keep the row minima
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def find(self, signature: np.ndarray) -> Optional[Hashable]:
+        """Return the key of an indexed near-duplicate of the signature, if any."""
+        seen = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            for key in self._buckets[band].get(band_key, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                if np.mean(self._signatures[key] == signature) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """
+        Index text under key unless it near-duplicates an indexed text.
+
+        A key that is already indexed is re-indexed with the new text.
+
+        Args:
+            key: Identity of the text
+            text: Text to index
+
+        Returns:
+            Key of the indexed near-duplicate (text is then not indexed), or
+            None when text was added or has no words
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return None
+        duplicate = self.find(signature)
+        if duplicate is not None:
+            return duplicate
+
+        # Drop the old bands, or they would keep pointing at the replaced signature
+        self.remove(key)
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        return None
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Drop the text indexed under key.
+
+        Args:
+            key: Identity of the text
+
+        Returns:
+            True if key was indexed
+        """
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return False
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band][band_key]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band][band_key]
+        return True
@@ -0,0 +1,116 @@
+"""
+Persistent cache of parsed resumes.
+
+This module stores extracted resume text, skills and experience keyed by the
+SHA-256 of the file content, so an unchanged resume is never parsed twice.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from backend.utils.resume_parser import analyze_resume_stream
+
+
+def file_digest(file_path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResumeCache:
+    """
+    Two-level cache of parsed resumes.
+
+    A file's (mtime, size) is checked first; only when it changed is the file
+    re-hashed. Parsed results live in memory and as one JSON file per content
+    hash on disk, so they survive restarts.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached results (defaults to data/resume_cache)
+        """
+        self.cache_dir = cache_dir or Path(__file__).parent.parent.parent / "data" / "resume_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+        self._results: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _digest(self, file_path: str) -> str:
+        """Return the content hash, skipping the read when mtime and size are unchanged."""
+        stat = os.stat(file_path)
+        known = self._digests.get(file_path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        digest = file_digest(file_path)
+        self._digests[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def _load(self, digest: str) -> Optional[Dict]:
+        """Load a cached entry from memory or disk."""
+        entry = self._results.get(digest)
+        if entry is not None:
+            return entry
+        entry_file = self.cache_dir / f"{digest}.json"
+        try:
+            with open(entry_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (IOError, json.JSONDecodeError):
+            return None
+        self._results[digest] = entry
+        return entry
+
+    def _save(self, digest: str, entry: Dict) -> None:
+        """Write an entry atomically (temporary file + rename)."""
+        self._results[digest] = entry
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_dir / f"{digest}.json")
+        except IOError as e:
+            print(f"Error writing resume cache: {e}")
+
+    def get_text(self, file_path: str) -> Optional[str]:
+        """Return the cached extracted text of a resume, if it was parsed before."""
+        entry = self._load(self._digest(str(file_path)))
+        return entry["text"] if entry is not None else None
+
+    def analyze(self, file_path) -> Dict:
+        """
+        Analyze a resume, reusing the cached result when the content is unchanged.
+
+        Args:
+            file_path: Path to a PDF or DOCX resume
+
+        Returns:
+            dict: Same structure as resume_parser.analyze_resume
+        """
+        file_path = str(file_path)
+        with self._lock:
+            digest = self._digest(file_path)
+            entry = self._load(digest)
+            if entry is not None:
+                self.hits += 1
+                return dict(entry["analysis"])
+            self.misses += 1
+
+        analysis, text = analyze_resume_stream(file_path)
+        # Extraction errors are not cached so a fixed environment is picked up
+        if "error" not in analysis:
+            with self._lock:
+                self._save(digest, {"text": text, "analysis": analysis})
+        return analysis
@@ -4,9 +4,13 @@ Resume parser module for extracting skills and information from resumes.
 This module provides functions to parse PDF and DOCX files and extract relevant information.
 """
 
+import os
 import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
 
+from backend.utils.skill_matcher import find_skills
+
 try:
     import PyPDF2
 except ImportError:
@@ -18,20 +22,43 @@ except ImportError:
     Document = None  # type: ignore
 
 
-def extract_text_from_pdf(file_path):
+# Caps for resume text extraction; large portfolio PDFs stop early
+MAX_PDF_PAGES = 50
+MAX_RESUME_CHARS = 200_000
+
+
+def iter_pdf_pages(file_path, max_pages=MAX_PDF_PAGES, max_chars=MAX_RESUME_CHARS):
+    """
+    Lazily yield the text of each PDF page.
+
+    Pages are only parsed when the consumer asks for them. Iteration stops
+    after max_pages pages or once max_chars characters were yielded.
+    Errors while reading the file are raised to the caller.
+    """
+    remaining = max_chars
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_number, page in enumerate(pdf_reader.pages):
+            if max_pages is not None and page_number >= max_pages:
+                return
+            page_text = page.extract_text() or ""
+            if remaining is not None:
+                page_text = page_text[:remaining]
+                remaining -= len(page_text)
+            yield page_text
+            if remaining is not None and remaining <= 0:
+                return
+
+
+def extract_text_from_pdf(file_path, max_pages=MAX_PDF_PAGES, max_chars=MAX_RESUME_CHARS):
     """Extract text from a PDF file."""
     if PyPDF2 is None:
         return "PyPDF2 not installed. Install it with: pip install PyPDF2"
 
-    text = ""
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text()
+        return "\n".join(iter_pdf_pages(file_path, max_pages, max_chars))
     except (IOError, OSError) as e:
         return f"Error reading PDF: {str(e)}"
-    return text
 
 
 def extract_text_from_docx(file_path):
@@ -65,102 +92,7 @@ def extract_skills(text):
 
     This is a basic implementation. In production, you'd use NLP/NER models.
     """
-    # Common tech skills keywords - comprehensive list
-    common_skills = [
-        # Programming Languages
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c',
-        'ruby', 'php', 'go', 'golang', 'rust', 'swift', 'kotlin', 'scala',
-        'r', 'matlab', 'perl', 'shell', 'bash', 'powershell', 'vba',
-        'objective-c', 'dart', 'elixir', 'haskell', 'lua', 'groovy',
-        
-        # Web Frontend
-        'react', 'angular', 'vue', 'vue.js', 'svelte', 'next.js', 'nuxt.js',
-        'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'tailwind',
-        'bootstrap', 'material-ui', 'chakra ui', 'jquery', 'webpack',
-        'vite', 'babel', 'responsive design', 'ui/ux', 'figma', 'sketch',
-        
-        # Backend & Frameworks
-        'node.js', 'express', 'django', 'flask', 'fastapi', 'spring',
-        'spring boot', '.net', 'asp.net', 'laravel', 'symfony', 'rails',
-        'ruby on rails', 'gin', 'echo', 'nest.js', 'koa', 'strapi',
-        
-        # Databases
-        'sql', 'nosql', 'postgresql', 'mysql', 'mongodb', 'redis',
-        'cassandra', 'elasticsearch', 'oracle', 'sql server', 'mariadb',
-        'dynamodb', 'firebase', 'couchdb', 'neo4j', 'influxdb', 'sqlite',
-        
-        # DevOps & Cloud
-        'docker', 'kubernetes', 'k8s', 'aws', 'azure', 'gcp',
-        'google cloud', 'heroku', 'digital ocean', 'terraform', 'ansible',
-        'jenkins', 'gitlab ci', 'github actions', 'circleci', 'travis ci',
-        'ci/cd', 'devops', 'linux', 'unix', 'nginx', 'apache',
-        
-        # Data Science & ML
-        'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-        'keras', 'scikit-learn', 'pandas', 'numpy', 'scipy', 'matplotlib',
-        'seaborn', 'plotly', 'data analysis', 'data science', 'statistics',
-        'nlp', 'computer vision', 'opencv', 'spacy', 'nltk', 'transformers',
-        'bert', 'gpt', 'neural networks', 'cnn', 'rnn', 'lstm',
-        
-        # Mobile Development
-        'android', 'ios', 'react native', 'flutter', 'xamarin',
-        'ionic', 'cordova', 'swift ui', 'jetpack compose',
-        
-        # Version Control & Tools
-        'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial',
-        
-        # Testing
-        'unit testing', 'integration testing', 'pytest', 'jest', 'mocha',
-        'selenium', 'cypress', 'junit', 'testng', 'jasmine', 'karma',
-        
-        # APIs & Architecture
-        'rest api', 'restful', 'graphql', 'soap', 'grpc', 'websocket',
-        'microservices', 'monolith', 'event-driven', 'serverless',
-        'lambda', 'api gateway', 'message queue', 'rabbitmq', 'kafka',
-        
-        # Methodologies & Practices
-        'agile', 'scrum', 'kanban', 'waterfall', 'tdd', 'bdd', 'ci/cd',
-        'pair programming', 'code review', 'design patterns', 'solid',
-        
-        # Project Management & Collaboration
-        'jira', 'confluence', 'trello', 'asana', 'slack', 'teams',
-        'notion', 'monday.com',
-        
-        # Security
-        'oauth', 'jwt', 'ssl', 'tls', 'encryption', 'security',
-        'penetration testing', 'owasp',
-        
-        # Other Technologies
-        'blockchain', 'ethereum', 'solidity', 'web3', 'smart contracts',
-        'iot', 'edge computing', 'big data', 'hadoop', 'spark',
-        'etl', 'data warehouse', 'power bi', 'tableau', 'looker',
-        
-        # Soft Skills (often mentioned in resumes)
-        'communication', 'leadership', 'teamwork', 'problem solving',
-        'critical thinking', 'time management', 'adaptability',
-        
-        # HR & Recruitment Skills
-        'recruitment', 'talent acquisition', 'sourcing', 'interviewing',
-        'onboarding', 'hr management', 'applicant tracking', 'ats',
-        'linkedin recruiter', 'boolean search', 'candidate screening',
-        'employer branding', 'crm', 'zoho', 'hubspot', 'greenhouse',
-        'workday', 'bamboohr', 'performance management',
-        
-        # Business & Management
-        'project management', 'product management', 'business analysis',
-        'stakeholder management', 'budget management', 'strategic planning',
-        'kpi', 'roi', 'excel', 'powerpoint', 'word', 'google sheets',
-        'salesforce', 'erp', 'sap', 'crm systems'
-    ]
-
-    text_lower = text.lower()
-    found_skills = []
-
-    for skill in common_skills:
-        if skill in text_lower:
-            found_skills.append(skill)
-
-    return list(set(found_skills))  # Remove duplicates
+    return find_skills(text)
 
 
 def extract_experience_years(text):
@@ -184,15 +116,13 @@ def extract_experience_years(text):
     return max(years) if years else 0
 
 
-def analyze_resume(file_path):
+def analyze_resume_text(text):
     """
-    Analyze a resume file and extract key information.
+    Analyze already extracted resume text.
 
     Returns:
         dict: Dictionary containing extracted information
     """
-    text = extract_text_from_resume(file_path)
-
     if "Error" in text or "not installed" in text:
         return {
             "error": text,
@@ -210,3 +140,97 @@ def analyze_resume(file_path):
         "text_preview": text[:500] if text else "",
         "total_skills_found": len(skills)
     }
+
+
+def analyze_text_chunks(chunks):
+    """
+    Analyze resume text incrementally as chunks (e.g. PDF pages) arrive.
+
+    Skills and experience are extracted per chunk, so a skill split across
+    two chunks is not detected.
+
+    Returns:
+        tuple: (analysis dict, full text)
+    """
+    parts = []
+    skills = set()
+    experience_years = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        skills.update(extract_skills(chunk))
+        experience_years = max(experience_years, extract_experience_years(chunk))
+
+    text = "\n".join(parts)
+    return {
+        "skills": sorted(skills),
+        "experience_years": experience_years,
+        "text_preview": text[:500],
+        "total_skills_found": len(skills)
+    }, text
+
+
+def analyze_resume_stream(file_path, max_pages=MAX_PDF_PAGES, max_chars=MAX_RESUME_CHARS):
+    """
+    Analyze a resume, streaming PDF pages instead of materialising the document.
+
+    Returns:
+        tuple: (analysis dict, extracted text)
+    """
+    if Path(file_path).suffix.lower() == '.pdf' and PyPDF2 is not None:
+        try:
+            return analyze_text_chunks(iter_pdf_pages(file_path, max_pages, max_chars))
+        except (IOError, OSError) as e:
+            text = f"Error reading PDF: {str(e)}"
+            return analyze_resume_text(text), text
+
+    text = extract_text_from_resume(file_path)
+    return analyze_resume_text(text), text
+
+
+def analyze_resume(file_path):
+    """
+    Analyze a resume file and extract key information.
+
+    Returns:
+        dict: Dictionary containing extracted information
+    """
+    return analyze_resume_stream(file_path)[0]
+
+
+def _analyze_resume_record(file_path):
+    """
+    Analyze one resume for the process pool; returns (file_path, analysis, text).
+
+    Any parser error (e.g. a corrupt PDF) becomes an error analysis, so one
+    bad file does not abort a batch run.
+    """
+    try:
+        analysis, text = analyze_resume_stream(file_path)
+    except Exception as e:  # pylint: disable=broad-except
+        text = f"Error reading resume: {type(e).__name__}: {e}"
+        analysis = analyze_resume_text(text)
+    return file_path, analysis, text
+
+
+def iter_analyze_resumes(file_paths, max_workers=None, prefetch=4):
+    """
+    Analyze many resumes in parallel worker processes.
+
+    PDF parsing is CPU-bound, so each resume is parsed in a separate process.
+    At most max_workers * prefetch resumes are queued at a time, and results
+    are yielded in order of completion, not input order.
+
+    Yields:
+        tuple: (file_path, analysis dict, extracted text)
+    """
+    max_in_flight = (max_workers or os.cpu_count() or 1) * prefetch
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for file_path in file_paths:
+            pending.add(executor.submit(_analyze_resume_record, str(file_path)))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
@@ -0,0 +1,178 @@
+"""
+Skill matching engine shared by the resume parser and the vacancy scraper.
+
+The skill vocabulary is compiled once into a single trie-shaped regular
+expression, so all skills are found in one pass over the text.
+"""
+
+import re
+from typing import Dict, Iterable, List
+
+SKILL_VOCABULARY = (
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c',
+    'ruby', 'php', 'go', 'golang', 'rust', 'swift', 'kotlin', 'scala',
+    'r', 'matlab', 'perl', 'shell', 'bash', 'powershell', 'vba',
+    'objective-c', 'dart', 'elixir', 'haskell', 'lua', 'groovy',
+
+    # Web Frontend
+    'react', 'angular', 'vue', 'vue.js', 'svelte', 'next.js', 'nuxt.js',
+    'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'tailwind',
+    'bootstrap', 'material-ui', 'chakra ui', 'jquery', 'webpack',
+    'vite', 'babel', 'responsive design', 'ui/ux', 'figma', 'sketch',
+
+    # Backend & Frameworks
+    'node.js', 'express', 'django', 'flask', 'fastapi', 'spring',
+    'spring boot', '.net', 'asp.net', 'laravel', 'symfony', 'rails',
+    'ruby on rails', 'gin', 'echo', 'nest.js', 'koa', 'strapi',
+
+    # Databases
+    'sql', 'nosql', 'postgresql', 'mysql', 'mongodb', 'redis',
+    'cassandra', 'elasticsearch', 'oracle', 'sql server', 'mariadb',
+    'dynamodb', 'firebase', 'couchdb', 'neo4j', 'influxdb', 'sqlite',
+
+    # DevOps & Cloud
+    'docker', 'kubernetes', 'k8s', 'aws', 'azure', 'gcp',
+    'google cloud', 'heroku', 'digital ocean', 'terraform', 'ansible',
+    'jenkins', 'gitlab ci', 'github actions', 'circleci', 'travis ci',
+    'ci/cd', 'devops', 'linux', 'unix', 'nginx', 'apache',
+
+    # Data Science & ML
+    'machine learning', 'deep learning', 'tensorflow', 'pytorch',
+    'keras', 'scikit-learn', 'pandas', 'numpy', 'scipy', 'matplotlib',
+    'seaborn', 'plotly', 'data analysis', 'data science', 'statistics',
+    'nlp', 'computer vision', 'opencv', 'spacy', 'nltk', 'transformers',
+    'bert', 'gpt', 'neural networks', 'cnn', 'rnn', 'lstm',
+
+    # Mobile Development
+    'android', 'ios', 'react native', 'flutter', 'xamarin',
+    'ionic', 'cordova', 'swift ui', 'jetpack compose',
+
+    # Version Control & Tools
+    'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial',
+
+    # Testing
+    'unit testing', 'integration testing', 'pytest', 'jest', 'mocha',
+    'selenium', 'cypress', 'junit', 'testng', 'jasmine', 'karma',
+
+    # APIs & Architecture
+    'rest api', 'restful', 'graphql', 'soap', 'grpc', 'websocket',
+    'microservices', 'monolith', 'event-driven', 'serverless',
+    'lambda', 'api gateway', 'message queue', 'rabbitmq', 'kafka',
+
+    # Methodologies & Practices
+    'agile', 'scrum', 'kanban', 'waterfall', 'tdd', 'bdd', 'ci/cd',
+    'pair programming', 'code review', 'design patterns', 'solid',
+
+    # Project Management & Collaboration
+    'jira', 'confluence', 'trello', 'asana', 'slack', 'teams',
+    'notion', 'monday.com',
+
+    # Security
+    'oauth', 'jwt', 'ssl', 'tls', 'encryption', 'security',
+    'penetration testing', 'owasp',
+
+    # Other Technologies
+    'blockchain', 'ethereum', 'solidity', 'web3', 'smart contracts',
+    'iot', 'edge computing', 'big data', 'hadoop', 'spark',
+    'etl', 'data warehouse', 'power bi', 'tableau', 'looker',
+
+    # Soft Skills
+    'communication', 'leadership', 'teamwork', 'problem solving',
+    'critical thinking', 'time management', 'adaptability',
+
+    # HR & Recruitment Skills
+    'recruitment', 'talent acquisition', 'sourcing', 'interviewing',
+    'onboarding', 'hr management', 'applicant tracking', 'ats',
+    'linkedin recruiter', 'boolean search', 'candidate screening',
+    'employer branding', 'crm', 'zoho', 'hubspot', 'greenhouse',
+    'workday', 'bamboohr', 'performance management',
+
+    # Business & Management
+    'project management', 'product management', 'business analysis',
+    'stakeholder management', 'budget management', 'strategic planning',
+    'kpi', 'roi', 'excel', 'powerpoint', 'word', 'google sheets',
+    'salesforce', 'erp', 'sap', 'crm systems',
+)
+
+# Characters that glue a skill to its neighbours: "c" must not match inside
+# "c++", "script" or "objective-c", but "python," and "python/django" still match.
+_GLUE_CHARS = r"\w+#"
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Build a regex alternation from a character trie, preferring longer matches."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != ""
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if "" in node else pattern
+
+
+class SkillMatcher:
+    """Finds vocabulary skills in free text with word-boundary semantics."""
+
+    def __init__(self, vocabulary: Iterable[str] = SKILL_VOCABULARY):
+        """
+        Compile the vocabulary.
+
+        Args:
+            vocabulary: Skills to look for (case-insensitive)
+        """
+        self.vocabulary = tuple(dict.fromkeys(skill.lower() for skill in vocabulary))
+
+        trie: Dict[str, dict] = {}
+        for skill in self.vocabulary:
+            node = trie
+            for char in skill:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        # Zero-width lookahead reports one skill per start position, so
+        # skills that start inside a longer match are still found.
+        self._pattern = re.compile(
+            rf"(?<![{_GLUE_CHARS}])(?<!\w-)(?=({_trie_pattern(trie)})(?![{_GLUE_CHARS}]))"
+        )
+
+        # The regex keeps only the longest skill per start position; record
+        # shorter skills that are whole-word prefixes of it ("spring" in "spring boot").
+        skills = set(self.vocabulary)
+        self._prefixes: Dict[str, List[str]] = {
+            skill: [
+                skill[:end]
+                for end in range(1, len(skill))
+                if skill[:end] in skills and not re.match(rf"[{_GLUE_CHARS}]", skill[end])
+            ]
+            for skill in self.vocabulary
+        }
+
+    def find(self, text: str) -> List[str]:
+        """
+        Find all vocabulary skills mentioned in text.
+
+        Args:
+            text: Free text such as a resume or job description
+
+        Returns:
+            Sorted list of unique skills found
+        """
+        found = set()
+        for match in self._pattern.finditer(text.lower()):
+            skill = match.group(1)
+            found.add(skill)
+            found.update(self._prefixes[skill])
+        return sorted(found)
+
+
+default_matcher = SkillMatcher()
+
+
+def find_skills(text: str) -> List[str]:
+    """Find vocabulary skills in text using the shared compiled matcher."""
+    return default_matcher.find(text)
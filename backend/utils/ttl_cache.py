@@ -0,0 +1,125 @@
+"""
+In-memory TTL cache with LRU eviction and stale-while-revalidate refresh.
+
+This module provides the cache used to avoid re-fetching job boards for
+repeated searches.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    An entry younger than ``ttl`` is served as a fresh hit. An entry older
+    than ``ttl`` but younger than ``ttl + stale_ttl`` is still served, while
+    a background refresh replaces it. Older entries are treated as misses.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 300.0, stale_ttl: float = 600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry is considered fresh
+            stale_ttl: Extra seconds a stale entry may be served while it is refreshed
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        # Bumped by clear(); values loaded before a clear are not stored
+        self._generation = 0
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        # Empty results usually mean an upstream failure, so they are not cached
+        if not value:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], generation: int) -> None:
+        try:
+            self._store(key, loader(), generation)
+            with self._lock:
+                self.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Callable producing the value; used on misses and for refreshes
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry[0]
+                if age <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                if age <= self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._executor.submit(self._refresh, key, loader, self._generation)
+                    return entry[1]
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+        self._store(key, value, generation)
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries; values still being loaded are not stored either."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "refreshes": self.refreshes,
+            }
@@ -251,35 +251,29 @@ def statistics_tab():
     st.header("📈 Statistics & Analytics")
 
     try:
-        response = requests.get(f"{API_BASE_URL}/api/db/vacancies?limit=1000", timeout=10)
+        response = requests.get(
+            f"{API_BASE_URL}/api/db/vacancies/stats",
+            params={"top_companies": 5},
+            timeout=10
+        )
         if response.status_code == 200:
-            vacancies = response.json()
+            stats = response.json()
 
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                st.metric("Total Vacancies", len(vacancies))
+                st.metric("Total Vacancies", stats["total"])
 
             with col2:
-                avg_exp = sum(v.get('experience_required', 0) for v in vacancies) / len(vacancies) if vacancies else 0
-                st.metric("Avg Experience Required", f"{avg_exp:.1f} years")
+                st.metric("Avg Experience Required", f"{stats['avg_experience_required']:.1f} years")
 
             with col3:
-                salaries = [v.get('salary', 0) for v in vacancies if v.get('salary')]
-                avg_salary = sum(salaries) / len(salaries) if salaries else 0
-                st.metric("Avg Salary", f"${avg_salary:.0f}")
+                st.metric("Avg Salary", f"${stats['avg_salary'] or 0:.0f}")
 
             # Топ компанії
             st.subheader("Top Companies")
-            companies = {}
-            for v in vacancies:
-                company = v.get('company', 'Unknown')
-                companies[company] = companies.get(company, 0) + 1
-
-            sorted_companies = sorted(companies.items(), key=lambda x: x[1], reverse=True)[:5]
-            for company, count in sorted_companies:
-                st.write(f"- **{company}**: {count} vacancies")
-
+            for item in stats["top_companies"]:
+                st.write(f"- **{item['company'] or 'Unknown'}**: {item['count']} vacancies")
         else:
             st.error("Failed to fetch statistics")
     except requests.exceptions.RequestException as e: